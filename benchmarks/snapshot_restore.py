@@ -0,0 +1,101 @@
+"""Compare IDF text parsing with binary snapshot restore.
+
+Usage:
+    python benchmarks/snapshot_restore.py [model.idf] [--zones N] [--repeat R]
+
+Without a model path, a synthetic model with N zones (one detailed wall per
+zone) is generated in a temporary directory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from idfkit import load_idf, new_document, write_idf
+
+from idfkit_mcp.model_cache import file_digest
+from idfkit_mcp.snapshot import read_snapshot, write_snapshot
+
+
+def _synthetic_model(path: Path, zones: int) -> None:
+    doc = new_document()
+    for i in range(zones):
+        doc.add("Zone", f"Zone {i}", x_origin=float(i), validate=False)
+        doc.add(
+            "BuildingSurface:Detailed",
+            f"Zone {i} Wall",
+            surface_type="Wall",
+            construction_name="Exterior Wall",
+            zone_name=f"Zone {i}",
+            outside_boundary_condition="Outdoors",
+            sun_exposure="SunExposed",
+            wind_exposure="WindExposed",
+            vertex_1_x_coordinate=0.0,
+            vertex_1_y_coordinate=0.0,
+            vertex_1_z_coordinate=3.0,
+            vertex_2_x_coordinate=0.0,
+            vertex_2_y_coordinate=0.0,
+            vertex_2_z_coordinate=0.0,
+            vertex_3_x_coordinate=5.0,
+            vertex_3_y_coordinate=0.0,
+            vertex_3_z_coordinate=0.0,
+            vertex_4_x_coordinate=5.0,
+            vertex_4_y_coordinate=0.0,
+            vertex_4_z_coordinate=3.0,
+            validate=False,
+        )
+    write_idf(doc, path)
+
+
+def _time(func: Callable[[], Any], repeat: int) -> float:
+    samples: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("model", nargs="?", type=Path, help="IDF file to benchmark.")
+    parser.add_argument("--zones", type=int, default=10_000, help="Zones in the synthetic model (default 10000).")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the median is reported.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path: Path = args.model or Path(tmp) / "synthetic.idf"
+        if args.model is None:
+            _synthetic_model(path, args.zones)
+
+        doc = load_idf(str(path))
+        digest = file_digest(path)
+        buf = io.BytesIO()
+        write_snapshot(doc, buf, digest)
+        snapshot = buf.getvalue()
+        source_size = path.stat().st_size
+
+        def restore() -> None:
+            read_snapshot(io.BytesIO(snapshot), source_digest=digest, filepath=path)
+
+        parse_s = _time(lambda: load_idf(str(path)), args.repeat)
+        restore_s = _time(restore, args.repeat)
+        write_s = _time(lambda: write_snapshot(doc, io.BytesIO(), digest), args.repeat)
+
+    print(f"objects:          {len(doc)}")
+    print(f"IDF size:         {source_size} bytes")
+    print(f"snapshot size:    {len(snapshot)} bytes")
+    print(f"text parse:       {parse_s * 1000:9.1f} ms")
+    print(f"snapshot restore: {restore_s * 1000:9.1f} ms  ({restore_s / parse_s:.0%} of parse)")
+    print(f"snapshot write:   {write_s * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
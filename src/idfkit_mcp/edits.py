@@ -0,0 +1,97 @@
+"""Bulk document edits shared by the write tools and the edit journal."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from idfkit.objects import IDFCollection
+
+if TYPE_CHECKING:
+    from idfkit.document import IDFDocument
+    from idfkit.objects import IDFObject
+
+# Below this many objects per type, removing one by one is cheaper than a rebuild.
+_BULK_REMOVE_MIN = 16
+
+
+def add_objects(doc: IDFDocument, objects: list[IDFObject]) -> None:
+    """Attach existing objects, e.g. previously removed ones, to the end of their collections.
+
+    Raises:
+        DuplicateObjectError: If a name is already taken; earlier objects stay added.
+    """
+    schedule = None
+    for obj in objects:
+        doc.addidfobject(obj)
+        if obj.obj_type.upper().startswith("SCHEDULE"):
+            schedule = obj
+    if schedule is not None:
+        # addidfobject keeps the document's schedule lookup cache; removing and
+        # re-adding the last added schedule resets it without moving anything.
+        doc.removeidfobject(schedule)
+        doc.addidfobject(schedule)
+
+
+def remove_objects(doc: IDFDocument, objects: list[IDFObject]) -> None:
+    """Remove ``objects`` from ``doc`` with one rebuild per affected collection.
+
+    ``removeidfobject`` searches the collection list for each object, which
+    is quadratic for large batches. Instead the collection is replaced by a
+    new one holding the survivors in their original order.
+
+    Unlike ``removeidfobject``, references from surviving objects to a
+    removed name stay in the reference graph: their fields still hold the
+    name, so they show up as dangling and link up again if an object of
+    that name is added back (for example by undo).
+    """
+    graph = doc.references
+    doomed_ids = {id(obj) for obj in objects}
+    incoming = [
+        (ref, field_name)
+        for obj in objects
+        if obj.name
+        for ref, field_name in graph.get_referencing_with_fields(obj.name)
+        if id(ref) not in doomed_ids
+    ]
+    by_type: dict[str, list[IDFObject]] = {}
+    for obj in objects:
+        by_type.setdefault(obj.obj_type, []).append(obj)
+    for obj_type, doomed in by_type.items():
+        if len(doomed) < _BULK_REMOVE_MIN:
+            for obj in doomed:
+                doc.removeidfobject(obj)
+        else:
+            _rebuild_without(doc, obj_type, doomed, doomed_ids)
+    for ref, field_name in incoming:
+        value = ref.data.get(field_name)
+        if isinstance(value, str) and value.strip():
+            graph.update_reference(ref, field_name, None, value)
+
+
+def set_fields(obj: IDFObject, values: dict[str, Any]) -> dict[str, Any]:
+    """Set data fields on ``obj``, keyed by Python field name, and return their previous values.
+
+    A ``None`` value unsets the field, so passing back the returned values
+    restores the object exactly.
+    """
+    before = {key: obj.data.get(key) for key in values}
+    for key, value in values.items():
+        setattr(obj, key, value)
+        if value is None:
+            # The field was unset before the edit; setattr has already unlinked any reference.
+            obj.data.pop(key, None)
+    return before
+
+
+def _rebuild_without(doc: IDFDocument, obj_type: str, doomed: list[IDFObject], doomed_ids: set[int]) -> None:
+    survivors = IDFCollection(obj_type)
+    for obj in doc[obj_type]:
+        if id(obj) not in doomed_ids:
+            survivors.add(obj)
+    doc.collections[obj_type] = survivors
+    for obj in doomed:
+        doc.references.unregister(obj)
+    if obj_type.upper().startswith("SCHEDULE"):
+        # Only removeidfobject resets the document's schedule lookup cache.
+        # The object is already detached, so this just clears bookkeeping.
+        doc.removeidfobject(doomed[0])
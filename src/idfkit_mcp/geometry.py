@@ -0,0 +1,367 @@
+"""Surface vertex geometry: bulk transforms and cached zone metrics.
+
+A move, rotation, mirror, or scale is composed into one affine matrix and
+applied to every vertex of the selected surfaces in a single pass, instead
+of one field update per coordinate. Zone floor area, volume, and
+window-to-wall ratio are computed from the same vertices and cached per
+zone by [ZoneGeometryIndex][idfkit_mcp.geometry.ZoneGeometryIndex].
+
+Vertices are read from whichever layout the document holds:
+``vertex_1_x_coordinate`` fields (built programmatically or from epJSON
+written by idfkit), ``vertex_x_coordinate`` / ``vertex_x_coordinate_2``
+fields (parsed from IDF), or a ``vertices`` list (epJSON written by
+EnergyPlus).
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, cast
+
+from idfkit.geometry import VERTEX_SURFACE_TYPES
+
+from idfkit_mcp.indexes import ModelIndex
+
+if TYPE_CHECKING:
+    from idfkit.document import IDFDocument
+    from idfkit.objects import IDFObject
+
+# Three rows of (x, y, z, offset): p' = M[:, :3] @ p + M[:, 3].
+Matrix = tuple[tuple[float, float, float, float], ...]
+
+_AXES = ("x", "y", "z")
+
+# Rounding keeps a quarter turn from leaving values like 6.1e-17 in the file.
+_DIGITS = 10
+
+_LIST_KEYS = ("vertex_x_coordinate", "vertex_y_coordinate", "vertex_z_coordinate")
+
+# The x field of one vertex, in either flat layout.
+_X_FIELD = re.compile(r"vertex_(?:\d+_)?x_coordinate(?:_\d+)?")
+
+_SURFACE = "BUILDINGSURFACE:DETAILED"
+_FENESTRATION = "FENESTRATIONSURFACE:DETAILED"
+_GLAZED = {"WINDOW", "GLASSDOOR"}
+
+Point = tuple[float, float, float]
+
+
+def affine_matrix(
+    translate: Sequence[float] | None = None,
+    rotate: float = 0.0,
+    scale: float | Sequence[float] | None = None,
+    mirror: str | None = None,
+    anchor: Sequence[float] | None = None,
+) -> Matrix:
+    """Compose a transform that mirrors, scales, and rotates about ``anchor``, then translates.
+
+    Args:
+        translate: Offset (dx, dy, dz) applied last.
+        rotate: Rotation about the vertical axis through ``anchor``, in degrees counter-clockwise.
+        scale: Uniform factor or per-axis factors (sx, sy, sz).
+        mirror: Axis whose coordinates are reflected through ``anchor``: "x", "y", or "z".
+        anchor: Fixed point of the mirror, scale, and rotation (default: the origin).
+
+    Raises:
+        ValueError: If a vector does not have three components, a scale
+            factor is zero, or ``mirror`` is not an axis.
+    """
+    ax, ay, az = _vector(anchor, "anchor") if anchor is not None else (0.0, 0.0, 0.0)
+    dx, dy, dz = _vector(translate, "translate") if translate is not None else (0.0, 0.0, 0.0)
+    if scale is None:
+        factors = [1.0, 1.0, 1.0]
+    elif isinstance(scale, (int, float)):
+        factors = [float(scale)] * 3
+    else:
+        factors = list(_vector(scale, "scale"))
+    if 0.0 in factors:
+        msg = "Scale factors must be non-zero."
+        raise ValueError(msg)
+    if mirror is not None:
+        if mirror.lower() not in _AXES:
+            msg = f"mirror must be one of {', '.join(_AXES)}, not '{mirror}'."
+            raise ValueError(msg)
+        factors[_AXES.index(mirror.lower())] *= -1.0
+    sx, sy, sz = factors
+
+    cos, sin = math.cos(math.radians(rotate)), math.sin(math.radians(rotate))
+    linear = ((cos * sx, -sin * sy, 0.0), (sin * sx, cos * sy, 0.0), (0.0, 0.0, sz))
+    # p' = L (p - a) + a + t
+    return tuple(
+        (*row, a + t - (row[0] * ax + row[1] * ay + row[2] * az))
+        for row, a, t in zip(linear, (ax, ay, az), (dx, dy, dz), strict=True)
+    )  # type: ignore[return-value]
+
+
+def is_mirroring(matrix: Matrix) -> bool:
+    """Whether ``matrix`` reverses handedness, which flips surface normals."""
+    (a, b, c, _), (d, e, f, _), (g, h, i, _) = matrix
+    return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g) < 0
+
+
+def vertex_surfaces(doc: IDFDocument, zones: Sequence[str] | None = None) -> list[IDFObject]:
+    """Return the surfaces with vertex geometry, optionally only those of ``zones``.
+
+    A zone's surfaces are its ``BuildingSurface:Detailed`` objects and the
+    windows and zone shading attached to them.
+
+    Raises:
+        ValueError: If a zone is not in the model.
+    """
+    if zones is None:
+        return [obj for obj_type in VERTEX_SURFACE_TYPES if obj_type in doc for obj in doc[obj_type]]
+
+    missing = [zone for zone in zones if "Zone" not in doc or doc["Zone"].get(zone) is None]
+    if missing:
+        msg = f"Zone(s) not found: {', '.join(missing)}."
+        raise ValueError(msg)
+    wanted = {zone.upper() for zone in zones}
+    surfaces = [s for s in _objects(doc, "BuildingSurface:Detailed") if _upper(s, "zone_name") in wanted]
+    hosts = {s.name.upper() for s in surfaces}
+    surfaces += [
+        s for s in _objects(doc, "FenestrationSurface:Detailed") if _upper(s, "building_surface_name") in hosts
+    ]
+    surfaces += [s for s in _objects(doc, "Shading:Zone:Detailed") if _upper(s, "base_surface_name") in hosts]
+    return surfaces
+
+
+def transform_surfaces(
+    surfaces: Sequence[IDFObject], matrix: Matrix
+) -> tuple[list[tuple[IDFObject, dict[str, Any]]], list[IDFObject]]:
+    """Apply ``matrix`` to every vertex of ``surfaces`` in place.
+
+    When the transform mirrors, each vertex loop is reversed after its
+    first vertex so surfaces keep facing outward.
+
+    Returns:
+        Each changed surface with its field values before the change, and
+        the surfaces skipped because they have no vertices or a coordinate
+        is missing or not numeric.
+    """
+    changed: list[tuple[IDFObject, dict[str, Any]]] = []
+    skipped: list[IDFObject] = []
+    for obj in surfaces:
+        values = transformed_fields(obj, matrix)
+        if values is None:
+            skipped.append(obj)
+            continue
+        old_values = {key: obj.data.get(key) for key in values}
+        for key, value in values.items():
+            setattr(obj, key, value)
+        changed.append((obj, old_values))
+    return changed, skipped
+
+
+def transformed_fields(obj: IDFObject, matrix: Matrix) -> dict[str, Any] | None:
+    """Return the vertex field values of ``obj`` moved by ``matrix``, without changing it.
+
+    Returns None if ``obj`` has no vertices or a coordinate is not numeric.
+    """
+    slots = _vertex_slots(obj)
+    points = _points(obj, slots)
+    if points is None:
+        return None
+    (a, b, c, d), (e, f, g, h), (i, j, k, m) = matrix
+    moved = [
+        (
+            round(a * x + b * y + c * z + d, _DIGITS) + 0.0,
+            round(e * x + f * y + g * z + h, _DIGITS) + 0.0,
+            round(i * x + j * y + k * z + m, _DIGITS) + 0.0,
+        )
+        for x, y, z in points
+    ]
+    if is_mirroring(matrix):
+        moved = [moved[0], *reversed(moved[1:])]
+    if slots is None:
+        return {"vertices": [dict(zip(_LIST_KEYS, point, strict=True)) for point in moved]}
+    return {
+        key: value for keys, point in zip(slots, moved, strict=True) for key, value in zip(keys, point, strict=True)
+    }
+
+
+def vertex_count(values: Mapping[str, Any]) -> int:
+    """Return how many vertices the fields in ``values`` hold; other fields are ignored."""
+    vertices = values.get("vertices")
+    if isinstance(vertices, list):
+        return len(cast("list[Any]", vertices))
+    return sum(1 for key in values if _X_FIELD.fullmatch(key))
+
+
+def surface_points(obj: IDFObject) -> list[Point] | None:
+    """Return the vertices of ``obj``, or None if it has none or one is not numeric."""
+    return _points(obj, _vertex_slots(obj))
+
+
+def polygon_area(points: Sequence[Point]) -> float:
+    """Area of a planar polygon."""
+    nx, ny, nz = _newell(points)
+    return math.sqrt(nx * nx + ny * ny + nz * nz) / 2
+
+
+class ZoneGeometryIndex(ModelIndex):
+    """Floor area, volume, and window-to-wall ratio of each zone, computed on first use.
+
+    A zone's metrics are dropped when one of its surfaces, a window on one
+    of them, or the zone itself is added, removed, renamed, or updated;
+    other zones keep theirs.
+    """
+
+    def __init__(self, doc: IDFDocument) -> None:
+        super().__init__(doc)
+        self._metrics: dict[str, dict[str, Any]] = {}
+        self._zone_of: dict[int, str] = {}
+        self.computed = 0
+
+    def metrics(self, zone: IDFObject) -> dict[str, Any]:
+        """Return the geometry metrics of ``zone``."""
+        key = zone.name.upper()
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = self._metrics[key] = self._compute(zone.name, key)
+            self.computed += 1
+        return metrics
+
+    def object_added(self, obj: IDFObject) -> None:
+        self._invalidate(obj)
+
+    def object_removed(self, obj: IDFObject) -> None:
+        self._invalidate(obj)
+
+    def object_renamed(self, obj: IDFObject, old_name: str, referencing: Iterable[IDFObject]) -> None:
+        if obj.obj_type.upper() == "ZONE":
+            self._metrics.pop(old_name.upper(), None)
+        self._invalidate(obj)
+        for other in referencing:
+            self._invalidate(other)
+
+    def object_updated(self, obj: IDFObject, old_values: dict[str, Any]) -> None:
+        self._invalidate(obj)
+
+    def _invalidate(self, obj: IDFObject) -> None:
+        # Both the zone the object counted towards and the one it belongs to now.
+        previous = self._zone_of.pop(id(obj), None)
+        if previous is not None:
+            self._metrics.pop(previous, None)
+        current = self._current_zone(obj)
+        if current:
+            self._metrics.pop(current, None)
+
+    def _current_zone(self, obj: IDFObject) -> str | None:
+        obj_type = obj.obj_type.upper()
+        if obj_type == "ZONE":
+            return obj.name.upper()
+        if obj_type == _SURFACE:
+            return _upper(obj, "zone_name")
+        if obj_type == _FENESTRATION and "BuildingSurface:Detailed" in self.doc:
+            host = self.doc["BuildingSurface:Detailed"].get(obj.data.get("building_surface_name") or "")
+            return _upper(host, "zone_name") if host is not None else None
+        return None
+
+    def _compute(self, zone_name: str, key: str) -> dict[str, Any]:
+        areas = {"floor": 0.0, "roof_ceiling": 0.0, "exterior_wall": 0.0, "window": 0.0}
+        volume = 0.0
+        surfaces = [
+            s
+            for s in self.doc.get_referencing(zone_name)
+            if s.obj_type.upper() == _SURFACE and _upper(s, "zone_name") == key
+        ]
+        for surface in surfaces:
+            self._zone_of[id(surface)] = key
+            points = surface_points(surface)
+            if points is None:
+                continue
+            normal = _newell(points)
+            # Divergence theorem: each outward-facing face adds (p . N) / 6 for any vertex p.
+            volume += sum(p * n for p, n in zip(points[0], normal, strict=True)) / 6
+            area = math.sqrt(sum(n * n for n in normal)) / 2
+            surface_type = _upper(surface, "surface_type")
+            if surface_type == "FLOOR":
+                areas["floor"] += area
+            elif surface_type in ("ROOF", "CEILING"):
+                areas["roof_ceiling"] += area
+            elif surface_type == "WALL" and _upper(surface, "outside_boundary_condition") == "OUTDOORS":
+                areas["exterior_wall"] += area
+                areas["window"] += self._glazed_area(surface)
+        wall = areas["exterior_wall"]
+        return {
+            "name": zone_name,
+            "surfaces": len(surfaces),
+            "floor_area": round(areas["floor"], 4),
+            "volume": round(abs(volume), 4),
+            "roof_ceiling_area": round(areas["roof_ceiling"], 4),
+            "exterior_wall_area": round(wall, 4),
+            "window_area": round(areas["window"], 4),
+            "window_to_wall_ratio": round(areas["window"] / wall, 4) if wall else 0.0,
+        }
+
+    def _glazed_area(self, wall: IDFObject) -> float:
+        area = 0.0
+        host = wall.name.upper()
+        for obj in self.doc.get_referencing(wall.name):
+            if obj.obj_type.upper() != _FENESTRATION or _upper(obj, "building_surface_name") != host:
+                continue
+            self._zone_of[id(obj)] = _upper(wall, "zone_name")
+            points = surface_points(obj)
+            if points is not None and _upper(obj, "surface_type") in _GLAZED:
+                area += polygon_area(points)
+        return area
+
+
+def _newell(points: Sequence[Point]) -> Point:
+    """Newell's normal of a polygon: outward for counter-clockwise vertices, length twice the area."""
+    nx = ny = nz = 0.0
+    for (x1, y1, z1), (x2, y2, z2) in zip(points, (*points[1:], points[0]), strict=True):
+        nx += (y1 - y2) * (z1 + z2)
+        ny += (z1 - z2) * (x1 + x2)
+        nz += (x1 - x2) * (y1 + y2)
+    return nx, ny, nz
+
+
+def _vertex_slots(obj: IDFObject) -> list[tuple[str, str, str]] | None:
+    """Return the field names holding each vertex, or None for a ``vertices`` list."""
+    data = obj.data
+    if isinstance(data.get("vertices"), list):
+        return None
+    slots: list[tuple[str, str, str]] = []
+    if "vertex_1_x_coordinate" in data:
+        while f"vertex_{len(slots) + 1}_x_coordinate" in data:
+            n = len(slots) + 1
+            slots.append((f"vertex_{n}_x_coordinate", f"vertex_{n}_y_coordinate", f"vertex_{n}_z_coordinate"))
+    elif "vertex_x_coordinate" in data:
+        slots.append(_LIST_KEYS)
+        while f"vertex_x_coordinate_{len(slots) + 1}" in data:
+            n = len(slots) + 1
+            slots.append(tuple(f"{key}_{n}" for key in _LIST_KEYS))  # type: ignore[arg-type]
+    return slots
+
+
+def _read(obj: IDFObject, slots: list[tuple[str, str, str]] | None) -> list[tuple[Any, Any, Any]]:
+    data = obj.data
+    if slots is None:
+        return [tuple(vertex.get(key) for key in _LIST_KEYS) for vertex in data["vertices"]]  # type: ignore[misc]
+    return [(data.get(x), data.get(y), data.get(z)) for x, y, z in slots]
+
+
+def _points(obj: IDFObject, slots: list[tuple[str, str, str]] | None) -> list[Point] | None:
+    try:
+        points = [(float(x), float(y), float(z)) for x, y, z in _read(obj, slots)]
+    except (TypeError, ValueError):
+        return None
+    return points or None
+
+
+def _objects(doc: IDFDocument, obj_type: str) -> list[IDFObject]:
+    return list(doc[obj_type]) if obj_type in doc else []
+
+
+def _upper(obj: IDFObject | None, field_name: str) -> str:
+    return str(obj.data.get(field_name) or "").upper() if obj is not None else ""
+
+
+def _vector(values: Sequence[float], label: str) -> tuple[float, float, float]:
+    if len(values) != 3:
+        msg = f"{label} must have three components (x, y, z)."
+        raise ValueError(msg)
+    return float(values[0]), float(values[1]), float(values[2])
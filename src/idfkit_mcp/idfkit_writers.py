@@ -0,0 +1,42 @@
+"""The idfkit writer internals that incremental saving is built on.
+
+idfkit only formats whole documents: ``write_idf`` and ``write_epjson`` have
+no public per-object entry point. [saving][idfkit_mcp.saving] needs one to
+re-serialize just the changed objects, so it goes through the private
+helpers wrapped here. This is the only module that touches them.
+
+The helpers were checked against the idfkit releases in
+``SUPPORTED_IDFKIT``, and the dependency in ``pyproject.toml`` is pinned to
+that series. The tests compare the output built from these helpers with
+``write_idf`` / ``write_epjson``, so an idfkit change that breaks them fails
+there first.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from idfkit.writers import EpJSONWriter, IDFWriter, _resolve_version_identifier  # pyright: ignore[reportPrivateUsage]
+
+if TYPE_CHECKING:
+    from idfkit.document import IDFDocument
+    from idfkit.objects import IDFObject
+
+# idfkit major and minor version the helpers below were checked against.
+SUPPORTED_IDFKIT = (0, 3)
+
+
+def version_identifier(doc: IDFDocument) -> str:
+    """Return the version string the writers put in the ``Version`` object."""
+    return _resolve_version_identifier(doc)
+
+
+def idf_formatter(doc: IDFDocument) -> Callable[[IDFObject], str]:
+    """Return a function formatting one object of ``doc`` as ``write_idf`` does."""
+    return IDFWriter(doc)._object_to_string  # pyright: ignore[reportPrivateUsage]
+
+
+def epjson_formatter(doc: IDFDocument) -> Callable[[IDFObject], dict[str, Any]]:
+    """Return a function converting one object of ``doc`` to its epJSON fields, as ``write_epjson`` does."""
+    return EpJSONWriter(doc)._object_to_dict  # pyright: ignore[reportPrivateUsage]
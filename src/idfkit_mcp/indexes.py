@@ -0,0 +1,754 @@
+"""Indexes over the active model, kept current by the write tools.
+
+Each index is built from the document the first time a tool asks for it
+through [ModelIndexes][idfkit_mcp.indexes.ModelIndexes]. From then on the
+write tools report every mutation (add, remove, rename, field update) and
+the index updates itself incrementally instead of rescanning the model.
+Code that mutates ``state.document`` directly, bypassing the write tools,
+must report its changes the same way.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import itertools
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from idfkit.document import IDFDocument
+    from idfkit.objects import IDFObject
+
+
+class ModelIndex:
+    """Base class for an index kept in sync with one document.
+
+    Subclasses build their initial contents in ``__init__`` and override
+    the mutation hooks they care about. Hooks run after the document has
+    been changed.
+
+    Indexes that can be rebuilt from the document alone may be dropped
+    after a large bulk change and rebuilt on next use. Subclasses that keep
+    history or other state the document does not hold set ``rebuildable``
+    to False so they always see every change.
+    """
+
+    rebuildable = True
+
+    def __init__(self, doc: IDFDocument) -> None:
+        self.doc = doc
+
+    def object_added(self, obj: IDFObject) -> None:
+        """Called after ``obj`` was added to the document."""
+
+    def object_removed(self, obj: IDFObject) -> None:
+        """Called after ``obj`` was removed from the document."""
+
+    def object_renamed(self, obj: IDFObject, old_name: str, referencing: Iterable[IDFObject]) -> None:
+        """Called after ``obj`` was renamed.
+
+        ``referencing`` holds the objects whose reference fields were
+        rewritten from ``old_name`` to the new name.
+        """
+
+    def object_updated(self, obj: IDFObject, old_values: dict[str, Any]) -> None:
+        """Called after fields of ``obj`` changed; ``old_values`` maps field names to prior values."""
+
+    def objects_renamed(
+        self, renamed: list[tuple[IDFObject, str]], rewritten: list[tuple[IDFObject, dict[str, Any]]]
+    ) -> None:
+        """Called after a bulk rename; see ``ModelIndexes.renamed_many``.
+
+        The default treats it as one rename per object plus one update per
+        rewritten referencing object.
+        """
+        for obj, old_name in renamed:
+            self.object_renamed(obj, old_name, ())
+        for obj, old_values in rewritten:
+            self.object_updated(obj, old_values)
+
+
+IndexT = TypeVar("IndexT", bound=ModelIndex)
+
+_generations = itertools.count(1)
+
+# Bulk changes smaller than this always update indexes incrementally.
+_BULK_REBUILD_MIN = 500
+
+
+class ModelIndexes:
+    """Registry of the indexes built for one document.
+
+    ``version`` increases on every reported mutation, so callers can tell
+    whether the model changed between two requests. ``token`` also changes
+    when the document itself is replaced.
+    """
+
+    def __init__(self, doc: IDFDocument) -> None:
+        self.doc = doc
+        self.version = 0
+        self._generation = next(_generations)
+        self._indexes: dict[type[ModelIndex], ModelIndex] = {}
+
+    @property
+    def token(self) -> str:
+        """Opaque model version token, unique across documents in this process."""
+        return f"{self._generation:x}.{self.version}"
+
+    def get(self, index_type: type[IndexT]) -> IndexT:
+        """Return the index of ``index_type``, building it on first use."""
+        index = self._indexes.get(index_type)
+        if index is None:
+            index = index_type(self.doc)
+            self._indexes[index_type] = index
+        return index  # type: ignore[return-value]
+
+    def added(self, obj: IDFObject) -> None:
+        """Report that ``obj`` was added."""
+        self.version += 1
+        for index in self._indexes.values():
+            index.object_added(obj)
+
+    def added_many(self, objects: list[IDFObject]) -> None:
+        """Report that ``objects`` were added in one bulk operation.
+
+        When the batch is a large share of the model, rebuildable indexes
+        are dropped and rebuilt lazily on next use, which is cheaper than
+        updating them one object at a time.
+        """
+        if not objects:
+            return
+        self.version += 1
+        self._drop_if_bulk(len(objects))
+        for index in self._indexes.values():
+            for obj in objects:
+                index.object_added(obj)
+
+    def removed_many(self, objects: list[IDFObject]) -> None:
+        """Report that ``objects`` were removed in one bulk operation; see ``added_many``."""
+        if not objects:
+            return
+        self.version += 1
+        self._drop_if_bulk(len(objects))
+        for index in self._indexes.values():
+            for obj in objects:
+                index.object_removed(obj)
+
+    def _drop_if_bulk(self, changed: int) -> None:
+        if changed < _BULK_REBUILD_MIN:
+            return
+        remaining = sum(len(collection) for collection in self.doc.collections.values())
+        if changed * 4 >= remaining:
+            self._indexes = {t: index for t, index in self._indexes.items() if not index.rebuildable}
+
+    def removed(self, obj: IDFObject) -> None:
+        """Report that ``obj`` was removed."""
+        self.version += 1
+        for index in self._indexes.values():
+            index.object_removed(obj)
+
+    def renamed(self, obj: IDFObject, old_name: str, referencing: Iterable[IDFObject] = ()) -> None:
+        """Report that ``obj`` was renamed from ``old_name``."""
+        self.version += 1
+        referencing = tuple(referencing)
+        for index in self._indexes.values():
+            index.object_renamed(obj, old_name, referencing)
+
+    def renamed_many(
+        self, renamed: list[tuple[IDFObject, str]], rewritten: list[tuple[IDFObject, dict[str, Any]]]
+    ) -> None:
+        """Report a bulk rename; see ``added_many``.
+
+        ``renamed`` pairs each object with its old name, and ``rewritten``
+        pairs each referencing object with its field values before the
+        references were rewritten.
+        """
+        if not renamed:
+            return
+        self.version += 1
+        self._drop_if_bulk(len(renamed) + len(rewritten))
+        for index in self._indexes.values():
+            index.objects_renamed(renamed, rewritten)
+
+    def updated(self, obj: IDFObject, old_values: dict[str, Any]) -> None:
+        """Report that fields of ``obj`` changed from ``old_values``."""
+        if not old_values:
+            return
+        self.version += 1
+        for index in self._indexes.values():
+            index.object_updated(obj, old_values)
+
+    def updated_many(self, changes: list[tuple[IDFObject, dict[str, Any]]]) -> None:
+        """Report field updates on many objects in one bulk operation; see ``added_many``."""
+        changes = [(obj, old_values) for obj, old_values in changes if old_values]
+        if not changes:
+            return
+        self.version += 1
+        self._drop_if_bulk(len(changes))
+        for index in self._indexes.values():
+            for obj, old_values in changes:
+                index.object_updated(obj, old_values)
+
+
+class NameIndex(ModelIndex):
+    """Case-insensitive map from object name to the objects carrying it.
+
+    Names are unique per type, so a name maps to at most one object per
+    type; objects are kept in insertion order.
+    """
+
+    def __init__(self, doc: IDFDocument) -> None:
+        super().__init__(doc)
+        self._by_name: dict[str, list[IDFObject]] = {}
+        for obj in doc.all_objects:
+            self._add(obj, obj.name)
+
+    def find(self, name: str) -> list[IDFObject]:
+        """Return every object named ``name``, across all types."""
+        return list(self._by_name.get(name.upper(), ()))
+
+    def first(self, name: str) -> IDFObject | None:
+        """Return the first object named ``name``, or None."""
+        objects = self._by_name.get(name.upper())
+        return objects[0] if objects else None
+
+    def __contains__(self, name: str) -> bool:
+        return name.upper() in self._by_name
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def upper_names(self) -> set[str]:
+        """Return the set of all object names, uppercased."""
+        return set(self._by_name)
+
+    def object_added(self, obj: IDFObject) -> None:
+        self._add(obj, obj.name)
+
+    def object_removed(self, obj: IDFObject) -> None:
+        self._discard(obj, obj.name)
+
+    def object_renamed(self, obj: IDFObject, old_name: str, referencing: Iterable[IDFObject]) -> None:
+        self._discard(obj, old_name)
+        self._add(obj, obj.name)
+
+    def _add(self, obj: IDFObject, name: str) -> None:
+        if name:
+            self._by_name.setdefault(name.upper(), []).append(obj)
+
+    def _discard(self, obj: IDFObject, name: str) -> None:
+        key = name.upper()
+        objects = self._by_name.get(key)
+        if objects is None:
+            return
+        remaining = [o for o in objects if o is not obj]
+        if remaining:
+            self._by_name[key] = remaining
+        else:
+            del self._by_name[key]
+
+
+class DanglingReferenceIndex(ModelIndex):
+    """Reference fields whose target name no object carries.
+
+    Keeps a count of the objects carrying each uppercased name and, per
+    object, its reference fields that point at a missing name. A name
+    appearing or disappearing re-checks only the objects that reference it,
+    so listing the dangling references costs time proportional to their
+    number rather than to the size of the model.
+    """
+
+    def __init__(self, doc: IDFDocument) -> None:
+        super().__init__(doc)
+        self._names: Counter[str] = Counter(obj.name.upper() for obj in doc.all_objects if obj.name)
+        self._missing: dict[int, tuple[IDFObject, list[tuple[str, str]]]] = {}
+        for obj, field_name, target in doc.references.get_dangling_references(set(self._names)):
+            self._missing.setdefault(id(obj), (obj, []))[1].append((field_name, target))
+        for _, missing in self._missing.values():
+            missing.sort()
+
+    def references(self) -> list[tuple[IDFObject, str, str]]:
+        """Return ``(source, field, missing target)`` triples, ordered by source type, name, and field."""
+        found = [(obj, field_name, target) for obj, missing in self._missing.values() for field_name, target in missing]
+        found.sort(key=lambda ref: (ref[0].obj_type.upper(), ref[0].name.upper(), ref[1]))
+        return found
+
+    def __len__(self) -> int:
+        return sum(len(missing) for _, missing in self._missing.values())
+
+    def object_added(self, obj: IDFObject) -> None:
+        self._gain(obj.name)
+        self._check(obj)
+
+    def object_removed(self, obj: IDFObject) -> None:
+        self._missing.pop(id(obj), None)
+        self._lose(obj.name)
+
+    def object_renamed(self, obj: IDFObject, old_name: str, referencing: Iterable[IDFObject]) -> None:
+        self._lose(old_name)
+        self._gain(obj.name)
+        for other in referencing:
+            self._check(other)
+
+    def object_updated(self, obj: IDFObject, old_values: dict[str, Any]) -> None:
+        self._check(obj)
+
+    def _gain(self, name: str) -> None:
+        if not name:
+            return
+        self._names[name.upper()] += 1
+        if self._names[name.upper()] == 1:
+            for ref in self.doc.get_referencing(name):
+                self._check(ref)
+
+    def _lose(self, name: str) -> None:
+        key = name.upper()
+        if not name or key not in self._names:
+            return
+        self._names[key] -= 1
+        if self._names[key] <= 0:
+            del self._names[key]
+            for ref in self.doc.get_referencing(name):
+                self._check(ref)
+
+    def _check(self, obj: IDFObject) -> None:
+        refs = self.doc.references.get_references_with_fields(obj)
+        missing = sorted((field_name, target) for target, field_name in refs if target not in self._names)
+        if missing:
+            self._missing[id(obj)] = (obj, missing)
+        else:
+            self._missing.pop(id(obj), None)
+
+
+class ReferenceListIndex(ModelIndex):
+    """Names available to each reference list (``object-list``), kept sorted.
+
+    A list's names are those of the objects whose types provide it, sorted
+    case-insensitively. Each list is built the first time it is asked for;
+    after that, adding, removing, or renaming an object of a providing type
+    inserts or removes its name in place, so prefix lookups and pages cost
+    a binary search rather than a scan and sort of the providing types.
+    """
+
+    def __init__(self, doc: IDFDocument) -> None:
+        super().__init__(doc)
+        # Sorted (uppercased name, name) keys per list, and how many objects carry each name.
+        self._keys: dict[str, list[tuple[str, str]]] = {}
+        self._counts: dict[str, Counter[str]] = {}
+        self._lists_of_type: dict[str, list[str]] = {}
+
+    def available(
+        self, list_names: Iterable[str], prefix: str = "", offset: int = 0, limit: int | None = None
+    ) -> tuple[int, list[str], dict[str, list[str]]]:
+        """Return the distinct names provided by ``list_names`` that start with ``prefix``.
+
+        Names are matched and ordered case-insensitively, then ``offset`` and
+        ``limit`` select a page.
+
+        Returns:
+            The number of matching names, the page of names, and the names
+            of the page provided by each list.
+        """
+        ranges = [(name, *self._range(name, prefix)) for name in dict.fromkeys(list_names)]
+        ranges = [r for r in ranges if r[2] < r[3]]
+        end = None if limit is None else offset + limit
+        if len(ranges) == 1:
+            list_name, keys, lo, hi = ranges[0]
+            stop = hi if end is None else min(hi, lo + end)
+            page = [name for _, name in keys[min(lo + offset, hi) : stop]]
+            return hi - lo, page, {list_name: page} if page else {}
+        # Merge the ranges lazily and stop once the page is full; the total is counted apart.
+        merged = heapq.merge(*(_entries(keys, lo, hi, name) for name, keys, lo, hi in ranges))
+        seen = 0
+        page: list[str] = []
+        by_list: dict[str, list[str]] = {}
+        previous: tuple[str, str] | None = None
+        complete = True
+        for key, list_name in merged:
+            if key != previous:
+                if end is not None and seen >= end:
+                    complete = False
+                    break
+                seen += 1
+                previous = key
+                if seen > offset:
+                    page.append(key[1])
+            if seen > offset:
+                by_list.setdefault(list_name, []).append(key[1])
+        return seen if complete else self._distinct(ranges), page, by_list
+
+    def object_added(self, obj: IDFObject) -> None:
+        self._insert(obj.obj_type, obj.name)
+
+    def object_removed(self, obj: IDFObject) -> None:
+        self._delete(obj.obj_type, obj.name)
+
+    def object_renamed(self, obj: IDFObject, old_name: str, referencing: Iterable[IDFObject]) -> None:
+        self._delete(obj.obj_type, old_name)
+        self._insert(obj.obj_type, obj.name)
+
+    def _distinct(self, ranges: list[tuple[str, list[tuple[str, str]], int, int]]) -> int:
+        """Count the distinct names in ``ranges`` without merging them.
+
+        The largest range counts in full; a name from another range counts
+        unless a range already counted provides it too.
+        """
+        ranges = sorted(ranges, key=lambda r: r[3] - r[2], reverse=True)
+        total = 0
+        counted: list[Counter[str]] = []
+        for list_name, keys, lo, hi in ranges:
+            if not counted:
+                total = hi - lo
+            else:
+                total += sum(1 for i in range(lo, hi) if not any(keys[i][1] in c for c in counted))
+            counted.append(self._counts[list_name])
+        return total
+
+    def _range(self, list_name: str, prefix: str) -> tuple[list[tuple[str, str]], int, int]:
+        keys = self._keys.get(list_name)
+        if keys is None:
+            keys = self._build(list_name)
+        if not prefix:
+            return keys, 0, len(keys)
+        upper = prefix.upper()
+        # Every key starting with the prefix sorts before the prefix with its last character bumped.
+        after = upper[:-1] + chr(ord(upper[-1]) + 1)
+        return keys, bisect.bisect_left(keys, (upper,)), bisect.bisect_left(keys, (after,))
+
+    def _build(self, list_name: str) -> list[tuple[str, str]]:
+        schema = self.doc.schema
+        if schema is None:
+            msg = "The model has no schema to resolve reference lists."
+            raise ValueError(msg)
+        counts: Counter[str] = Counter()
+        for provider in schema.get_types_providing_reference(list_name):
+            self._lists_of_type.setdefault(provider.upper(), []).append(list_name)
+            if provider in self.doc:
+                counts.update(obj.name for obj in self.doc[provider] if obj.name)
+        self._counts[list_name] = counts
+        self._keys[list_name] = sorted((name.upper(), name) for name in counts)
+        return self._keys[list_name]
+
+    def _insert(self, obj_type: str, name: str) -> None:
+        if not name:
+            return
+        for list_name in self._lists_of_type.get(obj_type.upper(), ()):
+            counts = self._counts[list_name]
+            counts[name] += 1
+            if counts[name] == 1:
+                bisect.insort(self._keys[list_name], (name.upper(), name))
+
+    def _delete(self, obj_type: str, name: str) -> None:
+        if not name:
+            return
+        for list_name in self._lists_of_type.get(obj_type.upper(), ()):
+            counts = self._counts[list_name]
+            if counts[name] > 1:
+                counts[name] -= 1
+                continue
+            counts.pop(name, None)
+            keys = self._keys[list_name]
+            i = bisect.bisect_left(keys, (name.upper(), name))
+            if i < len(keys) and keys[i] == (name.upper(), name):
+                del keys[i]
+
+
+def _entries(keys: list[tuple[str, str]], lo: int, hi: int, list_name: str) -> Iterator[tuple[tuple[str, str], str]]:
+    for i in range(lo, hi):
+        yield keys[i], list_name
+
+
+_NGRAM = 3
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i : i + _NGRAM] for i in range(len(text) - _NGRAM + 1)}
+
+
+class TokenIndex(ModelIndex):
+    """Trigram index over lowercased object names and string field values.
+
+    Every object gets a stable position in document order. Each trigram maps
+    to a sorted list of the positions whose name (or, separately, whose
+    string fields) contain it. A substring query walks the shortest posting
+    list of its trigrams in order, checks each candidate's actual text, and
+    stops as soon as ``limit`` results are found, so broad and narrow
+    queries are both cheap. Queries shorter than three characters walk the
+    objects in order instead.
+
+    Removals and edits leave stale entries in the posting lists, which the
+    substring check filters out; the lists are rebuilt once stale entries
+    outnumber live ones.
+    """
+
+    def __init__(self, doc: IDFDocument) -> None:
+        super().__init__(doc)
+        self._build(doc.all_objects)
+
+    def search(self, query: str, object_type: str | None = None, limit: int = 20) -> list[tuple[IDFObject, str]]:
+        """Return up to ``limit`` objects containing ``query``, with the matching field.
+
+        Name matches rank before field-value matches; within each group,
+        results keep document order. The field is ``"name"`` for a name match.
+        """
+        from itertools import chain, islice
+
+        query = query.lower()
+        if limit <= 0:
+            return []
+        seen: set[int] = set()
+        names = ((obj, "name") for obj in self._name_matches(query, object_type, seen))
+        fields = self._field_matches(query, object_type, seen)
+        return list(islice(chain(names, fields), limit))
+
+    def _name_matches(self, query: str, object_type: str | None, seen: set[int]) -> Iterator[IDFObject]:
+        for position in self._walk(self._name_grams, query):
+            obj = self._slots[position]
+            if obj is None or (object_type is not None and obj.obj_type != object_type):
+                continue
+            if query in self._texts[position][0]:
+                seen.add(position)
+                yield obj
+
+    def _field_matches(self, query: str, object_type: str | None, seen: set[int]) -> Iterator[tuple[IDFObject, str]]:
+        for position in self._walk(self._field_grams, query):
+            obj = self._slots[position]
+            if obj is None or position in seen or (object_type is not None and obj.obj_type != object_type):
+                continue
+            for field_name, text in self._texts[position][1]:
+                if query in text:
+                    yield obj, field_name
+                    break
+
+    def object_added(self, obj: IDFObject) -> None:
+        position = len(self._slots)
+        self._positions[id(obj)] = position
+        self._slots.append(obj)
+        self._texts.append(self._extract(obj))
+        self._post(position, set(), set())
+
+    def object_removed(self, obj: IDFObject) -> None:
+        position = self._positions.pop(id(obj), None)
+        if position is None:
+            return
+        self._slots[position] = None
+        self._stale += 1
+        self._maybe_compact()
+
+    def object_renamed(self, obj: IDFObject, old_name: str, referencing: Iterable[IDFObject]) -> None:
+        self._reindex(obj)
+        for other in referencing:
+            self._reindex(other)
+
+    def object_updated(self, obj: IDFObject, old_values: dict[str, Any]) -> None:
+        self._reindex(obj)
+
+    def _build(self, objects: Iterable[IDFObject]) -> None:
+        self._slots: list[IDFObject | None] = []
+        self._texts: list[tuple[str, tuple[tuple[str, str], ...]]] = []
+        self._positions: dict[int, int] = {}
+        self._name_grams: dict[str, list[int]] = {}
+        self._field_grams: dict[str, list[int]] = {}
+        self._stale = 0
+        for obj in objects:
+            self.object_added(obj)
+
+    def _walk(self, postings: dict[str, list[int]], query: str) -> Iterable[int]:
+        if len(query) < _NGRAM:
+            return range(len(self._slots))
+        shortest: list[int] | None = None
+        for gram in _grams(query):
+            posting = postings.get(gram)
+            if not posting:
+                return ()
+            if shortest is None or len(posting) < len(shortest):
+                shortest = posting
+        return shortest or ()
+
+    @staticmethod
+    def _extract(obj: IDFObject) -> tuple[str, tuple[tuple[str, str], ...]]:
+        fields = tuple(
+            (field_name, value.lower()) for field_name, value in obj.data.items() if isinstance(value, str) and value
+        )
+        return (obj.name or "").lower(), fields
+
+    def _post(self, position: int, old_name_grams: set[str], old_field_grams: set[str]) -> None:
+        import bisect
+
+        name, fields = self._texts[position]
+        field_grams: set[str] = set()
+        for _, text in fields:
+            field_grams |= _grams(text)
+        for postings, grams in (
+            (self._name_grams, _grams(name) - old_name_grams),
+            (self._field_grams, field_grams - old_field_grams),
+        ):
+            for gram in grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    postings[gram] = [position]
+                elif posting[-1] < position:
+                    posting.append(position)
+                else:
+                    i = bisect.bisect_left(posting, position)
+                    if i == len(posting) or posting[i] != position:
+                        posting.insert(i, position)
+
+    def _reindex(self, obj: IDFObject) -> None:
+        position = self._positions.get(id(obj))
+        if position is None:
+            return
+        old_name, old_fields = self._texts[position]
+        old_field_grams: set[str] = set()
+        for _, text in old_fields:
+            old_field_grams |= _grams(text)
+        self._texts[position] = self._extract(obj)
+        self._post(position, _grams(old_name), old_field_grams)
+        self._stale += 1
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        if self._stale > max(1024, len(self._positions)):
+            self._build([obj for obj in self._slots if obj is not None])
+
+
+def value_key(value: Any) -> Any:
+    """Normalize a field value for equality comparison.
+
+    Strings compare case-insensitively and numeric strings compare equal to
+    the number they spell, matching how EnergyPlus reads input. Lists and
+    dicts (epJSON extensible groups) have no key and return None.
+    """
+    import math
+
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            number = float(text)
+        except ValueError:
+            return text.lower()
+        return number if math.isfinite(number) else text.lower()
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+class FieldValueIndex(ModelIndex):
+    """Per-type equality indexes on individual fields.
+
+    A column for ``(object_type, field)`` is built the first time it is
+    requested and then maintained incrementally, mapping each
+    [value_key][idfkit_mcp.indexes.value_key] to the objects holding it.
+    """
+
+    def __init__(self, doc: IDFDocument) -> None:
+        super().__init__(doc)
+        self._columns: dict[tuple[str, str], tuple[dict[Any, dict[int, IDFObject]], dict[int, Any]]] = {}
+        self._fields_by_type: dict[str, list[str]] = {}
+
+    def has_column(self, obj_type: str, field_name: str) -> bool:
+        """Return whether a column for ``(obj_type, field_name)`` has been built."""
+        return (obj_type, field_name) in self._columns
+
+    def lookup(self, obj_type: str, field_name: str, values: Iterable[Any]) -> list[IDFObject]:
+        """Return objects of ``obj_type`` whose ``field_name`` equals any of ``values``."""
+        by_value, _ = self._column(obj_type, field_name)
+        found: dict[int, IDFObject] = {}
+        for value in values:
+            found.update(by_value.get(value_key(value), {}))
+        return list(found.values())
+
+    def object_added(self, obj: IDFObject) -> None:
+        for field_name in self._fields_by_type.get(obj.obj_type, ()):
+            self._place(obj, field_name)
+
+    def object_removed(self, obj: IDFObject) -> None:
+        for field_name in self._fields_by_type.get(obj.obj_type, ()):
+            self._remove(obj, field_name)
+
+    def object_renamed(self, obj: IDFObject, old_name: str, referencing: Iterable[IDFObject]) -> None:
+        for other in referencing:
+            self.object_added(other)
+
+    def object_updated(self, obj: IDFObject, old_values: dict[str, Any]) -> None:
+        for field_name in self._fields_by_type.get(obj.obj_type, ()):
+            if field_name in old_values:
+                self._place(obj, field_name)
+
+    def _column(self, obj_type: str, field_name: str) -> tuple[dict[Any, dict[int, IDFObject]], dict[int, Any]]:
+        column = self._columns.get((obj_type, field_name))
+        if column is None:
+            column = self._columns[obj_type, field_name] = ({}, {})
+            self._fields_by_type.setdefault(obj_type, []).append(field_name)
+            if obj_type in self.doc:
+                for obj in self.doc[obj_type]:
+                    self._place(obj, field_name)
+        return column
+
+    def _place(self, obj: IDFObject, field_name: str) -> None:
+        self._remove(obj, field_name)
+        key = value_key(obj.data.get(field_name))
+        if key is None and obj.data.get(field_name) is not None:
+            return
+        by_value, keys = self._columns[obj.obj_type, field_name]
+        by_value.setdefault(key, {})[id(obj)] = obj
+        keys[id(obj)] = key
+
+    def _remove(self, obj: IDFObject, field_name: str) -> None:
+        by_value, keys = self._columns[obj.obj_type, field_name]
+        if id(obj) not in keys:
+            return
+        key = keys.pop(id(obj))
+        holders = by_value[key]
+        holders.pop(id(obj), None)
+        if not holders:
+            del by_value[key]
+
+
+class SummaryIndex(ModelIndex):
+    """Live object counts per type and per IDD group."""
+
+    def __init__(self, doc: IDFDocument) -> None:
+        super().__init__(doc)
+        from idfkit_mcp.schema_cache import group_map
+
+        self._groups = group_map(doc.schema) if doc.schema is not None else {}
+        self.total = 0
+        self._by_group: dict[str, dict[str, int]] = {}
+        for obj_type, collection in doc.collections.items():
+            if collection:
+                self._count(obj_type, len(collection))
+
+    def type_count(self, obj_type: str) -> int:
+        """Return the number of objects of ``obj_type``."""
+        group = self._group_of(obj_type)
+        return self._by_group.get(group, {}).get(obj_type, 0)
+
+    def groups(self) -> dict[str, dict[str, int]]:
+        """Return ``{group: {object_type: count}}`` for every non-empty type."""
+        return self._by_group
+
+    def object_added(self, obj: IDFObject) -> None:
+        self._count(obj.obj_type, 1)
+
+    def object_removed(self, obj: IDFObject) -> None:
+        self._count(obj.obj_type, -1)
+
+    def _group_of(self, obj_type: str) -> str:
+        return self._groups.get(obj_type, "Ungrouped") if self._groups else "Unknown"
+
+    def _count(self, obj_type: str, delta: int) -> None:
+        group = self._group_of(obj_type)
+        types = self._by_group.setdefault(group, {})
+        count = types.get(obj_type, 0) + delta
+        self.total += delta
+        if count > 0:
+            types[obj_type] = count
+            return
+        types.pop(obj_type, None)
+        if not types:
+            del self._by_group[group]
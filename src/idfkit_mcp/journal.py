@@ -0,0 +1,235 @@
+"""Undo/redo journal of model edits.
+
+The journal is a model index that records, for every change the write tools
+report, just enough to reverse it: the object added or removed, the names
+before and after a rename, or the previous values of updated fields. Each
+write tool call becomes one entry, so an undo reverses a whole call.
+Undoing and redoing replay these entries against the live document instead
+of reloading it, so the cost depends on the size of the edits, not of the
+model.
+
+Entries are kept until their estimated size exceeds the journal budget;
+the oldest are dropped first.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from idfkit_mcp.edits import add_objects, remove_objects, set_fields
+from idfkit_mcp.indexes import ModelIndex
+from idfkit_mcp.renaming import apply_renames
+
+if TYPE_CHECKING:
+    from idfkit.document import IDFDocument
+    from idfkit.objects import IDFObject
+
+    from idfkit_mcp.indexes import ModelIndexes
+
+DEFAULT_JOURNAL_BYTES = 64 * 1024 * 1024
+
+# Rough cost of holding a reference to a live object or a small record.
+_REF_BYTES = 16
+_OBJECT_BYTES = 200
+
+_max_bytes = DEFAULT_JOURNAL_BYTES
+
+
+def configure_journal(max_bytes: int) -> None:
+    """Set the size budget of journals created from now on; 0 disables undo."""
+    global _max_bytes
+    _max_bytes = max_bytes
+
+
+class _Op(NamedTuple):
+    """One recorded change.
+
+    ``payload`` depends on ``kind``: the objects for "add" and "remove",
+    ``(obj, old_name, new_name)`` triples for "rename", and
+    ``(obj, old_values, new_values)`` for "update".
+    """
+
+    kind: str
+    payload: Any
+
+
+@dataclass
+class _Entry:
+    label: str
+    ops: list[_Op] = field(default_factory=lambda: [])
+    size: int = 0
+    position: int = 0
+
+
+class Journal(ModelIndex):
+    """Bounded undo/redo history of the edits made to one document.
+
+    ``position`` counts the entries applied since the document was loaded;
+    checkpoints record a position to return to.
+    """
+
+    rebuildable = False
+
+    def __init__(self, doc: IDFDocument) -> None:
+        super().__init__(doc)
+        self.max_bytes = _max_bytes
+        self.position = 0
+        self._undo: deque[_Entry] = deque()
+        self._redo: list[_Entry] = []
+        self._open: _Entry | None = None
+        self._bytes = 0
+        self._replaying = False
+        self._checkpoints: dict[str, int] = {}
+
+    @property
+    def size(self) -> int:
+        """Estimated bytes held by the undo and redo entries."""
+        return self._bytes
+
+    def undo_labels(self) -> list[str]:
+        """Labels of the undoable entries, most recent first."""
+        return [entry.label for entry in reversed(self._undo)]
+
+    def redo_labels(self) -> list[str]:
+        """Labels of the redoable entries, next first."""
+        return [entry.label for entry in reversed(self._redo)]
+
+    @contextmanager
+    def group(self, label: str) -> Iterator[None]:
+        """Collect every change made inside the block into one entry."""
+        if self._open is not None:
+            yield
+            return
+        self._open = _Entry(label)
+        try:
+            yield
+        finally:
+            entry, self._open = self._open, None
+            if entry.ops:
+                self._commit(entry)
+
+    def undo(self, indexes: ModelIndexes) -> str:
+        """Reverse the most recent entry and return its label."""
+        if not self._undo:
+            msg = "Nothing to undo."
+            raise ValueError(msg)
+        entry = self._undo.pop()
+        self._replay(indexes, reversed(entry.ops), undo=True)
+        self._redo.append(entry)
+        self.position = entry.position - 1
+        return entry.label
+
+    def redo(self, indexes: ModelIndexes) -> str:
+        """Re-apply the most recently undone entry and return its label."""
+        if not self._redo:
+            msg = "Nothing to redo."
+            raise ValueError(msg)
+        entry = self._redo.pop()
+        self._replay(indexes, entry.ops, undo=False)
+        self._undo.append(entry)
+        self.position = entry.position
+        return entry.label
+
+    def checkpoint(self, name: str) -> int:
+        """Record the current position under ``name`` and return it."""
+        if self.max_bytes <= 0:
+            msg = "The edit journal is disabled."
+            raise ValueError(msg)
+        self._checkpoints[name] = self.position
+        return self.position
+
+    def restore(self, name: str, indexes: ModelIndexes) -> tuple[int, int]:
+        """Undo or redo entries until the model is back at checkpoint ``name``.
+
+        Returns:
+            The number of entries undone and redone.
+        """
+        target = self._checkpoints.get(name)
+        if target is None:
+            msg = f"Unknown checkpoint '{name}'. Known: {', '.join(sorted(self._checkpoints)) or 'none'}."
+            raise ValueError(msg)
+        oldest = self._undo[0].position - 1 if self._undo else self.position
+        if target < oldest:
+            msg = f"Checkpoint '{name}' is older than the edits the journal still holds."
+            raise ValueError(msg)
+        undone = redone = 0
+        while self.position > target:
+            self.undo(indexes)
+            undone += 1
+        while self.position < target:
+            self.redo(indexes)
+            redone += 1
+        return undone, redone
+
+    def object_added(self, obj: IDFObject) -> None:
+        self._record("add", obj, _REF_BYTES)
+
+    def object_removed(self, obj: IDFObject) -> None:
+        self._record("remove", obj, _object_bytes(obj))
+
+    def object_renamed(self, obj: IDFObject, old_name: str, referencing: Iterable[IDFObject]) -> None:
+        self._record("rename", [(obj, old_name, obj.name)], _REF_BYTES + len(old_name) + len(obj.name))
+
+    def objects_renamed(
+        self, renamed: list[tuple[IDFObject, str]], rewritten: list[tuple[IDFObject, dict[str, Any]]]
+    ) -> None:
+        triples = [(obj, old_name, obj.name) for obj, old_name in renamed]
+        self._record("rename", triples, sum(_REF_BYTES + len(old) + len(new) for _, old, new in triples))
+
+    def object_updated(self, obj: IDFObject, old_values: dict[str, Any]) -> None:
+        new_values = {key: obj.data.get(key) for key in old_values}
+        size = _REF_BYTES + sum(len(str(v)) for v in (*old_values.values(), *new_values.values()))
+        self._record("update", (obj, dict(old_values), new_values), size)
+
+    def _record(self, kind: str, payload: Any, size: int) -> None:
+        if self._replaying or self.max_bytes <= 0:
+            return
+        entry = self._open if self._open is not None else _Entry("edit")
+        last = entry.ops[-1] if entry.ops else None
+        if kind in ("add", "remove") and last is not None and last.kind == kind:
+            last.payload.append(payload)
+        else:
+            entry.ops.append(_Op(kind, [payload] if kind in ("add", "remove") else payload))
+        entry.size += size
+        if entry is not self._open:
+            self._commit(entry)
+
+    def _commit(self, entry: _Entry) -> None:
+        if self._redo:
+            # A new edit abandons the undone branch and checkpoints taken on it.
+            self._bytes -= sum(e.size for e in self._redo)
+            self._redo.clear()
+            self._checkpoints = {k: v for k, v in self._checkpoints.items() if v <= self.position}
+        self.position += 1
+        entry.position = self.position
+        self._undo.append(entry)
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes and self._undo:
+            self._bytes -= self._undo.popleft().size
+
+    def _replay(self, indexes: ModelIndexes, ops: Iterable[_Op], undo: bool) -> None:
+        self._replaying = True
+        try:
+            for kind, payload in ops:
+                if kind in ("add", "remove") and (kind == "add") == undo:
+                    remove_objects(self.doc, payload)
+                    indexes.removed_many(payload)
+                elif kind in ("add", "remove"):
+                    add_objects(self.doc, payload)
+                    indexes.added_many(payload)
+                elif kind == "rename":
+                    result = apply_renames(self.doc, [(obj, old if undo else new) for obj, old, new in payload])
+                    indexes.renamed_many(result.renamed, result.rewritten)
+                else:
+                    obj, old_values, new_values = payload
+                    indexes.updated(obj, set_fields(obj, old_values if undo else new_values))
+        finally:
+            self._replaying = False
+
+
+def _object_bytes(obj: IDFObject) -> int:
+    return _OBJECT_BYTES + len(obj.name) + sum(len(str(value)) for value in obj.data.values())
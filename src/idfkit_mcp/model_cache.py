@@ -0,0 +1,239 @@
+"""Process-level cache of parsed models used by ``load_model``."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from idfkit_mcp.state import estimate_document_size
+
+if TYPE_CHECKING:
+    from idfkit.document import IDFDocument
+
+    from idfkit_mcp.snapshot import SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_CACHE_BYTES = 512 * 1024 * 1024
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def copy_document(doc: IDFDocument) -> IDFDocument:
+    """Return an independent copy of a document.
+
+    Unlike ``IDFDocument.copy``, nested list/dict field values (epJSON
+    extensible groups) are copied too, so edits never reach the source.
+    """
+    from idfkit.document import IDFDocument
+
+    new_doc = IDFDocument(version=doc.version, schema=doc.schema, filepath=doc.filepath)
+    for obj in doc.all_objects:
+        clone = obj.copy()
+        data = clone.data
+        nested = [field_name for field_name, value in data.items() if isinstance(value, (list, dict))]
+        for field_name in nested:
+            data[field_name] = copy.deepcopy(data[field_name])
+        new_doc.addidfobject(clone)
+    return new_doc
+
+
+@dataclass
+class _CacheEntry:
+    mtime_ns: int
+    size: int
+    digest: str
+    master: IDFDocument
+    nbytes: int
+    spare: Future[IDFDocument]
+
+
+class ModelCache:
+    """LRU cache of parsed documents bounded by an estimated byte budget.
+
+    Entries are keyed by resolved path and version override, and are valid
+    while the file's mtime and size are unchanged. When those differ, the
+    content hash decides: a touched but identical file is still a hit.
+
+    The cached document is never handed out. Each load receives its own
+    copy, and a spare copy is prepared in a background thread after every
+    load so the next hit returns without copying on the caller's time.
+    Budget accounting counts both the master and the spare.
+
+    With a [SnapshotStore][idfkit_mcp.snapshot.SnapshotStore], a miss first
+    tries the binary snapshot for the file's content hash, and freshly
+    parsed models are written to one, so reloads survive server restarts.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MODEL_CACHE_BYTES, snapshots: SnapshotStore | None = None) -> None:
+        self.max_bytes = max_bytes
+        self.snapshots = snapshots
+        self._entries: OrderedDict[tuple[str, tuple[int, int, int] | None], _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated bytes held by all cached entries."""
+        return sum(entry.nbytes for entry in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(
+        self,
+        path: Path,
+        version: tuple[int, int, int] | None,
+        loader: Callable[[], IDFDocument],
+    ) -> tuple[IDFDocument, str]:
+        """Return a private copy of the model and where it came from.
+
+        The source is ``"memory"`` for a cache hit, ``"snapshot"`` when it
+        was restored from an on-disk snapshot, and ``"parsed"`` otherwise.
+
+        Args:
+            path: Model file path.
+            version: Version override passed to the loader, part of the key.
+            loader: Parses ``path`` when the cache cannot serve it.
+        """
+        stat = path.stat()
+        key = (str(path.resolve()), version)
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and self._is_current(entry, path, stat.st_mtime_ns, stat.st_size):
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    self._entries.move_to_end(key)
+                self.hits += 1
+            return self._take_copy(entry), "memory"
+
+        with self._lock:
+            self.misses += 1
+            self._entries.pop(key, None)
+
+        digest = file_digest(path) if self.max_bytes > 0 or self.snapshots is not None else ""
+        doc = self.snapshots.load(digest, version, path) if self.snapshots is not None else None
+        source = "snapshot"
+        if doc is None:
+            doc = loader()
+            source = "parsed"
+
+        master = None
+        if self.max_bytes > 0:
+            master = copy_document(doc)
+            self._insert(key, stat.st_mtime_ns, stat.st_size, digest, master)
+        if self.snapshots is not None and source == "parsed":
+            if master is None:
+                self.snapshots.save(doc, digest, version)
+            else:
+                # The master is never mutated, so it can be written in the background.
+                self._background().submit(self.snapshots.save, master, digest, version)
+        return doc, source
+
+    def clear(self) -> None:
+        """Drop every cached model."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return entry count, byte usage, and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "total_bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _is_current(self, entry: _CacheEntry, path: Path, mtime_ns: int, size: int) -> bool:
+        if entry.mtime_ns == mtime_ns and entry.size == size:
+            return True
+        if entry.size != size or file_digest(path) != entry.digest:
+            return False
+        with self._lock:
+            entry.mtime_ns = mtime_ns
+        return True
+
+    def _insert(
+        self,
+        key: tuple[str, tuple[int, int, int] | None],
+        mtime_ns: int,
+        size: int,
+        digest: str,
+        master: IDFDocument,
+    ) -> None:
+        nbytes = 2 * estimate_document_size(master)
+        if nbytes > self.max_bytes:
+            logger.debug("Not caching %s: ~%d bytes exceeds the %d byte budget", key[0], nbytes, self.max_bytes)
+            return
+        entry = _CacheEntry(
+            mtime_ns=mtime_ns,
+            size=size,
+            digest=digest,
+            master=master,
+            nbytes=nbytes,
+            spare=self._submit_copy(master),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            while self.total_bytes > self.max_bytes:
+                evicted, _ = self._entries.popitem(last=False)
+                logger.debug("Evicted cached model %s", evicted[0])
+
+    def _take_copy(self, entry: _CacheEntry) -> IDFDocument:
+        with self._lock:
+            spare = entry.spare
+            entry.spare = self._submit_copy(entry.master)
+        return spare.result()
+
+    def _submit_copy(self, master: IDFDocument) -> Future[IDFDocument]:
+        return self._background().submit(copy_document, master)
+
+    def _background(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="idfkit-mcp-cache")
+        return self._executor
+
+
+_cache = ModelCache()
+
+
+def configure_model_cache(max_bytes: int, snapshot_dir: Path | None = None) -> ModelCache:
+    """Replace the process-level model cache.
+
+    Args:
+        max_bytes: In-memory budget; 0 disables the in-memory cache.
+        snapshot_dir: Directory for binary snapshots; None disables them.
+    """
+    from idfkit_mcp.snapshot import SnapshotStore
+
+    global _cache
+    snapshots = SnapshotStore(snapshot_dir) if snapshot_dir is not None else None
+    _cache = ModelCache(max_bytes=max_bytes, snapshots=snapshots)
+    return _cache
+
+
+def get_model_cache() -> ModelCache:
+    """Return the process-level model cache."""
+    return _cache
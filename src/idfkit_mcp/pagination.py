@@ -0,0 +1,49 @@
+"""Opaque cursors for paginated tool responses."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any
+
+
+class StaleCursorError(ValueError):
+    """Raised when a cursor was issued for a model version that no longer exists."""
+
+
+def encode_cursor(kind: str, offset: int, token: str, **extra: Any) -> str:
+    """Return an opaque cursor resuming a ``kind`` listing at ``offset``.
+
+    Args:
+        kind: What is being paginated, checked again on decode.
+        offset: Position of the next item.
+        token: Model version token the listing was computed against.
+        **extra: Additional listing parameters to pin, such as the object type.
+    """
+    payload = {"k": kind, "o": offset, "v": token, **extra}
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, kind: str, token: str, **extra: Any) -> int:
+    """Return the offset stored in ``cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another listing.
+        StaleCursorError: If the model changed since the cursor was issued.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        offset = int(payload["o"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        msg = "Invalid cursor."
+        raise ValueError(msg) from e
+    if payload.get("k") != kind or any(payload.get(key) != value for key, value in extra.items()) or offset < 0:
+        msg = "Cursor does not belong to this listing."
+        raise ValueError(msg)
+    if payload.get("v") != token:
+        msg = "The model changed since this cursor was issued. Start again without a cursor."
+        raise StaleCursorError(msg)
+    return offset
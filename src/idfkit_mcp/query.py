@@ -0,0 +1,289 @@
+"""Field predicates and a small planner for ``query_objects``.
+
+A query is a list of predicates over one or more object types. The planner
+looks for the most selective predicate that an index can answer directly
+(object names, the reference graph, or a per-type field index) and filters
+only those candidates. Without such a predicate it scans the requested
+types one column at a time, evaluating the cheapest predicates first so
+later ones see fewer objects.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from idfkit_mcp.indexes import FieldValueIndex, ModelIndexes, NameIndex, value_key
+from idfkit_mcp.schema_cache import field_names, is_known_field
+
+if TYPE_CHECKING:
+    from idfkit.document import IDFDocument
+    from idfkit.objects import IDFObject
+
+OPERATORS = (
+    "eq",
+    "ne",
+    "in",
+    "not_in",
+    "gt",
+    "gte",
+    "lt",
+    "lte",
+    "between",
+    "contains",
+    "references",
+    "is_empty",
+    "not_empty",
+)
+
+_NO_VALUE_OPS = frozenset({"is_empty", "not_empty"})
+_LIST_OPS = frozenset({"in", "not_in"})
+_NUMERIC_OPS = frozenset({"gt", "gte", "lt", "lte", "between"})
+
+# Evaluation order during scans: cheap and usually selective checks first.
+_SCAN_COST = {"is_empty": 0, "not_empty": 0, "eq": 1, "in": 1, "ne": 2, "not_in": 2, "contains": 3}
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """One condition on a field.
+
+    ``field`` is a field name in Python style, or ``"name"`` for the object
+    name. It may be empty for ``references``, which then matches a
+    reference from any field.
+    """
+
+    field: str
+    op: str
+    value: Any = None
+
+    @classmethod
+    def parse(cls, spec: dict[str, Any]) -> Predicate:
+        """Build a predicate from ``{"field": ..., "op": ..., "value": ...}``."""
+        from idfkit.objects import to_python_name
+
+        op = spec.get("op", "eq")
+        if op not in OPERATORS:
+            msg = f"Unknown operator '{op}'. Use one of: {', '.join(OPERATORS)}."
+            raise ValueError(msg)
+        field_name = to_python_name(spec.get("field") or "")
+        if not field_name and op != "references":
+            msg = f"Predicate with operator '{op}' needs a 'field'."
+            raise ValueError(msg)
+        value = spec.get("value")
+        if op not in _NO_VALUE_OPS and value is None:
+            msg = f"Predicate with operator '{op}' needs a 'value'."
+            raise ValueError(msg)
+        if op in _LIST_OPS and not isinstance(value, list):
+            msg = f"Operator '{op}' expects a list value."
+            raise ValueError(msg)
+        if op == "between" and not (isinstance(value, list) and len(cast("list[Any]", value)) == 2):
+            msg = "Operator 'between' expects a [low, high] list value."
+            raise ValueError(msg)
+        return cls(field=field_name, op=op, value=value)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the predicate in the form accepted by ``parse``."""
+        result: dict[str, Any] = {"field": self.field, "op": self.op}
+        if self.op not in _NO_VALUE_OPS:
+            result["value"] = self.value
+        return result
+
+    def compile(self, doc: IDFDocument) -> Callable[[IDFObject], bool]:
+        """Return a function testing one object against this predicate."""
+        if self.op == "references":
+            target = str(self.value).upper()
+            field_name = self.field
+            get_refs = doc.references.get_references_with_fields
+            return lambda obj: any(name == target and (not field_name or f == field_name) for name, f in get_refs(obj))
+        get = _getter(self.field)
+        test = _value_test(self.op, self.value)
+        return lambda obj: test(get(obj))
+
+
+@dataclass
+class QueryPlan:
+    """How a query was answered, reported back to the caller."""
+
+    strategy: str
+    candidates: int
+    index_predicate: Predicate | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        result: dict[str, Any] = {"strategy": self.strategy, "candidates": self.candidates}
+        if self.index_predicate is not None:
+            result["index_predicate"] = self.index_predicate.to_dict()
+        return result
+
+
+def run_query(
+    doc: IDFDocument,
+    indexes: ModelIndexes,
+    object_types: list[str] | None,
+    predicates: list[Predicate],
+) -> tuple[list[IDFObject], QueryPlan]:
+    """Return every object matching all ``predicates`` and the plan used.
+
+    Args:
+        doc: Document to query.
+        indexes: Index registry of ``doc``.
+        object_types: Types to search; None searches every type in the model.
+        predicates: Conditions that must all hold.
+    """
+    types = list(object_types) if object_types else list(doc.collections)
+    _check_fields(doc, object_types, predicates)
+
+    best: tuple[list[IDFObject], QueryPlan] | None = None
+    for predicate in predicates:
+        found = _index_candidates(doc, indexes, object_types, predicate)
+        if found is not None and (best is None or len(found[0]) < len(best[0])):
+            best = found
+    if best is not None:
+        candidates, plan = best
+        wanted = set(types)
+        candidates = [obj for obj in candidates if obj.obj_type in wanted]
+        rest = [p for p in predicates if p is not plan.index_predicate]
+        return _filter(doc, candidates, rest), plan
+
+    candidates = [obj for obj_type in types if obj_type in doc for obj in doc[obj_type]]
+    plan = QueryPlan(strategy="scan", candidates=len(candidates))
+    ordered = sorted(predicates, key=lambda p: _SCAN_COST.get(p.op, 4))
+    return _filter(doc, candidates, ordered), plan
+
+
+def sort_objects(objects: list[IDFObject], sort_by: str | None) -> list[IDFObject]:
+    """Sort by a field (``"-field"`` for descending), then by type and name.
+
+    Numbers sort before strings, and objects without a value for the sort
+    field always come last.
+    """
+    from idfkit.objects import to_python_name
+
+    objects = sorted(objects, key=lambda obj: (obj.obj_type, obj.name.upper()))
+    if not sort_by:
+        return objects
+    descending = sort_by.startswith("-")
+    get = _getter(to_python_name(sort_by.lstrip("-")))
+    present: list[tuple[tuple[int, Any], IDFObject]] = []
+    missing: list[IDFObject] = []
+    for obj in objects:
+        key = value_key(get(obj))
+        if key is None or key == "":
+            missing.append(obj)
+        else:
+            present.append(((0, key) if isinstance(key, float) else (1, str(key)), obj))
+    present.sort(key=lambda item: item[0], reverse=descending)
+    return [obj for _, obj in present] + missing
+
+
+def _filter(doc: IDFDocument, objects: list[IDFObject], predicates: Iterable[Predicate]) -> list[IDFObject]:
+    for predicate in predicates:
+        test = predicate.compile(doc)
+        objects = [obj for obj in objects if test(obj)]
+        if not objects:
+            break
+    return objects
+
+
+def _index_candidates(
+    doc: IDFDocument,
+    indexes: ModelIndexes,
+    object_types: list[str] | None,
+    predicate: Predicate,
+) -> tuple[list[IDFObject], QueryPlan] | None:
+    op, field_name = predicate.op, predicate.field
+    if op == "references":
+        pairs = doc.references.get_referencing_with_fields(str(predicate.value))
+        unique = {id(obj): obj for obj, f in pairs if not field_name or f == field_name}
+        objects = list(unique.values())
+        return objects, QueryPlan("reference_graph", len(objects), predicate)
+    if op not in ("eq", "in"):
+        return None
+    values = predicate.value if op == "in" else [predicate.value]
+    if field_name == "name":
+        name_index = indexes.get(NameIndex)
+        objects = [obj for value in values for obj in name_index.find(str(value))]
+        return objects, QueryPlan("name_index", len(objects), predicate)
+    # Field columns are per type; building one for every type in the model is not worth it.
+    if not object_types or any(value_key(value) is None for value in values):
+        return None
+    field_index = indexes.get(FieldValueIndex)
+    objects = [obj for obj_type in object_types for obj in field_index.lookup(obj_type, field_name, values)]
+    return objects, QueryPlan("field_index", len(objects), predicate)
+
+
+def _check_fields(doc: IDFDocument, object_types: list[str] | None, predicates: list[Predicate]) -> None:
+    """Reject field names that none of the requested types define."""
+    if not object_types or doc.schema is None:
+        return
+    known: set[str] = {"name"}
+    for obj_type in object_types:
+        names = field_names(doc.schema, obj_type)
+        if names is None:
+            msg = f"Unknown object type '{obj_type}'."
+            raise ValueError(msg)
+        known.update(names)
+    frozen = frozenset(known)
+    for predicate in predicates:
+        if predicate.field and not is_known_field(frozen, predicate.field):
+            msg = f"Unknown field '{predicate.field}' for {', '.join(object_types)}."
+            raise ValueError(msg)
+
+
+def _getter(field_name: str) -> Callable[[IDFObject], Any]:
+    if field_name == "name":
+        return lambda obj: obj.name
+    return lambda obj: obj.data.get(field_name)
+
+
+def _number(value: Any) -> float | None:
+    key = value_key(value)
+    return key if isinstance(key, float) else None
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == []
+
+
+def _value_test(op: str, value: Any) -> Callable[[Any], bool]:
+    if op == "is_empty":
+        return _is_empty
+    if op == "not_empty":
+        return lambda v: not _is_empty(v)
+    if op == "contains":
+        needle = str(value).lower()
+        return lambda v: isinstance(v, str) and needle in v.lower()
+    if op in _NUMERIC_OPS:
+        return _numeric_test(op, value)
+    return _equality_test(op, value)
+
+
+def _equality_test(op: str, value: Any) -> Callable[[Any], bool]:
+    targets = {value_key(item) for item in (value if op in _LIST_OPS else [value])} - {None}
+    if op in ("eq", "in"):
+        return lambda v: v is not None and value_key(v) in targets
+    return lambda v: v is None or value_key(v) not in targets
+
+
+def _numeric_test(op: str, value: Any) -> Callable[[Any], bool]:
+    bounds = [_number(item) for item in (value if op == "between" else [value])]
+    numbers = [bound for bound in bounds if bound is not None]
+    if len(numbers) != len(bounds):
+        msg = f"Operator '{op}' expects numeric values, got {value!r}."
+        raise ValueError(msg)
+    low, high = numbers[0], numbers[-1]
+    comparisons: dict[str, Callable[[float], bool]] = {
+        "gt": lambda n: n > low,
+        "gte": lambda n: n >= low,
+        "lt": lambda n: n < low,
+        "lte": lambda n: n <= low,
+        "between": lambda n: low <= n <= high,
+    }
+    compare = comparisons[op]
+
+    def test(v: Any) -> bool:
+        number = _number(v)
+        return number is not None and compare(number)
+
+    return test
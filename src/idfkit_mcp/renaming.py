@@ -0,0 +1,167 @@
+"""Planning and applying many renames at once for ``batch_rename_objects``.
+
+Renaming objects one by one looks up and rewrites the referencing fields
+of each name separately, and cannot express swaps (``A -> B``, ``B -> A``)
+without temporary names. Here the whole set of renames is planned and
+checked for collisions first, then referencing fields are detached from
+the reference graph, the objects renamed, and every referencing field
+rewritten in a single pass.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from idfkit.document import IDFDocument
+    from idfkit.objects import IDFObject
+
+
+class RenameError(ValueError):
+    """A planned rename is invalid; ``old_name`` identifies the entry."""
+
+    def __init__(self, obj_type: str, old_name: str, message: str) -> None:
+        super().__init__(message)
+        self.obj_type = obj_type
+        self.old_name = old_name
+
+    def to_dict(self) -> dict[str, str]:
+        return {"object_type": self.obj_type, "old_name": self.old_name, "error": str(self)}
+
+
+@dataclass
+class RenameResult:
+    """Outcome of ``apply_renames``.
+
+    ``renamed`` pairs each object with its previous name; ``rewritten``
+    pairs each referencing object with the field values it had before;
+    ``references`` counts referencing objects per previous name (uppercase).
+    """
+
+    renamed: list[tuple[IDFObject, str]] = field(default_factory=lambda: [])
+    rewritten: list[tuple[IDFObject, dict[str, Any]]] = field(default_factory=lambda: [])
+    references: dict[str, int] = field(default_factory=dict[str, int])
+
+
+def explicit_renames(
+    doc: IDFDocument, renames: list[dict[str, str]]
+) -> tuple[list[tuple[IDFObject, str]], list[RenameError]]:
+    """Resolve ``[{"object_type", "old_name", "new_name"}]`` entries to objects."""
+    plan: list[tuple[IDFObject, str]] = []
+    errors: list[RenameError] = []
+    for spec in renames:
+        obj_type, old_name = spec.get("object_type", ""), spec.get("old_name", "")
+        collection = doc.collections.get(obj_type)
+        obj = collection.get(old_name) if collection is not None else None
+        if obj is None:
+            errors.append(RenameError(obj_type, old_name, f"Object '{old_name}' not found in '{obj_type}'."))
+        else:
+            plan.append((obj, spec.get("new_name", "")))
+    return plan, errors
+
+
+def rule_renames(
+    doc: IDFDocument, pattern: str, replacement: str, object_type: str | None
+) -> list[tuple[IDFObject, str]]:
+    """Rename every object whose name matches ``pattern``.
+
+    ``replacement`` is a ``re.sub`` template, so groups can be reused with
+    ``\\1`` or ``\\g<name>``. Objects whose name is unchanged are left out.
+
+    Raises:
+        ValueError: If ``pattern`` is not a valid regular expression or
+            ``object_type`` is not in the model.
+    """
+    try:
+        regex = re.compile(pattern)
+    except re.error as e:
+        msg = f"Invalid pattern '{pattern}': {e}"
+        raise ValueError(msg) from e
+    if object_type is not None and object_type not in doc.collections:
+        msg = f"No objects of type '{object_type}' in the model."
+        raise ValueError(msg)
+    types = [object_type] if object_type is not None else list(doc.collections)
+    plan: list[tuple[IDFObject, str]] = []
+    for obj_type in types:
+        for obj in doc.collections[obj_type]:
+            if obj.name and regex.search(obj.name):
+                new_name = regex.sub(replacement, obj.name)
+                if new_name != obj.name:
+                    plan.append((obj, new_name))
+    return plan
+
+
+def check_renames(doc: IDFDocument, plan: list[tuple[IDFObject, str]]) -> list[RenameError]:
+    """Return every problem with ``plan``; an empty list means it can be applied.
+
+    Names must stay unique per type once all renames are applied, so
+    swaps and chains are allowed. References are resolved by name alone,
+    so two objects sharing a name cannot be renamed to different names.
+    """
+    errors: list[RenameError] = []
+    seen: set[int] = set()
+    freed: set[tuple[str, str]] = {(obj.obj_type, obj.name.upper()) for obj, _ in plan}
+    claimed: dict[tuple[str, str], str] = {}
+    targets: dict[str, str] = {}
+    for obj, new_name in plan:
+        obj_type, old_name = obj.obj_type, obj.name
+        key = (obj_type, new_name.upper())
+        problem = None
+        if id(obj) in seen:
+            problem = "Object is renamed more than once."
+        elif not new_name.strip():
+            problem = "New name is empty."
+        elif key in claimed:
+            problem = f"New name '{new_name}' is also given to '{claimed[key]}'."
+        elif key not in freed and new_name.upper() in doc.collections[obj_type].by_name:
+            problem = f"'{obj_type}' already has an object named '{new_name}'."
+        elif targets.setdefault(old_name.upper(), new_name) != new_name:
+            problem = f"Another object named '{old_name}' is renamed to '{targets[old_name.upper()]}'."
+        if problem is not None:
+            errors.append(RenameError(obj_type, old_name, problem))
+        seen.add(id(obj))
+        claimed.setdefault(key, old_name)
+    return errors
+
+
+def apply_renames(doc: IDFDocument, plan: list[tuple[IDFObject, str]]) -> RenameResult:
+    """Apply a plan that passed ``check_renames``."""
+    graph = doc.references
+    new_by_old = {obj.name.upper(): new_name for obj, new_name in plan}
+    incoming = {old: graph.get_referencing_with_fields(old) for old in new_by_old}
+
+    # With no references left under the old names, renaming an object only
+    # updates its collection; the referencing fields are rewritten below.
+    for old, pairs in incoming.items():
+        for ref, field_name in pairs:
+            graph.update_reference(ref, field_name, old, None)
+
+    result = RenameResult()
+    result.renamed = [(obj, obj.name) for obj, _ in plan]
+    if _needs_staging(plan):
+        for i, (obj, _) in enumerate(plan):
+            obj.name = f"\x00rename-{i}"
+    for obj, new_name in plan:
+        obj.name = new_name
+
+    rewritten: dict[int, tuple[IDFObject, dict[str, Any]]] = {}
+    for old, pairs in incoming.items():
+        new_name = new_by_old[old]
+        for ref, field_name in pairs:
+            current = ref.data.get(field_name)
+            if isinstance(current, str) and current.upper() == old:
+                rewritten.setdefault(id(ref), (ref, {}))[1][field_name] = current
+                ref.data[field_name] = new_name
+                current = new_name
+            graph.update_reference(ref, field_name, None, current)
+        result.references[old] = len({id(ref) for ref, _ in pairs})
+    result.rewritten = list(rewritten.values())
+    return result
+
+
+def _needs_staging(plan: list[tuple[IDFObject, str]]) -> bool:
+    """Whether a new name is still held by another object of the plan (a swap or chain)."""
+    old_keys = {(obj.obj_type, obj.name.upper()): id(obj) for obj, _ in plan}
+    return any(old_keys.get((obj.obj_type, new_name.upper()), id(obj)) != id(obj) for obj, new_name in plan)
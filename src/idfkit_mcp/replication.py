@@ -0,0 +1,157 @@
+"""Server-side replication of a zone and the objects that belong to it.
+
+A zone's objects are found by following references outward from it:
+everything that references the zone or one of its objects (surfaces,
+windows on them, loads, thermostats, equipment connections), plus the
+objects they reference whose names contain the zone name (an equipment
+list called ``Office Equipment``). Objects tied to another zone are left
+out, and shared objects such as schedules and constructions are
+referenced by the copies rather than copied.
+
+In each copy, the zone name is replaced by the replica's zone name in
+object names and in text fields such as node names, and references
+between copied objects point at the new copies.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+from idfkit.geometry import VERTEX_SURFACE_TYPES
+
+from idfkit_mcp.geometry import affine_matrix, transformed_fields
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from idfkit.document import IDFDocument
+    from idfkit.objects import IDFObject
+
+    from idfkit_mcp.indexes import NameIndex
+
+_VERTEX_TYPES = {obj_type.upper() for obj_type in VERTEX_SURFACE_TYPES}
+
+
+@dataclass
+class ReplicaPlan:
+    """Copies of a zone's objects, ready to be added to the document."""
+
+    zones: list[str] = field(default_factory=list[str])
+    objects: list[IDFObject] = field(default_factory=lambda: [])
+    conflicts: list[dict[str, str]] = field(default_factory=list[dict[str, str]])
+
+
+def zone_objects(doc: IDFDocument, zone: IDFObject, names: NameIndex) -> list[IDFObject]:
+    """Return ``zone`` followed by the objects that belong to it, in discovery order."""
+    pattern = _name_pattern(zone.name)
+    other_zones = {z.name.upper() for z in doc["Zone"]} - {zone.name.upper()}
+    members: dict[int, IDFObject] = {id(zone): zone}
+    queue = deque([zone])
+    while queue:
+        obj = queue.popleft()
+        candidates = list(doc.get_referencing(obj.name)) if obj.name else []
+        # Field values rather than doc.get_references(), which misses extensible
+        # fields such as the equipment of a ZoneHVAC:EquipmentList.
+        candidates += [target for text in _texts(obj) if pattern.search(text) for target in names.find(text)]
+        for candidate in candidates:
+            if id(candidate) in members or candidate.obj_type.upper() == "ZONE":
+                continue
+            if doc.get_references(candidate) & other_zones:
+                continue
+            members[id(candidate)] = candidate
+            queue.append(candidate)
+    return list(members.values())
+
+
+def plan_replicas(
+    doc: IDFDocument,
+    members: Sequence[IDFObject],
+    zone_names: Sequence[str],
+    offsets: Sequence[Sequence[float]],
+    names: NameIndex,
+) -> ReplicaPlan:
+    """Copy ``members`` once per entry of ``zone_names``, moving vertices by the matching offset.
+
+    Copies are detached from the document. Names that already exist in the
+    document or repeat within the plan are reported in ``conflicts``.
+    """
+    source = members[0].name
+    pattern = _name_pattern(source)
+    member_names = {obj.name.upper(): obj.name for obj in members if obj.name}
+    plan = ReplicaPlan(zones=list(zone_names))
+    seen: set[tuple[str, str]] = set()
+    for zone_name, offset in zip(zone_names, offsets, strict=True):
+        matrix = affine_matrix(translate=offset) if any(offset) else None
+
+        def rename(text: str, zone_name: str = zone_name) -> str:
+            return pattern.sub(lambda _: zone_name, text)
+
+        mapping = {key: _member_name(name, pattern, rename, zone_name) for key, name in member_names.items()}
+        for obj in members:
+            copy = obj.copy()
+            copy.name = mapping[obj.name.upper()] if obj.name else ""
+            data = copy.data
+            for key, value in obj.data.items():
+                data[key] = _rewrite(value, mapping, names, rename)
+            if matrix is not None and obj.obj_type.upper() in _VERTEX_TYPES:
+                # The copy is not in the document yet, so its fields can be written directly.
+                data.update(transformed_fields(copy, matrix) or {})
+            _check_name(doc, copy, seen, plan.conflicts)
+            plan.objects.append(copy)
+    return plan
+
+
+def _texts(obj: IDFObject) -> list[str]:
+    texts: list[str] = []
+    for value in obj.data.values():
+        if isinstance(value, str):
+            texts.append(value)
+        elif isinstance(value, list):
+            for item in cast("list[Any]", value):
+                if isinstance(item, dict):
+                    texts += [v for v in cast("dict[str, Any]", item).values() if isinstance(v, str)]
+    return texts
+
+
+def _member_name(name: str, pattern: re.Pattern[str], rename: Callable[[str], str], zone_name: str) -> str:
+    # Objects named after the zone follow it; others are prefixed so copies stay unique.
+    return rename(name) if pattern.search(name) else f"{zone_name} {name}"
+
+
+def _rewrite(value: Any, mapping: dict[str, str], names: NameIndex, rename: Callable[[str], str]) -> Any:
+    if isinstance(value, list):
+        # epJSON extensible fields such as ``vertices``; copied so replicas share nothing.
+        return [
+            {k: _rewrite(v, mapping, names, rename) for k, v in cast("dict[str, Any]", item).items()}
+            if isinstance(item, dict)
+            else item
+            for item in cast("list[Any]", value)
+        ]
+    if not isinstance(value, str) or not value:
+        return value
+    mapped = mapping.get(value.upper())
+    if mapped is not None:
+        return mapped
+    if value in names:
+        # A reference to a shared object outside the zone.
+        return value
+    return rename(value)
+
+
+def _check_name(doc: IDFDocument, obj: IDFObject, seen: set[tuple[str, str]], conflicts: list[dict[str, str]]) -> None:
+    if not obj.name:
+        return
+    key = (obj.obj_type.upper(), obj.name.upper())
+    existing = doc.collections.get(obj.obj_type)
+    if key in seen or (existing is not None and existing.get(obj.name) is not None):
+        conflicts.append({"object_type": obj.obj_type, "name": obj.name})
+    seen.add(key)
+
+
+def _name_pattern(zone_name: str) -> re.Pattern[str]:
+    """Match ``zone_name`` as a whole word, case-insensitively."""
+    return re.compile(rf"(?<![A-Za-z0-9]){re.escape(zone_name)}(?![A-Za-z0-9])", re.IGNORECASE)
@@ -0,0 +1,184 @@
+"""Incremental serialization for ``save_model``.
+
+Saving re-serializes only the objects that changed since the previous
+save. The text of every serialized object is kept in a model index along
+with the object's ``mutation_version``; objects whose version is unchanged
+and that no write tool reported as changed (a rename rewrites referencing
+fields without bumping their version) reuse their cached text.
+
+Objects are still formatted by idfkit's own writer classes, through
+[idfkit_writers][idfkit_mcp.idfkit_writers], so the output is byte-for-byte
+what ``write_idf`` / ``write_epjson`` would produce. It is
+streamed object by object, optionally through gzip or Zstandard, to a
+temporary file that then replaces the target, so memory use does not grow
+with the output and readers never see a partial model.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import stat
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from idfkit_mcp.compressed import compressed_writer, compression_of
+from idfkit_mcp.idfkit_writers import epjson_formatter, idf_formatter, version_identifier
+from idfkit_mcp.indexes import ModelIndex
+
+if TYPE_CHECKING:
+    from idfkit.document import IDFDocument
+    from idfkit.objects import IDFObject
+
+# Output formats and the encodings write_idf / write_epjson use for them.
+ENCODINGS = {"idf": "latin-1", "epjson": "utf-8"}
+
+_NEW_FILE_MODE = 0o644
+
+_IDF_HEADER = "!-Generator archetypal\n!-Option SortedOrder\n"
+_IDF_VERSION_COMMENT = " " * 20 + "!- Version Identifier"
+
+
+class SerializationCache(ModelIndex):
+    """Serialized text of each object as of the last save, per output format."""
+
+    # Dropping the cache after a bulk change would make the next save
+    # re-serialize the whole model; forgetting changed objects is cheap.
+    rebuildable = False
+
+    def __init__(self, doc: IDFDocument) -> None:
+        super().__init__(doc)
+        self._texts: dict[str, dict[int, tuple[IDFObject, int, str]]] = {fmt: {} for fmt in ENCODINGS}
+        self._saved: dict[tuple[str, str], tuple[str, int, int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def chunks(self, output_format: str) -> Iterator[str]:
+        """Yield the whole document in ``output_format``, one object at a time."""
+        if output_format == "epjson":
+            return self._epjson_chunks()
+        return self._idf_chunks()
+
+    def is_saved(self, path: Path, output_format: str, token: str) -> bool:
+        """Whether ``path`` still holds this model at ``token`` as written by ``mark_saved``."""
+        saved = self._saved.get((str(path), output_format))
+        if saved is None or saved[0] != token:
+            return False
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        return (st.st_mtime_ns, st.st_size) == saved[1:]
+
+    def mark_saved(self, path: Path, output_format: str, token: str) -> None:
+        """Remember that ``path`` was just written from this model at ``token``."""
+        st = path.stat()
+        self._saved[(str(path), output_format)] = (token, st.st_mtime_ns, st.st_size)
+
+    def object_text(self, output_format: str, obj: IDFObject, serialize: Any) -> str:
+        """Return the cached text of ``obj``, calling ``serialize(obj)`` if it changed."""
+        texts = self._texts[output_format]
+        cached = texts.get(id(obj))
+        if cached is not None and cached[0] is obj and cached[1] == obj.mutation_version:
+            self.hits += 1
+            return cached[2]
+        self.misses += 1
+        text = serialize(obj)
+        texts[id(obj)] = (obj, obj.mutation_version, text)
+        return text
+
+    def object_removed(self, obj: IDFObject) -> None:
+        self._forget((obj,))
+
+    def object_renamed(self, obj: IDFObject, old_name: str, referencing: Iterable[IDFObject]) -> None:
+        self._forget((obj, *referencing))
+
+    def object_updated(self, obj: IDFObject, old_values: dict[str, Any]) -> None:
+        self._forget((obj,))
+
+    def _forget(self, objects: Iterable[IDFObject]) -> None:
+        for obj in objects:
+            for texts in self._texts.values():
+                texts.pop(id(obj), None)
+
+    def _idf_chunks(self) -> Iterator[str]:
+        # Mirrors IDFWriter.to_string(): a header, the Version object, then
+        # each object followed by a blank line, with types in sorted order.
+        doc = self.doc
+        serialize = idf_formatter(doc)
+        yield f"{_IDF_HEADER}\nVersion,\n  {version_identifier(doc)};{_IDF_VERSION_COMMENT}\n"
+        for obj_type in sorted(doc.collections):
+            if obj_type.upper() == "VERSION":
+                continue
+            for obj in doc.collections[obj_type]:
+                yield f"\n{self.object_text('idf', obj, serialize)}\n"
+
+    def _epjson_chunks(self) -> Iterator[str]:
+        # Mirrors json.dump(EpJSONWriter(doc).to_dict(), f, indent=2).
+        doc = self.doc
+        to_dict = epjson_formatter(doc)
+
+        def serialize(obj: IDFObject) -> str:
+            return _nest(json.dumps(to_dict(obj), indent=2), 2)
+
+        version = {"version_identifier": version_identifier(doc)}
+        yield '{\n  "Version": {\n'
+        yield _epjson_member("Version 1", _nest(json.dumps(version, indent=2), 2))
+        yield "\n  }"
+        for obj_type, collection in doc.collections.items():
+            if obj_type.upper() == "VERSION" or not collection:
+                continue
+            separator = f",\n  {json.dumps(obj_type)}: {{\n"
+            nameless = 0
+            for obj in collection:
+                if obj.name:
+                    key = obj.name
+                else:
+                    nameless += 1
+                    key = f"{obj_type} {nameless}"
+                yield separator + _epjson_member(key, self.object_text("epjson", obj, serialize))
+                separator = ",\n"
+            yield "\n  }"
+        yield "\n}"
+
+
+def _nest(text: str, depth: int) -> str:
+    """Indent the continuation lines of a JSON value written at ``depth``."""
+    return text.replace("\n", "\n" + "  " * depth)
+
+
+def _epjson_member(key: str, value_text: str) -> str:
+    return f"    {json.dumps(key)}: {value_text}"
+
+
+def write_atomic(path: Path, chunks: Iterable[str], encoding: str) -> int:
+    """Stream ``chunks`` to a temporary file next to ``path`` and move it into place.
+
+    The output is compressed if ``path`` ends in ``.gz`` or ``.zst``. An
+    existing file keeps its permission bits.
+
+    Returns:
+        The size of the written file in bytes.
+    """
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = _NEW_FILE_MODE
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw:
+            with compressed_writer(raw, compression_of(path)) as binary:
+                text = io.TextIOWrapper(binary, encoding=encoding, write_through=False)
+                text.writelines(chunks)
+                text.flush()
+                text.detach()
+            size = raw.tell()
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return size
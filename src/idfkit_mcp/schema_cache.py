@@ -0,0 +1,126 @@
+"""Lookup tables derived from a schema, computed once per schema version.
+
+Schemas are immutable once loaded and shared by every session using the
+same EnergyPlus version, so anything derived from them is cached here by
+version rather than per model or per session.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from idfkit.schema import EpJSONSchema
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_group_maps: dict[tuple[int, int, int], dict[str, str]] = {}
+
+
+def group_map(schema: EpJSONSchema) -> dict[str, str]:
+    """Return the IDD group of every object type in ``schema``.
+
+    Types without a group map to ``"Ungrouped"``. The returned dict is
+    shared and must not be modified.
+    """
+    groups = _group_maps.get(schema.version)
+    if groups is None:
+        with _lock:
+            groups = _group_maps.get(schema.version)
+            if groups is None:
+                groups = {t: schema.get_group(t) or "Ungrouped" for t in schema.object_types}
+                _group_maps[schema.version] = groups
+    return groups
+
+
+_field_sets: dict[tuple[tuple[int, int, int], str], frozenset[str] | None] = {}
+_EXTENSIBLE_SUFFIX = re.compile(r"_\d+$")
+
+
+def field_names(schema: EpJSONSchema, obj_type: str) -> frozenset[str] | None:
+    """Return the field names of ``obj_type`` (Python style), or None for unknown types.
+
+    Extensible fields are listed once, without the ``_2``, ``_3``... suffix
+    used for later repetitions; see [is_known_field][idfkit_mcp.schema_cache.is_known_field].
+    """
+    key = (schema.version, obj_type)
+    if key not in _field_sets:
+        cache = schema.get_parsing_cache(obj_type)
+        _field_sets[key] = frozenset(cache.all_field_names) if cache is not None else None
+    return _field_sets[key]
+
+
+def is_known_field(names: frozenset[str], field_name: str) -> bool:
+    """Return whether ``field_name`` is in ``names``, allowing extensible repetitions."""
+    return field_name in names or _EXTENSIBLE_SUFFIX.sub("", field_name) in names
+
+
+# Enough for every object type of two EnergyPlus versions.
+DEFAULT_DESCRIPTION_CACHE_SIZE = 2048
+
+_descriptions: OrderedDict[tuple[tuple[int, int, int], str], dict[str, Any]] = OrderedDict()
+_description_limit = DEFAULT_DESCRIPTION_CACHE_SIZE
+
+
+def object_description(schema: EpJSONSchema, obj_type: str) -> dict[str, Any]:
+    """Return the serialized description of ``obj_type``, as ``describe_object_type`` returns it.
+
+    Descriptions are kept in a least-recently-used cache keyed by schema
+    version and type. The returned dict is shared and must not be modified.
+
+    Raises:
+        KeyError: If ``obj_type`` is not in ``schema``.
+    """
+    from idfkit.introspection import describe_object_type
+
+    from idfkit_mcp.serializers import serialize_object_description
+
+    key = (schema.version, obj_type)
+    with _lock:
+        payload = _descriptions.get(key)
+        if payload is not None:
+            _descriptions.move_to_end(key)
+            return payload
+    payload = serialize_object_description(describe_object_type(schema, obj_type))
+    with _lock:
+        _descriptions[key] = payload
+        while len(_descriptions) > _description_limit:
+            _descriptions.popitem(last=False)
+    return payload
+
+
+def configure_description_cache(max_entries: int) -> None:
+    """Set how many object descriptions are kept, dropping the oldest beyond it."""
+    global _description_limit
+    with _lock:
+        _description_limit = max(max_entries, 0)
+        while len(_descriptions) > _description_limit:
+            _descriptions.popitem(last=False)
+
+
+def precompute_descriptions(version: tuple[int, int, int]) -> threading.Thread:
+    """Load the schema of ``version`` and describe every object type, in a background daemon thread.
+
+    Returns the started thread. Requests served meanwhile describe types
+    on demand as usual.
+    """
+
+    def run() -> None:
+        from idfkit import get_schema
+
+        schema = get_schema(version)
+        for obj_type in schema.object_types:
+            try:
+                object_description(schema, obj_type)
+            except Exception:
+                logger.exception("Could not describe %s", obj_type)
+        logger.info("Precomputed %d object descriptions", len(schema.object_types))
+
+    thread = threading.Thread(target=run, name="idfkit-mcp-describe", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,189 @@
+"""Ranked full-text search over a schema's object types, for ``search_schema``.
+
+Each object type is indexed as one document made of its type name, memo,
+field names, and field notes, with terms from the type name weighted
+highest. Queries are scored with BM25 over these weighted term counts.
+
+Query terms missing from the vocabulary are expanded to the vocabulary
+terms they prefix ("infiltr") or closely resemble by shared trigrams
+("infiltraton"), scored by how similar they are, so partial words and
+typos still find their types. The index is built once per schema version
+and shared, like the tables in [schema_cache][idfkit_mcp.schema_cache].
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import re
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from idfkit.schema import EpJSONSchema
+
+# Weight of a term occurrence by where it appears in the type's schema.
+_NAME_WEIGHT = 4.0
+_MEMO_WEIGHT = 1.0
+_FIELD_WEIGHT = 1.5
+_NOTE_WEIGHT = 0.5
+
+# BM25 term-frequency saturation and length normalization.
+_K1 = 1.2
+_B = 0.75
+
+# Added to the score when the whole query, ignoring case, spaces, and punctuation,
+# is part of the type name or the type name itself ("run period" -> RunPeriod).
+_SUBSTRING_BONUS = 3.0
+_EXACT_BONUS = 10.0
+
+_PREFIX_WEIGHT = 0.8
+_PREFIX_MIN_LENGTH = 3
+_FUZZY_MIN_LENGTH = 4
+_FUZZY_MIN_SIMILARITY = 0.5
+_FUZZY_MAX_TERMS = 3
+
+_WORD = re.compile(r"[A-Za-z0-9]+")
+_CAMEL_PART = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+
+def _words(text: str) -> list[str]:
+    """Split ``text`` into lowercase alphanumeric words."""
+    return [w.lower() for w in _WORD.findall(text)]
+
+
+def _terms(text: str) -> list[str]:
+    """Split ``text`` into index terms: each word, plus the parts of CamelCase words."""
+    terms: list[str] = []
+    for word in _WORD.findall(text):
+        lower = word.lower()
+        terms.append(lower)
+        parts = [p.lower() for p in _CAMEL_PART.findall(word)]
+        if len(parts) > 1:
+            terms += parts
+    return terms
+
+
+def _grams(term: str) -> set[str]:
+    padded = f" {term} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class SchemaSearchIndex:
+    """Inverted index over the object types of one schema."""
+
+    def __init__(self, schema: EpJSONSchema) -> None:
+        self.types: list[str] = list(schema.object_types)
+        self._compact_types = ["".join(_words(t)) for t in self.types]
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        self._lengths: list[float] = []
+        for doc_id, obj_type in enumerate(self.types):
+            counts = _type_terms(schema, obj_type)
+            self._lengths.append(sum(counts.values()))
+            for term, tf in counts.items():
+                self._postings.setdefault(term, []).append((doc_id, tf))
+        self._avg_length = sum(self._lengths) / len(self._lengths) if self._lengths else 1.0
+        self._by_gram: dict[str, list[str]] = {}
+        for term in self._postings:
+            for gram in _grams(term):
+                self._by_gram.setdefault(gram, []).append(term)
+        self._sorted_terms = sorted(self._postings)
+
+    def search(self, query: str) -> list[tuple[str, float]]:
+        """Return ``(object_type, score)`` for every matching type, best first."""
+        scores: dict[int, float] = {}
+        for word in dict.fromkeys(_words(query)):
+            for term, weight in self._expand(word):
+                self._score_term(term, weight, scores)
+        needle = "".join(_words(query))
+        if needle:
+            for doc_id, compact in enumerate(self._compact_types):
+                if needle == compact:
+                    scores[doc_id] = scores.get(doc_id, 0.0) + _EXACT_BONUS
+                elif needle in compact:
+                    scores[doc_id] = scores.get(doc_id, 0.0) + _SUBSTRING_BONUS
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self.types[item[0]]))
+        return [(self.types[doc_id], score) for doc_id, score in ranked]
+
+    def _score_term(self, term: str, weight: float, scores: dict[int, float]) -> None:
+        postings = self._postings[term]
+        n = len(self.types)
+        idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+        for doc_id, tf in postings:
+            norm = _K1 * (1 - _B + _B * self._lengths[doc_id] / self._avg_length)
+            scores[doc_id] = scores.get(doc_id, 0.0) + weight * idf * tf * (_K1 + 1) / (tf + norm)
+
+    def _expand(self, word: str) -> list[tuple[str, float]]:
+        """Return the vocabulary terms ``word`` stands for, with a weight for how closely each matches."""
+        if word in self._postings:
+            return [(word, 1.0)]
+        expanded: dict[str, float] = {}
+        if len(word) >= _PREFIX_MIN_LENGTH:
+            for term in self._prefixed(word):
+                expanded[term] = _PREFIX_WEIGHT * len(word) / len(term)
+        if len(word) >= _FUZZY_MIN_LENGTH:
+            grams = _grams(word)
+            shared = Counter(term for gram in grams for term in self._by_gram.get(gram, ()))
+            # Dice coefficient of the trigram sets; a padded term of length n has n trigrams.
+            similar = [(term, 2 * count / (len(grams) + len(term))) for term, count in shared.items()]
+            similar = sorted(
+                ((term, score) for term, score in similar if score >= _FUZZY_MIN_SIMILARITY),
+                key=lambda item: (-item[1], item[0]),
+            )
+            for term, similarity in similar[:_FUZZY_MAX_TERMS]:
+                expanded[term] = max(expanded.get(term, 0.0), similarity)
+        return list(expanded.items())
+
+    def _prefixed(self, word: str) -> list[str]:
+        terms = self._sorted_terms
+        start = bisect.bisect_left(terms, word)
+        end = start
+        while end < len(terms) and terms[end].startswith(word):
+            end += 1
+        return terms[start:end]
+
+
+def _type_terms(schema: EpJSONSchema, obj_type: str) -> dict[str, float]:
+    """Return the weighted term counts of one object type's schema."""
+    counts: dict[str, float] = {}
+
+    def count(text: str, weight: float) -> None:
+        for term in _terms(text):
+            counts[term] = counts.get(term, 0.0) + weight
+
+    count(obj_type, _NAME_WEIGHT)
+    count(schema.get_object_memo(obj_type) or "", _MEMO_WEIGHT)
+    inner = schema.get_inner_schema(obj_type) or {}
+    for field_name, field_schema in _fields(inner.get("properties", {})):
+        count(field_name, _FIELD_WEIGHT)
+        count(str(field_schema.get("note", "")), _NOTE_WEIGHT)
+    return counts
+
+
+def _fields(properties: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
+    """Return the fields in ``properties``, including those of extensible groups."""
+    fields: list[tuple[str, dict[str, Any]]] = []
+    for field_name, field_schema in properties.items():
+        fields.append((field_name, field_schema))
+        items = field_schema.get("items")
+        if isinstance(items, dict):
+            group: dict[str, dict[str, Any]] = cast("dict[str, Any]", items).get("properties", {})
+            fields += group.items()
+    return fields
+
+
+_lock = threading.Lock()
+_indexes: dict[tuple[int, int, int], SchemaSearchIndex] = {}
+
+
+def search_index(schema: EpJSONSchema) -> SchemaSearchIndex:
+    """Return the search index of ``schema``, building it on first use."""
+    index = _indexes.get(schema.version)
+    if index is None:
+        with _lock:
+            index = _indexes.get(schema.version)
+            if index is None:
+                index = SchemaSearchIndex(schema)
+                _indexes[schema.version] = index
+    return index
@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     from idfkit.introspection import FieldDescription, ObjectDescription
     from idfkit.objects import IDFObject
     from idfkit.schema import EpJSONSchema
-    from idfkit.validation import ValidationError, ValidationResult
+    from idfkit.validation import ValidationError
     from idfkit.weather.station import WeatherStation
 
 
@@ -32,6 +32,27 @@ def serialize_object(obj: IDFObject, schema: EpJSONSchema | None = None, brief:
     return {"object_type": obj.obj_type, "name": obj.name, **obj.to_dict()}
 
 
+def project_object(obj: IDFObject, fields: list[str]) -> dict[str, Any]:
+    """Convert an IDFObject to a dict holding only the requested fields.
+
+    ``object_type`` and ``name`` are always included. Fields the object does
+    not set are returned as None.
+
+    Args:
+        obj: The IDFObject to serialize.
+        fields: Field names, in IDF or Python style.
+    """
+    from idfkit.objects import to_python_name
+
+    result: dict[str, Any] = {"object_type": obj.obj_type, "name": obj.name}
+    data = obj.data
+    for field_name in fields:
+        key = to_python_name(field_name)
+        if key != "name":
+            result[key] = data.get(key)
+    return result
+
+
 def serialize_object_description(desc: ObjectDescription) -> dict[str, Any]:
     """Convert an ObjectDescription to a dict."""
     return {
@@ -82,18 +103,6 @@ def serialize_validation_error(err: ValidationError) -> dict[str, Any]:
     }
 
 
-def serialize_validation_result(result: ValidationResult) -> dict[str, Any]:
-    """Convert a ValidationResult to a dict."""
-    return {
-        "is_valid": result.is_valid,
-        "error_count": len(result.errors),
-        "warning_count": len(result.warnings),
-        "info_count": len(result.info),
-        "errors": [serialize_validation_error(e) for e in result.errors],
-        "warnings": [serialize_validation_error(w) for w in result.warnings],
-    }
-
-
 def serialize_station(station: WeatherStation) -> dict[str, Any]:
     """Convert a WeatherStation to a dict."""
     return station.to_dict()
@@ -5,11 +5,21 @@ from __future__ import annotations
 import argparse
 import os
 from collections.abc import Sequence
+from pathlib import Path
 from typing import Literal, get_args
 
 from mcp.server.fastmcp import FastMCP
 
-from idfkit_mcp.tools import read, schema, simulation, validation, weather, write
+from idfkit_mcp.journal import DEFAULT_JOURNAL_BYTES, configure_journal
+from idfkit_mcp.model_cache import DEFAULT_MODEL_CACHE_BYTES, configure_model_cache
+from idfkit_mcp.schema_cache import (
+    DEFAULT_DESCRIPTION_CACHE_SIZE,
+    configure_description_cache,
+    precompute_descriptions,
+)
+from idfkit_mcp.snapshot import default_snapshot_dir
+from idfkit_mcp.state import DEFAULT_MAX_SESSIONS, DEFAULT_SESSION_IDLE_TIMEOUT, configure_sessions
+from idfkit_mcp.tools import read, schema, session, simulation, validation, weather, write
 
 Transport = Literal["stdio", "sse", "streamable-http"]
 
@@ -18,11 +28,13 @@ _INSTRUCTIONS = (
     "Create, edit, validate, and simulate building energy models.\n\n"
     "Guidelines:\n"
     "- Use get_model_summary first to understand any loaded model\n"
-    "- Call describe_object_type before creating/editing objects to know valid fields\n"
+    "- Call describe_object_type before creating/editing objects to know valid fields "
+    "(describe_object_types for several at once)\n"
     "- Use batch_add_objects when creating multiple objects (minimizes round-trips)\n"
-    "- Validate after modifications with validate_model\n"
+    "- Validate after modifications with validate_model; incremental=true rechecks only what changed\n"
     "- For reference fields, use get_available_references to see valid values\n"
-    "- Check references before removing objects (remove_object warns by default)"
+    "- Check references before removing objects (remove_object warns by default)\n"
+    "- Use checkpoint before risky edits; undo or restore reverts them without reloading"
 )
 
 
@@ -36,6 +48,7 @@ def create_server(host: str = "127.0.0.1", port: int = 8000) -> FastMCP:
     validation.register(server)
     simulation.register(server)
     weather.register(server)
+    session.register(server)
     return server
 
 
@@ -67,6 +80,47 @@ def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=os.getenv("IDFKIT_MCP_MOUNT_PATH"),
         help="Optional mount path for SSE transport.",
     )
+    parser.add_argument(
+        "--max-sessions",
+        type=int,
+        default=int(os.getenv("IDFKIT_MCP_MAX_SESSIONS", str(DEFAULT_MAX_SESSIONS))),
+        help="Maximum number of client sessions kept in memory for HTTP/SSE transports.",
+    )
+    parser.add_argument(
+        "--session-idle-timeout",
+        type=float,
+        default=float(os.getenv("IDFKIT_MCP_SESSION_IDLE_TIMEOUT", str(DEFAULT_SESSION_IDLE_TIMEOUT))),
+        help="Seconds of inactivity after which a session's model is dropped (HTTP/SSE transports).",
+    )
+    parser.add_argument(
+        "--model-cache-mb",
+        type=int,
+        default=int(os.getenv("IDFKIT_MCP_MODEL_CACHE_MB", str(DEFAULT_MODEL_CACHE_BYTES // (1024 * 1024)))),
+        help="Memory budget in MB for parsed models reused by load_model (0 disables the cache).",
+    )
+    parser.add_argument(
+        "--journal-mb",
+        type=int,
+        default=int(os.getenv("IDFKIT_MCP_JOURNAL_MB", str(DEFAULT_JOURNAL_BYTES // (1024 * 1024)))),
+        help="Memory budget in MB for each session's undo history (0 disables undo).",
+    )
+    parser.add_argument(
+        "--snapshot-dir",
+        default=os.getenv("IDFKIT_MCP_SNAPSHOT_DIR", str(default_snapshot_dir())),
+        help="Directory for binary model snapshots that speed up reloads across restarts (empty disables).",
+    )
+    parser.add_argument(
+        "--description-cache-size",
+        type=int,
+        default=int(os.getenv("IDFKIT_MCP_DESCRIPTION_CACHE_SIZE", str(DEFAULT_DESCRIPTION_CACHE_SIZE))),
+        help="Number of describe_object_type results kept in memory (0 disables the cache).",
+    )
+    parser.add_argument(
+        "--precompute-descriptions",
+        action="store_true",
+        default=os.getenv("IDFKIT_MCP_PRECOMPUTE_DESCRIPTIONS", "").lower() in ("1", "true", "yes"),
+        help="Describe every object type of the latest EnergyPlus version in the background at startup.",
+    )
     return parser.parse_args(argv)
 
 
@@ -74,6 +128,19 @@ def main() -> None:
     """Run the MCP server with configurable transport."""
     args = _parse_args()
     server = create_server(host=args.host, port=args.port)
+    configure_model_cache(
+        max_bytes=args.model_cache_mb * 1024 * 1024,
+        snapshot_dir=Path(args.snapshot_dir) if args.snapshot_dir else None,
+    )
+    configure_journal(max_bytes=args.journal_mb * 1024 * 1024)
+    configure_description_cache(args.description_cache_size)
+    if args.precompute_descriptions:
+        from idfkit import LATEST_VERSION
+
+        precompute_descriptions(LATEST_VERSION)
+
+    if args.transport != "stdio":
+        configure_sessions(max_sessions=args.max_sessions, idle_timeout=args.session_idle_timeout)
 
     run_kwargs: dict[str, str | None] = {"transport": args.transport}
     if args.transport != "stdio" and args.mount_path is not None:
@@ -0,0 +1,389 @@
+"""Compact binary snapshots of parsed models for fast reloads across restarts.
+
+A snapshot stores every object of a document in a columnar layout: one
+interned string table shared by all object types, names, field names and
+string values, followed by one block per object type with typed arrays
+(``uint32`` string indices, ``int64`` integers, ``float64`` reals). Values
+that are none of those (epJSON extensible lists, booleans, ``None``) are
+stored as JSON text. Restoring reads the arrays with ``array.frombytes``
+and rebuilds objects without touching the text parser.
+
+Layout (little-endian)::
+
+    magic "IDFKSNAP", u16 format, u16 x3 version, 32-byte source digest
+    u32 string count, u32 blob length, blob (NUL-separated UTF-8)
+    u32 type count, then per type:
+        u32 type, u32 object count, u32 data-field count, u32 order count,
+        u32 count per kind (str, int, float, json)
+        u32[objects] names, u32[objects] fields per object,
+        i32[objects] order length per object (-1 when unknown),
+        u32[fields] field names, u8[fields] value kinds,
+        u32[str] strings, i64[int] ints, f64[float] floats, u32[json] json,
+        u32[order] field order,
+        u32 reference count, then u32[refs] object, u32[refs] field, u32[refs] target
+
+The reference graph is stored alongside the objects so a restore registers
+references directly instead of rescanning every reference field.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import logging
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Callable
+from itertools import islice
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from idfkit.document import IDFDocument
+    from idfkit.schema import EpJSONSchema
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"IDFKSNAP"
+FORMAT_VERSION = 1
+SUFFIX = ".snap"
+DEFAULT_SNAPSHOT_MAX_BYTES = 1024 * 1024 * 1024
+
+_KIND_STR = 0
+_KIND_INT = 1
+_KIND_FLOAT = 2
+_KIND_JSON = 3
+
+_HEADER = struct.Struct("<8sH3H32s")
+_TABLE = struct.Struct("<II")
+_TYPE_BLOCK = struct.Struct("<8I")
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is corrupt or was written for different content."""
+
+
+def _to_bytes(arr: array[Any]) -> bytes:
+    if sys.byteorder != "little" and arr.itemsize > 1:
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _read_array(f: IO[bytes], typecode: str, count: int) -> array[Any]:
+    arr: array[Any] = array(typecode)
+    if count:
+        arr.frombytes(f.read(count * arr.itemsize))
+        if len(arr) != count:
+            msg = "Snapshot is truncated"
+            raise SnapshotError(msg)
+        if sys.byteorder != "little":
+            arr.byteswap()
+    return arr
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.index: dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        idx = self.index.get(value)
+        if idx is None:
+            if "\x00" in value:
+                msg = "Strings containing NUL cannot be stored in a snapshot"
+                raise SnapshotError(msg)
+            idx = len(self.index)
+            self.index[value] = idx
+        return idx
+
+
+def write_snapshot(doc: IDFDocument, f: IO[bytes], source_digest: str) -> None:
+    """Serialize ``doc`` to the binary snapshot format.
+
+    Args:
+        doc: Document to serialize.
+        f: Binary file handle to write to.
+        source_digest: SHA-256 hex digest of the source file the document came from.
+    """
+    strings = _StringTable()
+    blocks = [
+        _encode_collection(doc, obj_type, collection, strings.add)
+        for obj_type, collection in doc.collections.items()
+        if collection
+    ]
+
+    blob = "\x00".join(strings.index).encode("utf-8")
+    f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, *doc.version, bytes.fromhex(source_digest)))
+    f.write(_TABLE.pack(len(strings.index), len(blob)))
+    f.write(blob)
+    f.write(struct.pack("<I", len(blocks)))
+    for block in blocks:
+        f.write(block)
+
+
+def _encode_collection(doc: IDFDocument, obj_type: str, collection: Any, add: Callable[[str], int]) -> bytes:
+    """Encode one object type's collection as a snapshot type block."""
+    names = array("I")
+    field_counts = array("I")
+    order_counts = array("i")
+    keys = array("I")
+    kinds = array("B")
+    str_vals = array("I")
+    int_vals = array("q")
+    float_vals = array("d")
+    json_vals = array("I")
+    order = array("I")
+    ref_objects = array("I")
+    ref_fields = array("I")
+    ref_targets = array("I")
+    get_refs = doc.references.get_references_with_fields
+
+    for position, obj in enumerate(collection):
+        names.append(add(obj.name))
+        data: dict[str, Any] = obj.data
+        field_counts.append(len(data))
+        for key, value in data.items():
+            keys.append(add(key))
+            value_type = value.__class__
+            if value_type is str:
+                kinds.append(_KIND_STR)
+                str_vals.append(add(value))
+            elif value_type is float:
+                kinds.append(_KIND_FLOAT)
+                float_vals.append(value)
+            elif value_type is int and -(2**63) <= value < 2**63:
+                kinds.append(_KIND_INT)
+                int_vals.append(value)
+            else:
+                kinds.append(_KIND_JSON)
+                json_vals.append(add(json.dumps(value)))
+        field_order = obj.field_order
+        if field_order is None:
+            order_counts.append(-1)
+        else:
+            order_counts.append(len(field_order))
+            order.extend(add(name) for name in field_order)
+        for target, field_name in get_refs(obj):
+            ref_objects.append(position)
+            ref_fields.append(add(field_name))
+            ref_targets.append(add(target))
+
+    header = _TYPE_BLOCK.pack(
+        add(obj_type),
+        len(names),
+        len(keys),
+        len(order),
+        len(str_vals),
+        len(int_vals),
+        len(float_vals),
+        len(json_vals),
+    )
+    return b"".join((
+        header,
+        _to_bytes(names),
+        _to_bytes(field_counts),
+        _to_bytes(order_counts),
+        _to_bytes(keys),
+        _to_bytes(kinds),
+        _to_bytes(str_vals),
+        _to_bytes(int_vals),
+        _to_bytes(float_vals),
+        _to_bytes(json_vals),
+        _to_bytes(order),
+        struct.pack("<I", len(ref_objects)),
+        _to_bytes(ref_objects),
+        _to_bytes(ref_fields),
+        _to_bytes(ref_targets),
+    ))
+
+
+def read_snapshot(
+    f: IO[bytes],
+    source_digest: str | None = None,
+    filepath: Path | None = None,
+) -> IDFDocument:
+    """Rebuild a document from a binary snapshot.
+
+    Args:
+        f: Binary file handle positioned at the start of a snapshot.
+        source_digest: When given, the snapshot must have been written for this digest.
+        filepath: Source path recorded on the restored document.
+
+    Raises:
+        SnapshotError: If the data is not a valid snapshot or the digest does not match.
+    """
+    from idfkit import get_schema
+
+    raw_header = f.read(_HEADER.size)
+    if len(raw_header) != _HEADER.size:
+        msg = "Snapshot is truncated"
+        raise SnapshotError(msg)
+    magic, fmt, major, minor, patch, digest = _HEADER.unpack(raw_header)
+    if magic != MAGIC or fmt != FORMAT_VERSION:
+        msg = "Not a supported idfkit-mcp snapshot"
+        raise SnapshotError(msg)
+    if source_digest is not None and digest != bytes.fromhex(source_digest):
+        msg = "Snapshot was written for different source content"
+        raise SnapshotError(msg)
+
+    count, blob_len = _TABLE.unpack(f.read(_TABLE.size))
+    strings = f.read(blob_len).decode("utf-8").split("\x00") if count else []
+    if len(strings) != count:
+        msg = "Snapshot string table is corrupt"
+        raise SnapshotError(msg)
+
+    version = (major, minor, patch)
+    schema = get_schema(version)
+
+    # Rebuilding allocates many small container objects at once; the cyclic
+    # collector only adds overhead here.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _read_objects(f, strings, schema, version, filepath)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _read_objects(
+    f: IO[bytes],
+    strings: list[str],
+    schema: EpJSONSchema,
+    version: tuple[int, int, int],
+    filepath: Path | None,
+) -> IDFDocument:
+    from idfkit.document import IDFDocument
+    from idfkit.objects import IDFObject
+
+    doc = IDFDocument(version=version, schema=schema, filepath=filepath)
+    register = doc.references.register
+
+    (type_count,) = struct.unpack("<I", f.read(4))
+    for _ in range(type_count):
+        counts: tuple[int, ...] = _TYPE_BLOCK.unpack(f.read(_TYPE_BLOCK.size))
+        type_idx, n_objects, n_fields, n_order, n_str, n_int, n_float, n_json = counts
+        obj_type = strings[type_idx]
+        names: array[int] = _read_array(f, "I", n_objects)
+        field_counts: array[int] = _read_array(f, "I", n_objects)
+        order_counts: array[int] = _read_array(f, "i", n_objects)
+        key_ids: array[int] = _read_array(f, "I", n_fields)
+        keys = [strings[i] for i in key_ids]
+        kinds: array[int] = _read_array(f, "B", n_fields)
+        str_ids: array[int] = _read_array(f, "I", n_str)
+        ints: list[int] = _read_array(f, "q", n_int).tolist()
+        floats: list[float] = _read_array(f, "d", n_float).tolist()
+        json_ids: array[int] = _read_array(f, "I", n_json)
+        take: tuple[Callable[[], Any], ...] = (
+            iter([strings[i] for i in str_ids]).__next__,
+            iter(ints).__next__,
+            iter(floats).__next__,
+            iter([json.loads(strings[i]) for i in json_ids]).__next__,
+        )
+        values = [take[kind]() for kind in kinds]
+        order_ids: array[int] = _read_array(f, "I", n_order)
+        order_iter = iter([strings[i] for i in order_ids])
+
+        pc = schema.get_parsing_cache(obj_type)
+        obj_schema = pc.obj_schema if pc is not None else None
+        ref_fields = pc.ref_fields if pc is not None else None
+
+        collection = doc[obj_type]
+        add_to_collection = collection.add
+        objects: list[IDFObject] = []
+        pos = 0
+        for name_idx, n_data, n_fo in zip(names, field_counts, order_counts, strict=True):
+            end = pos + n_data
+            obj = IDFObject(
+                obj_type=obj_type,
+                name=strings[name_idx],
+                data=dict(zip(keys[pos:end], values[pos:end], strict=True)),
+                schema=obj_schema,
+                document=doc,
+                field_order=None if n_fo < 0 else list(islice(order_iter, n_fo)),
+                ref_fields=ref_fields,
+            )
+            add_to_collection(obj)
+            objects.append(obj)
+            pos = end
+
+        (n_refs,) = struct.unpack("<I", f.read(4))
+        ref_objects: array[int] = _read_array(f, "I", n_refs)
+        ref_names: array[int] = _read_array(f, "I", n_refs)
+        ref_targets: array[int] = _read_array(f, "I", n_refs)
+        for obj_pos, field_idx, target_idx in zip(ref_objects, ref_names, ref_targets, strict=True):
+            register(objects[obj_pos], strings[field_idx], strings[target_idx])
+
+    return doc
+
+
+def default_snapshot_dir() -> Path:
+    """Return the per-user directory snapshots are written to by default."""
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "idfkit-mcp" / "snapshots"
+
+
+class SnapshotStore:
+    """Directory of snapshots named by source content hash.
+
+    The directory is pruned oldest-first whenever it grows past ``max_bytes``.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_SNAPSHOT_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path_for(self, digest: str, version: tuple[int, int, int] | None) -> Path:
+        """Return the snapshot file path for a source digest and version override."""
+        suffix = "auto" if version is None else "_".join(str(part) for part in version)
+        return self.directory / f"{digest}-{suffix}{SUFFIX}"
+
+    def load(self, digest: str, version: tuple[int, int, int] | None, filepath: Path) -> IDFDocument | None:
+        """Restore the snapshot for ``digest``, or return None if there is no usable one."""
+        path = self.path_for(digest, version)
+        try:
+            with path.open("rb") as f:
+                doc = read_snapshot(f, source_digest=digest, filepath=filepath)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning("Discarding unreadable snapshot %s", path, exc_info=True)
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)
+        return doc
+
+    def save(self, doc: IDFDocument, digest: str, version: tuple[int, int, int] | None) -> Path | None:
+        """Write a snapshot atomically and prune the directory. Returns the path, or None on failure."""
+        path = self.path_for(digest, version)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    write_snapshot(doc, f, digest)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except Exception:
+            logger.warning("Could not write snapshot %s", path, exc_info=True)
+            return None
+        self.prune()
+        return path
+
+    def prune(self) -> None:
+        """Delete least recently used snapshots until the directory fits ``max_bytes``."""
+        try:
+            files = [(p.stat(), p) for p in self.directory.glob(f"*{SUFFIX}")]
+        except OSError:
+            return
+        total = sum(stat.st_size for stat, _ in files)
+        for stat, path in sorted(files, key=lambda item: item[0].st_mtime):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
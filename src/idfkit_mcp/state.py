@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from idfkit import LATEST_VERSION, get_schema
 
@@ -13,12 +19,26 @@ if TYPE_CHECKING:
     from idfkit.schema import EpJSONSchema
     from idfkit.simulation.result import SimulationResult
 
+    from idfkit_mcp.indexes import ModelIndexes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SESSIONS = 64
+DEFAULT_SESSION_IDLE_TIMEOUT = 3600.0
+
+# Rough per-entry overheads (CPython, 64-bit) used by the footprint estimate.
+_OBJECT_OVERHEAD_BYTES = 200
+_REFERENCE_OVERHEAD_BYTES = 180
+
 
 @dataclass
 class ServerState:
     """Holds the active document, schema, and simulation result.
 
-    MCP stdio transport is single-threaded, so a module-level instance is safe.
+    With the stdio transport there is exactly one client, so a single
+    module-level instance is used. HTTP transports serve many clients from
+    one process; there each MCP session gets its own instance through
+    [SessionRegistry][idfkit_mcp.state.SessionRegistry].
     """
 
     document: IDFDocument | None = None
@@ -26,6 +46,17 @@ class ServerState:
     file_path: Path | None = None
     simulation_result: SimulationResult | None = None
     weather_file: Path | None = None
+    _indexes: ModelIndexes | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def indexes(self) -> ModelIndexes:
+        """Indexes over the active document, reset whenever the document is replaced."""
+        doc = self.require_model()
+        if self._indexes is None or self._indexes.doc is not doc:
+            from idfkit_mcp.indexes import ModelIndexes
+
+            self._indexes = ModelIndexes(doc)
+        return self._indexes
 
     def require_model(self) -> IDFDocument:
         """Return the active document or raise a descriptive error."""
@@ -56,11 +87,210 @@ class ServerState:
             raise RuntimeError(msg)
         return self.simulation_result
 
+    def memory_footprint(self) -> int:
+        """Return an estimate of the bytes held by this state's model."""
+        if self.document is None:
+            return 0
+        return estimate_document_size(self.document)
+
+
+def estimate_document_size(doc: IDFDocument) -> int:
+    """Estimate the in-memory size of a document in bytes.
+
+    Counts each object's slots, field dict, and field values, plus a fixed
+    cost per tracked reference. Shared schema data is not included. The
+    result is an estimate meant for capacity planning, not an exact figure.
+    """
+    total = sys.getsizeof(doc)
+    for collection in doc.collections.values():
+        total += sys.getsizeof(collection)
+        for obj in collection:
+            data = obj.data
+            total += _OBJECT_OVERHEAD_BYTES + sys.getsizeof(data) + sys.getsizeof(obj.name)
+            for value in data.values():
+                total += sys.getsizeof(value)
+    total += len(doc.references) * _REFERENCE_OVERHEAD_BYTES
+    return total
+
+
+@dataclass
+class _SessionEntry:
+    state: ServerState
+    session_ref: weakref.ref[Any]
+    created: float
+    last_access: float = field(default=0.0)
+
+
+class SessionRegistry:
+    """Per-session server states with an LRU cap and idle-time eviction.
+
+    States are keyed by the identity of the MCP session object. The least
+    recently used session is evicted when ``max_sessions`` is exceeded, and
+    any session idle for longer than ``idle_timeout`` seconds is dropped on
+    the next lookup. A state is also released as soon as its session object
+    is garbage collected (client disconnected).
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_timeout: float = DEFAULT_SESSION_IDLE_TIMEOUT,
+    ) -> None:
+        if max_sessions < 1:
+            msg = f"max_sessions must be at least 1, got {max_sessions}"
+            raise ValueError(msg)
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._entries: OrderedDict[int, _SessionEntry] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, session: object) -> ServerState:
+        """Return the state for ``session``, creating it if needed."""
+        key = id(session)
+        now = time.monotonic()
+        evicted: list[tuple[int, _SessionEntry, str]] = []
+        with self._lock:
+            evicted += self._evict_idle(now)
+            entry = self._entries.get(key)
+            if entry is not None and entry.session_ref() is not session:
+                # The id was recycled by a new session object.
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                entry = _SessionEntry(
+                    state=ServerState(),
+                    session_ref=weakref.ref(session, lambda _ref, key=key: self._discard(key, _ref)),
+                    created=now,
+                )
+                self._entries[key] = entry
+                evicted += self._evict_over_capacity()
+                logger.debug("Created state for session %x (%d active)", key, len(self._entries))
+            else:
+                self._entries.move_to_end(key)
+            entry.last_access = now
+        # Sizing an evicted model walks all of it, so it is done after the lock is released.
+        for evicted_key, evicted_entry, reason in evicted:
+            self._log_eviction(evicted_key, evicted_entry, reason)
+        return entry.state
 
-# Module-level singleton
+    def stats(self) -> list[dict[str, Any]]:
+        """Return per-session age, idle time, and estimated memory footprint.
+
+        Meant for operators: the entries identify other clients' sessions, so
+        no tool exposes them.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entries = list(self._entries.items())
+        return [
+            {
+                "session": f"{key:x}",
+                "age_seconds": round(now - entry.created, 1),
+                "idle_seconds": round(now - entry.last_access, 1),
+                "model_loaded": entry.state.document is not None,
+                "estimated_bytes": entry.state.memory_footprint(),
+            }
+            for key, entry in entries
+        ]
+
+    def summary(self) -> dict[str, Any]:
+        """Return aggregate counts over all sessions, without identifying any of them."""
+        with self._lock:
+            states = [entry.state for entry in self._entries.values()]
+        return {
+            "active_sessions": len(states),
+            "models_loaded": sum(state.document is not None for state in states),
+            "total_estimated_bytes": sum(state.memory_footprint() for state in states),
+        }
+
+    def clear(self) -> None:
+        """Drop every session state."""
+        with self._lock:
+            self._entries.clear()
+
+    def _discard(self, key: int, ref: weakref.ref[Any]) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.session_ref is ref:
+                del self._entries[key]
+                logger.debug("Released state for closed session %x", key)
+
+    def _evict_idle(self, now: float) -> list[tuple[int, _SessionEntry, str]]:
+        evicted: list[tuple[int, _SessionEntry, str]] = []
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if now - entry.last_access <= self.idle_timeout:
+                break
+            del self._entries[key]
+            evicted.append((key, entry, "idle"))
+        return evicted
+
+    def _evict_over_capacity(self) -> list[tuple[int, _SessionEntry, str]]:
+        evicted: list[tuple[int, _SessionEntry, str]] = []
+        while len(self._entries) > self.max_sessions:
+            key, entry = self._entries.popitem(last=False)
+            evicted.append((key, entry, "capacity"))
+        return evicted
+
+    @staticmethod
+    def _log_eviction(key: int, entry: _SessionEntry, reason: str) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Evicted session %x (%s); released ~%d bytes",
+                key,
+                reason,
+                entry.state.memory_footprint(),
+            )
+
+
+# Module-level singleton used when no session registry is configured (stdio)
 _state = ServerState()
+_sessions: SessionRegistry | None = None
+
+
+def configure_sessions(
+    max_sessions: int = DEFAULT_MAX_SESSIONS,
+    idle_timeout: float = DEFAULT_SESSION_IDLE_TIMEOUT,
+) -> SessionRegistry:
+    """Enable per-session state, as used by the HTTP transports."""
+    global _sessions
+    _sessions = SessionRegistry(max_sessions=max_sessions, idle_timeout=idle_timeout)
+    return _sessions
+
+
+def disable_sessions() -> None:
+    """Return to the single module-level state."""
+    global _sessions
+    _sessions = None
+
+
+def get_sessions() -> SessionRegistry | None:
+    """Return the session registry, or None when a single state is shared."""
+    return _sessions
+
+
+def _current_session() -> object | None:
+    """Return the MCP session handling the current request, if any."""
+    from mcp.server.lowlevel.server import request_ctx
+
+    try:
+        return request_ctx.get().session
+    except LookupError:
+        return None
 
 
 def get_state() -> ServerState:
-    """Return the module-level server state."""
-    return _state
+    """Return the server state for the current MCP session.
+
+    Falls back to the module-level state when per-session state is disabled
+    or when called outside of a request.
+    """
+    if _sessions is None:
+        return _state
+    session = _current_session()
+    if session is None:
+        return _state
+    return _sessions.get(session)
@@ -9,7 +9,8 @@ from typing import Any
 from mcp.server.fastmcp import FastMCP
 
 from idfkit_mcp.errors import format_error
-from idfkit_mcp.serializers import serialize_object
+from idfkit_mcp.indexes import NameIndex, SummaryIndex, TokenIndex
+from idfkit_mcp.serializers import project_object, serialize_object
 from idfkit_mcp.state import get_state
 
 
@@ -32,15 +33,22 @@ def register(mcp: FastMCP) -> None:
     mcp.tool()(get_model_summary)
     mcp.tool()(list_objects)
     mcp.tool()(get_object)
+    mcp.tool()(get_objects)
     mcp.tool()(search_objects)
+    mcp.tool()(query_objects)
     mcp.tool()(get_references)
+    mcp.tool()(get_zone_geometry)
 
 
 @_safe_tool
 def load_model(file_path: str, version: str | None = None) -> dict[str, Any]:
     """Load an IDF or epJSON file as the active model.
 
-    Auto-detects format by file extension (.idf or .epjson/.json).
+    Auto-detects format by file extension (.idf or .epjson/.json), also
+    when compressed with gzip or Zstandard (e.g. ``model.idf.gz``,
+    ``model.epJSON.zst``). Parsed models are cached in memory and as
+    on-disk snapshots, so reloading an unchanged file is fast;
+    ``load_source`` reports which path was taken.
 
     Args:
         file_path: Path to the IDF or epJSON file.
@@ -50,6 +58,9 @@ def load_model(file_path: str, version: str | None = None) -> dict[str, Any]:
 
     from idfkit import load_epjson, load_idf
 
+    from idfkit_mcp.compressed import decompressed, model_suffix
+    from idfkit_mcp.model_cache import get_model_cache
+
     state = get_state()
     path = Path(file_path)
     ver = None
@@ -57,17 +68,20 @@ def load_model(file_path: str, version: str | None = None) -> dict[str, Any]:
         parts = version.split(".")
         ver = (int(parts[0]), int(parts[1]), int(parts[2]))
 
-    if path.suffix.lower() in (".epjson", ".json"):
-        doc = load_epjson(str(path), version=ver)
-    else:
-        doc = load_idf(str(path), version=ver)
+    parse = load_epjson if model_suffix(path) in (".epjson", ".json") else load_idf
+
+    def loader() -> Any:
+        with decompressed(path) as plain:
+            return parse(str(plain), version=ver)
+
+    doc, source = get_model_cache().load(path, ver, loader)
 
     state.document = doc
     state.schema = doc.schema
     state.file_path = path
     state.simulation_result = None
 
-    return _build_summary(doc, state)
+    return {**_build_summary(doc, state), "load_source": source}
 
 
 @_safe_tool
@@ -82,15 +96,29 @@ def get_model_summary() -> dict[str, Any]:
 
 
 @_safe_tool
-def list_objects(object_type: str, limit: int = 50) -> dict[str, Any]:
+def list_objects(
+    object_type: str,
+    limit: int = 50,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+    count_only: bool = False,
+) -> dict[str, Any]:
     """List objects of a given type from the loaded model.
 
-    Returns object names and required field values in brief format.
+    Returns object names and required field values in brief format, one
+    page at a time. Pass ``next_cursor`` from a response as ``cursor`` to
+    get the following page. Cursors are tied to ``model_version``; after
+    the model changes, an old cursor is rejected and listing restarts.
 
     Args:
         object_type: The EnergyPlus object type (e.g. "Zone").
         limit: Maximum number of objects to return (default 50).
+        cursor: Cursor from a previous response, to continue listing.
+        fields: Return only these fields per object (default: name and required fields).
+        count_only: If True, return only the total count.
     """
+    from idfkit_mcp.pagination import StaleCursorError, decode_cursor, encode_cursor
+
     state = get_state()
     doc = state.require_model()
 
@@ -99,9 +127,33 @@ def list_objects(object_type: str, limit: int = 50) -> dict[str, Any]:
 
     collection = doc[object_type]
     total = len(collection)
-    objects = [serialize_object(obj, schema=state.schema, brief=True) for obj in list(collection)[:limit]]
+    token = state.indexes.token
+    if count_only:
+        return {"object_type": object_type, "total": total, "model_version": token}
+
+    start = 0
+    if cursor is not None:
+        try:
+            start = decode_cursor(cursor, "list_objects", token, t=object_type)
+        except StaleCursorError as e:
+            return {"error": str(e), "stale_cursor": True, "model_version": token}
+
+    end = min(start + max(limit, 0), total)
+    page = (collection[i] for i in range(start, end))
+    if fields is not None:
+        objects = [project_object(obj, fields) for obj in page]
+    else:
+        objects = [serialize_object(obj, schema=state.schema, brief=True) for obj in page]
 
-    return {"object_type": object_type, "total": total, "returned": len(objects), "objects": objects}
+    next_cursor = encode_cursor("list_objects", end, token, t=object_type) if end < total else None
+    return {
+        "object_type": object_type,
+        "total": total,
+        "returned": len(objects),
+        "objects": objects,
+        "next_cursor": next_cursor,
+        "model_version": token,
+    }
 
 
 @_safe_tool
@@ -126,31 +178,126 @@ def get_object(object_type: str, name: str) -> dict[str, Any]:
     return serialize_object(obj)
 
 
+@_safe_tool
+def get_objects(
+    objects: list[dict[str, str]] | None = None,
+    object_type: str | None = None,
+    fields: list[str] | None = None,
+) -> dict[str, Any]:
+    """Get field values for many objects in one call.
+
+    Pass either ``objects``, a list of {"object_type", "name"} pairs, or
+    ``object_type`` to fetch every object of that type. Items that cannot
+    be found are reported individually and do not fail the call.
+
+    Args:
+        objects: Objects to fetch as [{"object_type": ..., "name": ...}].
+        object_type: Fetch all objects of this type instead.
+        fields: Return only these fields per object (default: all fields).
+    """
+    state = get_state()
+    doc = state.require_model()
+
+    if (objects is None) == (object_type is None):
+        return {"error": "Pass either 'objects' or 'object_type'."}
+
+    if fields is not None:
+        field_list = fields
+
+        def serialize(obj: Any) -> dict[str, Any]:
+            return project_object(obj, field_list)
+
+    else:
+        serialize = serialize_object
+
+    results: list[dict[str, Any]] = []
+    error_count = 0
+    if object_type is not None:
+        if object_type not in doc:
+            return {"error": f"No objects of type '{object_type}' in the model."}
+        results = [serialize(obj) for obj in doc[object_type]]
+    else:
+        collections = doc.collections
+        for i, spec in enumerate(objects or []):
+            obj_type = spec.get("object_type", "")
+            name = spec.get("name", "")
+            collection = collections.get(obj_type)
+            obj = collection.get(name) if collection is not None else None
+            if obj is None:
+                results.append({"index": i, "error": f"Object '{name}' not found in '{obj_type}'."})
+                error_count += 1
+            else:
+                results.append(serialize(obj))
+
+    return {"total": len(results), "found": len(results) - error_count, "errors": error_count, "results": results}
+
+
 @_safe_tool
 def search_objects(query: str, object_type: str | None = None, limit: int = 20) -> dict[str, Any]:
     """Search for objects by name or field values.
 
+    Name matches are listed before field-value matches; each match reports
+    the field that matched.
+
     Args:
         query: Search string (case-insensitive substring match on name and string fields).
         object_type: Optionally restrict search to a specific type.
         limit: Maximum results to return (default 20).
     """
     state = get_state()
-    doc = state.require_model()
-    query_lower = query.lower()
+    state.require_model()
+    index = state.indexes.get(TokenIndex)
 
-    matches: list[dict[str, Any]] = []
-    for obj in doc.all_objects:
-        if object_type is not None and obj.obj_type != object_type:
-            continue
-        if _matches_query(obj, query_lower):
-            matches.append({"object_type": obj.obj_type, "name": obj.name})
-            if len(matches) >= limit:
-                break
+    matches = [
+        {"object_type": obj.obj_type, "name": obj.name, "match": field_name}
+        for obj, field_name in index.search(query, object_type=object_type, limit=limit)
+    ]
 
     return {"query": query, "count": len(matches), "matches": matches}
 
 
+@_safe_tool
+def query_objects(
+    object_types: list[str] | None = None,
+    where: list[dict[str, Any]] | None = None,
+    fields: list[str] | None = None,
+    sort_by: str | None = None,
+    limit: int = 50,
+) -> dict[str, Any]:
+    """Find objects whose fields match all given predicates.
+
+    Each predicate is {"field": ..., "op": ..., "value": ...}. Operators:
+    eq, ne, in, not_in (list value), gt, gte, lt, lte, between ([low, high]),
+    contains, references (value is the referenced name; field optional),
+    is_empty, not_empty (no value). String comparisons ignore case and
+    numeric strings compare as numbers. Use field "name" for object names.
+
+    The response reports the plan used: an index lookup (name, reference
+    graph, or per-type field index) or a scan of the requested types.
+
+    Args:
+        object_types: Types to search (default: every type in the model).
+        where: Predicates that must all match (default: none).
+        fields: Fields to return per object (default: name and required fields).
+        sort_by: Field to sort by, prefixed with "-" for descending (default: type and name).
+        limit: Maximum number of objects to return (default 50).
+    """
+    from idfkit_mcp.query import Predicate, run_query, sort_objects
+
+    state = get_state()
+    doc = state.require_model()
+    predicates = [Predicate.parse(spec) for spec in where or []]
+
+    matched, plan = run_query(doc, state.indexes, object_types, predicates)
+    selected = sort_objects(matched, sort_by)[: max(limit, 0)]
+    if fields is not None:
+        objects = [project_object(obj, fields) for obj in selected]
+    else:
+        objects = [serialize_object(obj, schema=state.schema, brief=True) for obj in selected]
+
+    return {"total": len(matched), "returned": len(objects), "objects": objects, "plan": plan.to_dict()}
+
+
 @_safe_tool
 def get_references(name: str) -> dict[str, Any]:
     """Get bidirectional references for an object name.
@@ -169,7 +316,7 @@ def get_references(name: str) -> dict[str, Any]:
 
     # Find the object and get what it references
     references: list[str] = []
-    target_obj = _find_object_by_name(doc, name)
+    target_obj = state.indexes.get(NameIndex).first(name)
     if target_obj is not None:
         refs = doc.get_references(target_obj)
         references = sorted(refs)
@@ -183,43 +330,55 @@ def get_references(name: str) -> dict[str, Any]:
     }
 
 
-def _build_summary(doc: Any, state: Any) -> dict[str, Any]:
-    """Build a model summary dict."""
-    from idfkit import version_string
+@_safe_tool
+def get_zone_geometry(zones: list[str] | None = None) -> dict[str, Any]:
+    """Get floor area, volume, exterior wall area, and window-to-wall ratio per zone.
+
+    Metrics are computed from surface vertices, without a simulation, and
+    cached per zone until one of its surfaces or windows changes. Areas
+    are in m2 and volumes in m3, not multiplied by zone multipliers.
 
-    groups: dict[str, dict[str, int]] = {}
-    total_objects = 0
-    zone_count = 0
+    Args:
+        zones: Zone names to report (default: all zones).
+    """
+    from idfkit_mcp.geometry import ZoneGeometryIndex
 
-    for obj_type, collection in doc.items():
-        count = len(collection)
-        total_objects += count
-        if obj_type == "Zone":
-            zone_count = count
-        schema = state.schema
-        group = schema.get_group(obj_type) if schema else "Unknown"
-        group = group or "Ungrouped"
-        groups.setdefault(group, {})[obj_type] = count
+    state = get_state()
+    doc = state.require_model()
 
-    return {
-        "version": version_string(doc.version),
-        "file_path": str(state.file_path) if state.file_path else None,
-        "total_objects": total_objects,
-        "zone_count": zone_count,
-        "groups": {g: {"count": sum(v.values()), "types": v} for g, v in sorted(groups.items())},
+    all_zones = list(doc["Zone"]) if "Zone" in doc else []
+    if zones is None:
+        selected = all_zones
+    else:
+        by_name = {zone.name.upper(): zone for zone in all_zones}
+        missing = [name for name in zones if name.upper() not in by_name]
+        if missing:
+            return {"error": f"Zone(s) not found: {', '.join(missing)}."}
+        selected = [by_name[name.upper()] for name in zones]
+
+    index = state.indexes.get(ZoneGeometryIndex)
+    before = index.computed
+    metrics = [index.metrics(zone) for zone in selected]
+    totals: dict[str, float] = {
+        key: round(sum(m[key] for m in metrics), 4)
+        for key in ("floor_area", "volume", "roof_ceiling_area", "exterior_wall_area", "window_area")
     }
+    wall = totals["exterior_wall_area"]
+    totals["window_to_wall_ratio"] = round(totals["window_area"] / wall, 4) if wall else 0.0
+    return {"zones": metrics, "total": totals, "computed": index.computed - before}
 
 
-def _matches_query(obj: Any, query_lower: str) -> bool:
-    """Check if an object matches a search query."""
-    if query_lower in obj.name.lower():
-        return True
-    return any(isinstance(value, str) and query_lower in value.lower() for value in obj.data.values())
-
+def _build_summary(doc: Any, state: Any) -> dict[str, Any]:
+    """Build a model summary dict from the live summary counters."""
+    from idfkit import version_string
 
-def _find_object_by_name(doc: Any, name: str) -> Any:
-    """Find any object by name across all types."""
-    for obj in doc.all_objects:
-        if obj.name.upper() == name.upper():
-            return obj
-    return None
+    summary = state.indexes.get(SummaryIndex)
+    return {
+        "version": version_string(doc.version),
+        "file_path": str(state.file_path) if state.file_path else None,
+        "total_objects": summary.total,
+        "zone_count": summary.type_count("Zone"),
+        "groups": {
+            g: {"count": sum(types.values()), "types": dict(types)} for g, types in sorted(summary.groups().items())
+        },
+    }
@@ -9,7 +9,7 @@ from typing import Any
 from mcp.server.fastmcp import FastMCP
 
 from idfkit_mcp.errors import format_error
-from idfkit_mcp.serializers import serialize_object_description
+from idfkit_mcp.schema_cache import group_map, object_description
 from idfkit_mcp.state import get_state
 
 
@@ -41,6 +41,7 @@ def register(mcp: FastMCP) -> None:
     """Register schema tools on the MCP server."""
     mcp.tool()(list_object_types)
     mcp.tool()(describe_object_type)
+    mcp.tool()(describe_object_types)
     mcp.tool()(search_schema)
     mcp.tool()(get_available_references)
 
@@ -60,8 +61,7 @@ def list_object_types(group: str | None = None, version: str | None = None) -> d
     schema = state.get_or_load_schema(_parse_version(version))
 
     groups: dict[str, list[str]] = {}
-    for obj_type in schema.object_types:
-        g = schema.get_group(obj_type) or "Ungrouped"
+    for obj_type, g in group_map(schema).items():
         if group is not None and g.lower() != group.lower():
             continue
         groups.setdefault(g, []).append(obj_type)
@@ -83,75 +83,107 @@ def describe_object_type(object_type: str, version: str | None = None) -> dict[s
         object_type: The object type name (e.g. "Zone", "Material").
         version: EnergyPlus version as "X.Y.Z" (default: latest or loaded model version).
     """
-    from idfkit.introspection import describe_object_type as _describe
+    state = get_state()
+    schema = state.get_or_load_schema(_parse_version(version))
+    return object_description(schema, object_type)
+
+
+@_safe_tool
+def describe_object_types(object_types: list[str], version: str | None = None) -> dict[str, Any]:
+    """Get the field schemas of several EnergyPlus object types in one call.
+
+    Each description is the same as ``describe_object_type`` returns. Unknown
+    types are reported individually and do not fail the call.
 
+    Args:
+        object_types: The object type names (e.g. ["Zone", "People", "Lights"]).
+        version: EnergyPlus version as "X.Y.Z" (default: latest or loaded model version).
+    """
     state = get_state()
     schema = state.get_or_load_schema(_parse_version(version))
-    desc = _describe(schema, object_type)
-    return serialize_object_description(desc)
+
+    results: list[dict[str, Any]] = []
+    error_count = 0
+    for i, object_type in enumerate(object_types):
+        try:
+            results.append(object_description(schema, object_type))
+        except KeyError:
+            results.append({"index": i, "error": f"Unknown object type '{object_type}'."})
+            error_count += 1
+
+    return {"total": len(results), "found": len(results) - error_count, "errors": error_count, "results": results}
 
 
 @_safe_tool
-def search_schema(query: str, version: str | None = None) -> dict[str, Any]:
-    """Search for EnergyPlus object types by name or description.
+def search_schema(query: str, version: str | None = None, limit: int | None = None) -> dict[str, Any]:
+    """Search for EnergyPlus object types by name, description, or field.
+
+    Matches type names, memos, field names, and field notes, ranked best
+    first. Partial words and small typos still match. An empty query
+    returns every type.
 
     Args:
-        query: Search string (case-insensitive substring match).
+        query: Search words (case-insensitive), e.g. "ideal loads" or "infiltration".
         version: EnergyPlus version as "X.Y.Z" (default: latest or loaded model version).
+        limit: Maximum number of matches to return (default: all).
     """
+    from idfkit_mcp.schema_search import search_index
+
     state = get_state()
     schema = state.get_or_load_schema(_parse_version(version))
-    query_lower = query.lower()
+    if query.strip():
+        ranked = search_index(schema).search(query)
+    else:
+        ranked = [(obj_type, 0.0) for obj_type in schema.object_types]
+    groups = group_map(schema)
 
     matches: list[dict[str, Any]] = []
-    for obj_type in schema.object_types:
+    for obj_type, score in ranked if limit is None else ranked[: max(limit, 0)]:
         memo = schema.get_object_memo(obj_type) or ""
-        if query_lower in obj_type.lower() or query_lower in memo.lower():
-            group = schema.get_group(obj_type) or "Ungrouped"
-            matches.append({
-                "object_type": obj_type,
-                "group": group,
-                "memo": memo[:200] if memo else None,
-            })
+        matches.append({
+            "object_type": obj_type,
+            "group": groups.get(obj_type, "Ungrouped"),
+            "memo": memo[:200] if memo else None,
+            "score": round(score, 3),
+        })
 
-    return {"query": query, "count": len(matches), "matches": matches}
+    return {"query": query, "count": len(ranked), "returned": len(matches), "matches": matches}
 
 
 @_safe_tool
-def get_available_references(object_type: str, field_name: str) -> dict[str, Any]:
+def get_available_references(
+    object_type: str, field_name: str, prefix: str = "", limit: int = 100, offset: int = 0
+) -> dict[str, Any]:
     """Get valid object names for a reference field from the loaded model.
 
     Use this to find valid values when setting reference fields like zone_name,
-    construction_name, etc.
+    construction_name, etc. Names are sorted case-insensitively and returned
+    one page at a time; ``total`` is the number of matching names.
 
     Args:
         object_type: The object type containing the field.
         field_name: The field name to check.
+        prefix: Only return names starting with this text (case-insensitive).
+        limit: Maximum number of names to return (default 100).
+        offset: Number of matching names to skip, for the following pages.
     """
+    from idfkit_mcp.indexes import ReferenceListIndex
+
     state = get_state()
-    doc = state.require_model()
+    state.require_model()
     schema = state.require_schema()
 
     object_lists = schema.get_field_object_list(object_type, field_name)
     if not object_lists:
         return {"error": f"Field '{field_name}' on '{object_type}' is not a reference field."}
 
-    available: dict[str, list[str]] = {}
-    for list_name in object_lists:
-        provider_types = schema.get_types_providing_reference(list_name)
-        names: list[str] = []
-        for ptype in provider_types:
-            if ptype in doc:
-                for obj in doc[ptype]:
-                    if obj.name:
-                        names.append(obj.name)
-        if names:
-            available[list_name] = sorted(names)
-
-    all_names = sorted({n for names in available.values() for n in names})
+    index = state.indexes.get(ReferenceListIndex)
+    total, names, available = index.available(object_lists, prefix, max(offset, 0), max(limit, 0))
     return {
         "object_type": object_type,
         "field_name": field_name,
-        "available_names": all_names,
+        "total": total,
+        "returned": len(names),
+        "available_names": names,
         "by_reference_list": available,
     }
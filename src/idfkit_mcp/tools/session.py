@@ -0,0 +1,58 @@
+"""Session introspection tools."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from mcp.server.fastmcp import FastMCP
+
+from idfkit_mcp.errors import format_error
+from idfkit_mcp.state import get_sessions, get_state
+
+
+def _safe_tool(func: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, Any]]:
+    """Convert exceptions into MCP-friendly error dicts."""
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            return format_error(e)
+
+    return wrapper
+
+
+def register(mcp: FastMCP) -> None:
+    """Register session tools on the MCP server."""
+    mcp.tool()(get_session_info)
+
+
+@_safe_tool
+def get_session_info() -> dict[str, Any]:
+    """Report memory use of this session and aggregate usage of the server's session pool.
+
+    On HTTP transports every client session keeps its own model. The pool
+    section gives the number of sessions and their combined estimated model
+    size, so the session cap can be sized; other sessions are not listed.
+    """
+    state = get_state()
+    result: dict[str, Any] = {
+        "model_loaded": state.document is not None,
+        "estimated_bytes": state.memory_footprint(),
+    }
+
+    registry = get_sessions()
+    if registry is None:
+        result["per_session_state"] = False
+        return result
+
+    result["per_session_state"] = True
+    result["pool"] = {
+        **registry.summary(),
+        "max_sessions": registry.max_sessions,
+        "idle_timeout_seconds": registry.idle_timeout,
+    }
+    return result
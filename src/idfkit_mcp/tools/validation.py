@@ -2,33 +2,76 @@
 
 from __future__ import annotations
 
-from typing import Any
+import itertools
+from collections import Counter
+from typing import TYPE_CHECKING, Any
 
+from idfkit.validation import Severity
 from mcp.server.fastmcp import FastMCP
 
 from idfkit_mcp.errors import format_error
-from idfkit_mcp.serializers import serialize_validation_result
+from idfkit_mcp.indexes import DanglingReferenceIndex, NameIndex
+from idfkit_mcp.serializers import serialize_validation_error
 from idfkit_mcp.state import get_state
 
+if TYPE_CHECKING:
+    from idfkit.validation import ValidationError, ValidationResult
+
+    from idfkit_mcp.state import ServerState
+
+
+# Severities reported for each ``severity`` level, most severe first.
+_LEVELS = {
+    "error": (Severity.ERROR,),
+    "warning": (Severity.ERROR, Severity.WARNING),
+    "info": (Severity.ERROR, Severity.WARNING, Severity.INFO),
+}
+
+# ``group_by`` values and the ValidationError attribute each groups on.
+_GROUP_ATTRS = {"code": "code", "object_type": "obj_type"}
+
+_DEFAULT_PAGE_SIZE = 100
+
 
 def register(mcp: FastMCP) -> None:
     """Register validation tools on the MCP server."""
 
     @mcp.tool()
-    def validate_model(object_types: list[str] | None = None, check_references: bool = True) -> dict[str, Any]:
+    def validate_model(
+        object_types: list[str] | None = None,
+        check_references: bool = True,
+        incremental: bool = False,
+        workers: int = 1,
+        severity: str = "warning",
+        max_errors: int | None = None,
+        group_by: str | None = None,
+        cursor: str | None = None,
+        stop_early: bool = False,
+    ) -> dict[str, Any]:
         """Validate the loaded model against the EnergyPlus schema.
 
+        Issues are returned in pages when ``max_errors`` or ``cursor`` is given.
+        Pass ``next_cursor`` from a response as ``cursor`` to get the next page;
+        cursors are tied to ``model_version``.
+
         Args:
             object_types: Only validate specific types (default: all).
             check_references: Whether to check reference integrity (default: True).
+            incremental: Only revalidate objects changed since the previous incremental run,
+                reusing earlier results for the rest. The first run validates everything.
+            workers: Validate object types in this many worker processes (0: one per CPU).
+                Speeds up full validation of large models; ignored when incremental.
+            severity: Lowest severity to report: "error", "warning" (default), or "info".
+            max_errors: Maximum number of issues to return per page.
+            group_by: Also return issue counts grouped by "code" or "object_type".
+            cursor: Cursor from a previous response, to continue listing issues.
+            stop_early: Stop validating once the page is full instead of checking the whole
+                model. Requires max_errors; counts then cover only the issues found so far.
         """
         try:
-            from idfkit import validate_document
-
-            state = get_state()
-            doc = state.require_model()
-            result = validate_document(doc, check_references=check_references, object_types=object_types)
-            return serialize_validation_result(result)
+            return _validate_model(
+                object_types, check_references, incremental, workers, severity, max_errors, group_by, cursor, stop_early
+            )
         except Exception as e:
             return format_error(e)
 
@@ -40,16 +83,10 @@ def register(mcp: FastMCP) -> None:
         """
         try:
             state = get_state()
-            doc = state.require_model()
-
-            valid_names: set[str] = set()
-            for collection in doc.collections.values():
-                for obj in collection:
-                    if obj.name:
-                        valid_names.add(obj.name.upper())
+            state.require_model()
 
             dangling: list[dict[str, str]] = []
-            for obj, field_name, target in doc.references.get_dangling_references(valid_names):
+            for obj, field_name, target in state.indexes.get(DanglingReferenceIndex).references():
                 dangling.append({
                     "source_type": obj.obj_type,
                     "source_name": obj.name,
@@ -60,3 +97,139 @@ def register(mcp: FastMCP) -> None:
             return {"dangling_count": len(dangling), "dangling_references": dangling}
         except Exception as e:
             return format_error(e)
+
+
+def _validate_model(
+    object_types: list[str] | None,
+    check_references: bool,
+    incremental: bool,
+    workers: int,
+    severity: str,
+    max_errors: int | None,
+    group_by: str | None,
+    cursor: str | None,
+    stop_early: bool,
+) -> dict[str, Any]:
+    from idfkit_mcp.pagination import StaleCursorError, decode_cursor, encode_cursor
+
+    state = get_state()
+    state.require_model()
+    problem = _check_options(severity, group_by, max_errors, stop_early)
+    if problem is not None:
+        return {"error": problem}
+
+    token = state.indexes.token
+    # Incremental and early-stopping runs order issues differently from full ones.
+    pinned = {
+        "s": severity,
+        "t": object_types or [],
+        "r": check_references,
+        "i": incremental and not stop_early,
+        "x": stop_early,
+    }
+    start = 0
+    if cursor is not None:
+        try:
+            start = decode_cursor(cursor, "validate_model", token, **pinned)
+        except StaleCursorError as e:
+            return {"error": str(e), "stale_cursor": True, "model_version": token}
+    paged = max_errors is not None or cursor is not None
+    end = start + (max_errors or _DEFAULT_PAGE_SIZE)
+
+    levels = _LEVELS[severity]
+    if stop_early:
+        issues, more = _scan(state, object_types, check_references, levels, end)
+        response = _summary(issues, complete=not more)
+    else:
+        result, response = _run(state, object_types, check_references, incremental, workers)
+        issues = [i for i in (*result.errors, *result.warnings, *result.info) if i.severity in levels]
+        more = end < len(issues)
+    page = issues[start:end] if paged else issues
+
+    response.update(_issue_lists(page, severity))
+    if group_by is not None:
+        response["groups"] = _groups(issues, group_by)
+    if paged:
+        next_cursor = encode_cursor("validate_model", end, token, **pinned) if more else None
+        response.update({"returned": len(page), "next_cursor": next_cursor, "model_version": token})
+    return response
+
+
+def _check_options(severity: str, group_by: str | None, max_errors: int | None, stop_early: bool) -> str | None:
+    if severity not in _LEVELS:
+        return f"Unknown severity '{severity}'. Use one of: {', '.join(_LEVELS)}."
+    if group_by is not None and group_by not in _GROUP_ATTRS:
+        return f"Unknown group_by '{group_by}'. Use one of: {', '.join(_GROUP_ATTRS)}."
+    if max_errors is not None and max_errors < 1:
+        return "max_errors must be at least 1."
+    if stop_early and max_errors is None:
+        return "stop_early needs max_errors."
+    return None
+
+
+def _run(
+    state: ServerState, object_types: list[str] | None, check_references: bool, incremental: bool, workers: int
+) -> tuple[ValidationResult, dict[str, Any]]:
+    """Validate the whole model; return the result and the response fields describing it."""
+    from idfkit_mcp.validation_cache import ValidationCache
+    from idfkit_mcp.validation_pool import validate_parallel
+
+    doc = state.require_model()
+    if incremental:
+        cache = state.indexes.get(ValidationCache)
+        result = cache.validate(state.indexes, object_types=object_types, check_references=check_references)
+        return result, {**_summary([*result.errors, *result.warnings, *result.info]), "revalidated": cache.revalidated}
+    # Every worker count, including 1, goes through the same path so issues come back in the same order.
+    result = validate_parallel(doc, state.indexes.get(NameIndex), workers, object_types, check_references)
+    return result, _summary([*result.errors, *result.warnings, *result.info])
+
+
+def _scan(
+    state: ServerState,
+    object_types: list[str] | None,
+    check_references: bool,
+    levels: tuple[Severity, ...],
+    limit: int,
+) -> tuple[list[ValidationError], bool]:
+    """Validate in model order until ``limit`` issues at ``levels`` are found.
+
+    Returns the issues found and whether the model holds more.
+    """
+    from idfkit_mcp.validation_pool import iter_issues
+
+    doc = state.require_model()
+    found = iter_issues(doc, state.indexes.get(NameIndex), object_types, check_references)
+    issues = list(itertools.islice((i for i in found if i.severity in levels), limit + 1))
+    return issues[:limit], len(issues) > limit
+
+
+def _summary(issues: list[ValidationError], complete: bool = True) -> dict[str, Any]:
+    """Return ``is_valid`` and counts by severity; ``is_valid`` is None while errors may remain unseen."""
+    counts = Counter(i.severity for i in issues)
+    errors = counts[Severity.ERROR]
+    response: dict[str, Any] = {
+        "is_valid": False if errors else (True if complete else None),
+        "error_count": errors,
+        "warning_count": counts[Severity.WARNING],
+        "info_count": counts[Severity.INFO],
+    }
+    if not complete:
+        response["complete"] = False
+    return response
+
+
+def _issue_lists(issues: list[ValidationError], severity: str) -> dict[str, list[dict[str, Any]]]:
+    lists: dict[str, list[dict[str, Any]]] = {"errors": [], "warnings": []}
+    if severity == "info":
+        lists["info"] = []
+    keys = {Severity.ERROR: "errors", Severity.WARNING: "warnings", Severity.INFO: "info"}
+    for issue in issues:
+        lists[keys[issue.severity]].append(serialize_validation_error(issue))
+    return lists
+
+
+def _groups(issues: list[ValidationError], group_by: str) -> list[dict[str, Any]]:
+    """Count ``issues`` per code or object type, most frequent first."""
+    attr = _GROUP_ATTRS[group_by]
+    counts = Counter(getattr(i, attr) for i in issues)
+    return [{group_by: key, "count": n} for key, n in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))]
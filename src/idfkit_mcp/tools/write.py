@@ -8,7 +8,10 @@ from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
+from idfkit_mcp.edits import add_objects, remove_objects
 from idfkit_mcp.errors import format_error
+from idfkit_mcp.indexes import NameIndex
+from idfkit_mcp.journal import Journal
 from idfkit_mcp.serializers import serialize_object
 from idfkit_mcp.state import get_state
 
@@ -26,16 +29,39 @@ def _safe_tool(func: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, A
     return wrapper
 
 
+def _journaled(func: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, Any]]:
+    """Record the changes a write tool makes as one undoable journal entry."""
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        state = get_state()
+        if state.document is None:
+            return func(*args, **kwargs)
+        with state.indexes.get(Journal).group(func.__name__):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
 def register(mcp: FastMCP) -> None:
     """Register write tools on the MCP server."""
     mcp.tool()(new_model)
     mcp.tool()(add_object)
     mcp.tool()(batch_add_objects)
     mcp.tool()(update_object)
+    mcp.tool()(batch_update_objects)
     mcp.tool()(remove_object)
+    mcp.tool()(batch_remove_objects)
     mcp.tool()(rename_object)
+    mcp.tool()(batch_rename_objects)
     mcp.tool()(duplicate_object)
+    mcp.tool()(transform_geometry)
+    mcp.tool()(replicate_zone)
     mcp.tool()(save_model)
+    mcp.tool()(undo)
+    mcp.tool()(redo)
+    mcp.tool()(checkpoint)
+    mcp.tool()(restore)
 
 
 @_safe_tool
@@ -63,6 +89,7 @@ def new_model(version: str | None = None) -> dict[str, Any]:
 
 
 @_safe_tool
+@_journaled
 def add_object(object_type: str, name: str = "", fields: dict[str, Any] | None = None) -> dict[str, Any]:
     """Add a new object to the model.
 
@@ -77,25 +104,35 @@ def add_object(object_type: str, name: str = "", fields: dict[str, Any] | None =
     doc = state.require_model()
     kwargs = fields or {}
     obj = doc.add(object_type, name, **kwargs)
+    state.indexes.added(obj)
     return serialize_object(obj)
 
 
 @_safe_tool
-def batch_add_objects(objects: list[dict[str, Any]]) -> dict[str, Any]:
+@_journaled
+def batch_add_objects(objects: list[dict[str, Any]], atomic: bool = False) -> dict[str, Any]:
     """Add multiple objects to the model in a single call.
 
     Critical for efficiency — creating a building zone-by-zone requires many objects.
     Each entry should have: object_type (required), name (optional), fields (optional).
-    Continues on individual failures and reports per-object results.
+    By default, continues on individual failures and reports per-object results.
+
+    With atomic=True the whole batch is validated before anything is added:
+    either every object is added or none is. Objects may reference each
+    other in any order. References that match no object after the batch
+    are listed in ``unresolved_references``.
 
     Args:
         objects: List of dicts with keys: object_type, name, fields.
+        atomic: If True, add all objects or none (default False).
     """
     state = get_state()
     doc = state.require_model()
+    if atomic:
+        return _batch_add_atomic(state, doc, objects)
 
     results: list[dict[str, Any]] = []
-    success_count = 0
+    added: list[Any] = []
     error_count = 0
 
     for i, spec in enumerate(objects):
@@ -109,16 +146,90 @@ def batch_add_objects(objects: list[dict[str, Any]]) -> dict[str, Any]:
             obj_name: str = spec.get("name", "")
             obj_fields: dict[str, Any] = spec.get("fields") or {}
             obj = doc.add(obj_type, obj_name, **obj_fields)
+            added.append(obj)
             results.append({"index": i, **serialize_object(obj, brief=True)})
-            success_count += 1
         except Exception as e:
             results.append({"index": i, "error": str(e)})
             error_count += 1
 
-    return {"total": len(objects), "success": success_count, "errors": error_count, "results": results}
+    state.indexes.added_many(added)
+    return {"total": len(objects), "success": len(added), "errors": error_count, "results": results}
+
+
+def _batch_add_atomic(state: Any, doc: Any, objects: list[dict[str, Any]]) -> dict[str, Any]:
+    """Stage and validate a batch in a scratch document, then add it all at once.
+
+    Staging catches schema errors, duplicate names, and singleton clashes
+    before the model is touched, so the commit itself cannot fail halfway.
+    """
+    from idfkit.document import IDFDocument
+
+    from idfkit_mcp.indexes import NameIndex
+
+    scratch = IDFDocument(version=doc.version, schema=doc.schema)
+    staged: list[Any] = []
+    errors: list[dict[str, Any]] = []
+    for i, spec in enumerate(objects):
+        try:
+            obj_type = spec.get("object_type")
+            if not obj_type:
+                errors.append({"index": i, "error": "Missing 'object_type'"})
+                continue
+            obj_name: str = spec.get("name", "")
+            obj_fields: dict[str, Any] = spec.get("fields") or {}
+            obj = scratch.add(obj_type, obj_name, **obj_fields)
+            _check_fits(doc, obj)
+            staged.append(obj)
+        except Exception as e:
+            errors.append({"index": i, "error": str(e)})
+
+    if errors:
+        return {
+            "status": "rolled_back",
+            "total": len(objects),
+            "success": 0,
+            "errors": len(errors),
+            "results": errors,
+        }
+
+    added: list[Any] = []
+    try:
+        for obj in staged:
+            added.append(doc.addidfobject(obj))
+    except Exception:
+        for obj in reversed(added):
+            doc.removeidfobject(obj)
+        raise
+    state.indexes.added_many(added)
+
+    names = state.indexes.get(NameIndex)
+    unresolved = sorted({target for obj in added for target in doc.get_references(obj) if target not in names})
+    return {
+        "status": "committed",
+        "total": len(objects),
+        "success": len(added),
+        "errors": 0,
+        "results": [{"index": i, **serialize_object(obj, brief=True)} for i, obj in enumerate(added)],
+        "unresolved_references": unresolved,
+    }
+
+
+def _check_fits(doc: Any, obj: Any) -> None:
+    """Raise if ``obj`` clashes with a name or singleton already in ``doc``."""
+    from idfkit.exceptions import DuplicateObjectError
+
+    collection = doc.collections.get(obj.obj_type)
+    if not collection:
+        return
+    if obj.name and obj.name.upper() in collection.by_name:
+        raise DuplicateObjectError(obj.obj_type, obj.name)
+    obj_schema = doc.schema.get_object_schema(obj.obj_type) if doc.schema else None
+    if obj_schema and obj_schema.get("maxProperties") == 1:
+        raise DuplicateObjectError(obj.obj_type, collection.first().name or obj.obj_type)
 
 
 @_safe_tool
+@_journaled
 def update_object(object_type: str, name: str, fields: dict[str, Any]) -> dict[str, Any]:
     """Update fields on an existing object.
 
@@ -137,13 +248,67 @@ def update_object(object_type: str, name: str, fields: dict[str, Any]) -> dict[s
     if obj is None:
         return {"error": f"Object '{name}' not found in '{object_type}'."}
 
-    for field_name, value in fields.items():
-        setattr(obj, field_name, value)
-
+    _apply_fields(state, obj, fields)
     return serialize_object(obj)
 
 
 @_safe_tool
+@_journaled
+def batch_update_objects(updates: list[dict[str, Any]], fields: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Update fields on many objects in a single call.
+
+    Every target and field name is checked before anything changes: if
+    any entry is invalid, no object is updated. If setting a value fails
+    part-way, the objects already updated are restored. Use
+    batch_rename_objects to change names.
+
+    Args:
+        updates: List of dicts with keys: object_type, name, fields.
+        fields: Field values applied to every entry; an entry's own fields take precedence.
+    """
+    from idfkit_mcp.schema_cache import field_names, is_known_field
+
+    state = get_state()
+    doc = state.require_model()
+    shared: dict[str, Any] = fields or {}
+
+    targets: list[tuple[Any, dict[str, Any]]] = []
+    errors: list[dict[str, Any]] = []
+    for i, spec in enumerate(updates):
+        obj_type: str = spec.get("object_type", "")
+        name: str = spec.get("name", "")
+        own: dict[str, Any] = spec.get("fields") or {}
+        values = {**shared, **own}
+        obj = _lookup(doc, obj_type, name)
+        if obj is None:
+            errors.append({"index": i, "error": f"Object '{name}' not found in '{obj_type}'."})
+            continue
+        if not values:
+            errors.append({"index": i, "error": "No fields to update."})
+            continue
+        known = field_names(doc.schema, obj.obj_type) if doc.schema is not None else None
+        bad = [f for f in values if f.lower() == "name" or (known is not None and not is_known_field(known, f))]
+        if bad:
+            errors.append({"index": i, "error": f"Cannot update field(s) {', '.join(bad)} on '{obj.obj_type}'."})
+            continue
+        targets.append((obj, values))
+
+    if errors:
+        return {"status": "rolled_back", "total": len(updates), "updated": 0, "errors": len(errors), "results": errors}
+
+    _apply_all(state, targets)
+
+    return {
+        "status": "committed",
+        "total": len(updates),
+        "updated": len(targets),
+        "errors": 0,
+        "results": [{"index": i, "status": "updated"} for i in range(len(targets))],
+    }
+
+
+@_safe_tool
+@_journaled
 def remove_object(object_type: str, name: str, force: bool = False) -> dict[str, Any]:
     """Remove an object from the model.
 
@@ -174,11 +339,104 @@ def remove_object(object_type: str, name: str, force: bool = False) -> dict[str,
                 "referenced_by": refs,
             }
 
-    doc.removeidfobject(obj)
+    remove_objects(doc, [obj])
+    state.indexes.removed(obj)
     return {"status": "removed", "object_type": object_type, "name": name}
 
 
 @_safe_tool
+@_journaled
+def batch_remove_objects(
+    objects: list[dict[str, str]] | None = None,
+    object_type: str | None = None,
+    force: bool = False,
+    skip_referenced: bool = False,
+) -> dict[str, Any]:
+    """Remove many objects in a single call.
+
+    Pass either ``objects``, a list of {"object_type", "name"} pairs, or
+    ``object_type`` to target every object of that type. References are
+    checked for the whole set at once; references between objects that
+    are removed together do not count.
+
+    By default nothing is removed if any target is missing or still
+    referenced. With skip_referenced=True, referenced targets are skipped
+    and the rest removed (e.g. purging unused schedules). With force=True,
+    targets are removed even if referenced.
+
+    Args:
+        objects: Objects to remove as [{"object_type": ..., "name": ...}].
+        object_type: Remove every object of this type instead.
+        force: Remove referenced objects too.
+        skip_referenced: Skip referenced objects instead of failing.
+    """
+    state = get_state()
+    doc = state.require_model()
+
+    if (objects is None) == (object_type is None):
+        return {"error": "Pass either 'objects' or 'object_type'."}
+
+    # Each target keeps the index of its entry in ``objects`` for the results.
+    targets: list[tuple[int, Any]] = []
+    errors: list[dict[str, Any]] = []
+    if object_type is not None:
+        collection = doc.collections.get(object_type)
+        targets = list(enumerate(collection)) if collection is not None else []
+    else:
+        for i, spec in enumerate(objects or []):
+            obj = _lookup(doc, spec.get("object_type", ""), spec.get("name", ""))
+            if obj is None:
+                errors.append({
+                    "index": i,
+                    "error": f"Object '{spec.get('name', '')}' not found in '{spec.get('object_type', '')}'.",
+                })
+            else:
+                targets.append((i, obj))
+
+    referenced = _external_references(doc, [obj for _, obj in targets])
+    if not force and not skip_referenced:
+        errors.extend(
+            {"index": i, "error": "Object is referenced by other objects.", "referenced_by": referenced[id(obj)]}
+            for i, obj in targets
+            if id(obj) in referenced
+        )
+    total = len(objects) if objects is not None else len(targets)
+    if errors:
+        errors.sort(key=lambda error: error["index"])
+        return {
+            "status": "rolled_back",
+            "total": total,
+            "removed": 0,
+            "errors": len(errors),
+            "results": errors,
+        }
+
+    keep = skip_referenced and not force
+    doomed = [obj for _, obj in targets if not (keep and id(obj) in referenced)]
+    results = [
+        {
+            "index": i,
+            "object_type": obj.obj_type,
+            "name": obj.name,
+            "status": "skipped" if keep and id(obj) in referenced else "removed",
+        }
+        for i, obj in targets
+    ]
+    remove_objects(doc, doomed)
+    state.indexes.removed_many(doomed)
+
+    return {
+        "status": "committed",
+        "total": total,
+        "removed": len(doomed),
+        "skipped": len(targets) - len(doomed),
+        "errors": 0,
+        "results": results,
+    }
+
+
+@_safe_tool
+@_journaled
 def rename_object(object_type: str, old_name: str, new_name: str) -> dict[str, Any]:
     """Rename an object and update all references to it.
 
@@ -190,10 +448,12 @@ def rename_object(object_type: str, old_name: str, new_name: str) -> dict[str, A
     state = get_state()
     doc = state.require_model()
 
+    obj = doc[object_type][old_name]
     referencing_before = doc.get_referencing(old_name)
     ref_count = len(referencing_before)
 
     doc.rename(object_type, old_name, new_name)
+    state.indexes.renamed(obj, old_name, referencing_before)
 
     return {
         "status": "renamed",
@@ -205,6 +465,72 @@ def rename_object(object_type: str, old_name: str, new_name: str) -> dict[str, A
 
 
 @_safe_tool
+@_journaled
+def batch_rename_objects(
+    renames: list[dict[str, str]] | None = None,
+    pattern: str | None = None,
+    replacement: str = "",
+    object_type: str | None = None,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Rename many objects in one call and update all references to them.
+
+    Pass either explicit ``renames`` or a regex ``pattern`` with a
+    ``replacement`` template (``re.sub`` syntax, e.g. ``"^Zone_(\\d+)$"`` ->
+    ``"ZN_\\1"``), optionally limited to one ``object_type``. All new names
+    are computed and checked for collisions before anything changes; swaps
+    are allowed. If any rename is invalid, no object is renamed.
+
+    Args:
+        renames: Renames as [{"object_type": ..., "old_name": ..., "new_name": ...}].
+        pattern: Regular expression selecting the names to rewrite.
+        replacement: Replacement template for names matching ``pattern``.
+        object_type: Restrict ``pattern`` to this object type.
+        dry_run: Only report the planned renames.
+    """
+    from idfkit_mcp.renaming import apply_renames, check_renames, explicit_renames, rule_renames
+
+    state = get_state()
+    doc = state.require_model()
+
+    if (renames is None) == (pattern is None):
+        return {"error": "Pass either 'renames' or 'pattern'."}
+    if renames is not None:
+        plan, missing = explicit_renames(doc, renames)
+    else:
+        plan, missing = rule_renames(doc, pattern or "", replacement, object_type), []
+    errors = missing + check_renames(doc, plan)
+
+    results: list[dict[str, Any]] = [
+        {"object_type": obj.obj_type, "old_name": obj.name, "new_name": new_name} for obj, new_name in plan
+    ]
+    if errors:
+        return {
+            "status": "rolled_back",
+            "total": len(plan) + len(missing),
+            "renamed": 0,
+            "errors": len(errors),
+            "results": [error.to_dict() for error in errors],
+        }
+    if dry_run:
+        return {"status": "dry_run", "total": len(plan), "renamed": 0, "results": results}
+
+    applied = apply_renames(doc, plan)
+    state.indexes.renamed_many(applied.renamed, applied.rewritten)
+    for entry in results:
+        entry["references_updated"] = applied.references[entry["old_name"].upper()]
+
+    return {
+        "status": "renamed",
+        "total": len(plan),
+        "renamed": len(plan),
+        "references_updated": len(applied.rewritten),
+        "results": results,
+    }
+
+
+@_safe_tool
+@_journaled
 def duplicate_object(object_type: str, name: str, new_name: str) -> dict[str, Any]:
     """Duplicate an existing object with a new name.
 
@@ -217,23 +543,150 @@ def duplicate_object(object_type: str, name: str, new_name: str) -> dict[str, An
     doc = state.require_model()
 
     obj = doc.copyidfobject(doc[object_type][name], new_name=new_name)
+    state.indexes.added(obj)
     return serialize_object(obj)
 
 
 @_safe_tool
-def save_model(file_path: str | None = None, output_format: str = "idf") -> dict[str, Any]:
+@_journaled
+def transform_geometry(
+    translate: list[float] | None = None,
+    rotate: float = 0.0,
+    scale: float | list[float] | None = None,
+    mirror: str | None = None,
+    anchor: list[float] | None = None,
+    zones: list[str] | None = None,
+) -> dict[str, Any]:
+    """Move, rotate, mirror, or scale surface geometry in one call.
+
+    The operations are combined into one transform and applied to every
+    vertex of the building, fenestration, and shading surfaces: mirror,
+    scale, and rotate about ``anchor``, then translate. Only vertex
+    coordinates change; zone origins and the building north axis are kept.
+
+    Args:
+        translate: Offset [dx, dy, dz] in meters.
+        rotate: Rotation about the vertical axis in degrees, counter-clockwise seen from above.
+        scale: Uniform factor, or per-axis factors [sx, sy, sz].
+        mirror: Axis to reflect through the anchor: "x", "y", or "z". Vertex loops are
+            reversed so surfaces still face outward.
+        anchor: Point [x, y, z] the rotation, scale, and mirror are about (default: origin).
+        zones: Only transform these zones' surfaces and the windows and shading on them.
+    """
+    from idfkit_mcp.geometry import affine_matrix, is_mirroring, transform_surfaces, vertex_count, vertex_surfaces
+
+    state = get_state()
+    doc = state.require_model()
+
+    matrix = affine_matrix(translate, rotate, scale, mirror, anchor)
+    changed, skipped = transform_surfaces(vertex_surfaces(doc, zones), matrix)
+    state.indexes.updated_many(changed)
+
+    result: dict[str, Any] = {
+        "status": "transformed",
+        "surfaces": len(changed),
+        "vertices": sum(vertex_count(old_values) for _, old_values in changed),
+        "reversed_vertex_order": is_mirroring(matrix),
+    }
+    if skipped:
+        result["skipped"] = [{"object_type": obj.obj_type, "name": obj.name} for obj in skipped]
+    return result
+
+
+@_safe_tool
+@_journaled
+def replicate_zone(
+    zone: str,
+    count: int,
+    offset: list[float] | None = None,
+    name_pattern: str = "{zone} {n}",
+    start: int = 1,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Copy a zone and everything that belongs to it several times.
+
+    Copies the zone with its surfaces, windows, internal loads, controls,
+    and equipment connections, plus objects they reference whose names
+    contain the zone name. Shared objects such as schedules and
+    constructions are reused. In each copy the zone name is replaced by the
+    new zone name in object names and text fields such as node names.
+    Nothing is added if any new name is already taken.
+
+    Args:
+        zone: Name of the zone to copy.
+        count: Number of copies.
+        offset: Displacement [dx, dy, dz] in meters between consecutive copies; copy n moves n times it.
+        name_pattern: Name of each new zone, with {zone} for the source name and {n} for the copy number.
+        start: Number of the first copy.
+        dry_run: If True, report what would be created without changing the model.
+    """
+    from idfkit_mcp.geometry import affine_matrix
+    from idfkit_mcp.replication import plan_replicas, zone_objects
+
+    state = get_state()
+    doc = state.require_model()
+
+    source = doc["Zone"].get(zone) if "Zone" in doc else None
+    if source is None:
+        return {"error": f"Zone '{zone}' not found."}
+    if count < 1:
+        return {"error": "count must be at least 1."}
+    step = list(offset) if offset is not None else [0.0, 0.0, 0.0]
+    affine_matrix(translate=step)  # validates the offset
+    try:
+        zone_names = [name_pattern.format(zone=source.name, n=n) for n in range(start, start + count)]
+    except (KeyError, IndexError, ValueError) as exc:
+        return {"error": f"Invalid name_pattern '{name_pattern}': {exc}. Use {{zone}} and {{n}}."}
+
+    names = state.indexes.get(NameIndex)
+    members = zone_objects(doc, source, names)
+    offsets = [[c * (n - start + 1) for c in step] for n in range(start, start + count)]
+    plan = plan_replicas(doc, members, zone_names, offsets, names)
+
+    types: dict[str, int] = {}
+    for obj in members:
+        types[obj.obj_type] = types.get(obj.obj_type, 0) + 1
+    result: dict[str, Any] = {
+        "zone": source.name,
+        "zones": zone_names,
+        "objects_per_zone": len(members),
+        "types": types,
+    }
+    if plan.conflicts:
+        return {
+            **result,
+            "error": f"{len(plan.conflicts)} new name(s) already exist; nothing was added.",
+            "conflicts": plan.conflicts[:20],
+        }
+    if dry_run:
+        return {**result, "status": "dry_run", "objects_added": 0}
+
+    add_objects(doc, plan.objects)
+    state.indexes.added_many(plan.objects)
+    return {**result, "status": "replicated", "objects_added": len(plan.objects)}
+
+
+@_safe_tool
+def save_model(file_path: str | None = None, output_format: str | None = None) -> dict[str, Any]:
     """Save the model to a file.
 
+    Only objects changed since the previous save are serialized again, and
+    the output is streamed to a temporary file that atomically replaces the
+    target. Saving an unchanged model to the file it was last saved to
+    skips the write. Paths ending in ``.gz`` or ``.zst`` (e.g.
+    ``model.idf.gz``, ``model.epJSON.zst``) are compressed.
+
     Args:
         file_path: Output path. If None, uses the original load path.
-        output_format: Output format: "idf" or "epjson".
+        output_format: Output format: "idf" or "epjson" (default: from the file extension).
     """
     from pathlib import Path
 
-    from idfkit import write_epjson, write_idf
+    from idfkit_mcp.compressed import compression_of, model_suffix
+    from idfkit_mcp.saving import ENCODINGS, SerializationCache, write_atomic
 
     state = get_state()
-    doc = state.require_model()
+    state.require_model()
 
     if file_path is not None:
         path = Path(file_path)
@@ -242,10 +695,153 @@ def save_model(file_path: str | None = None, output_format: str = "idf") -> dict
     else:
         return {"error": "No file path specified and no original path available."}
 
-    if output_format.lower() == "epjson":
-        write_epjson(doc, path)
-    else:
-        write_idf(doc, path)
+    if output_format is None:
+        output_format = "epjson" if model_suffix(path) in (".epjson", ".json") else "idf"
+    fmt = "epjson" if output_format.lower() == "epjson" else "idf"
+    cache = state.indexes.get(SerializationCache)
+    token = state.indexes.token
+    result = {"status": "saved", "file_path": str(path), "format": fmt, "compression": compression_of(path)}
+    if cache.is_saved(path, fmt, token):
+        state.file_path = path
+        return {**result, "unchanged": True, "objects_serialized": 0, "bytes": path.stat().st_size}
+
+    before = cache.misses
+    size = write_atomic(path, cache.chunks(fmt), ENCODINGS[fmt])
+    cache.mark_saved(path, fmt, token)
 
     state.file_path = path
-    return {"status": "saved", "file_path": str(path), "format": output_format}
+    return {**result, "unchanged": False, "objects_serialized": cache.misses - before, "bytes": size}
+
+
+@_safe_tool
+def undo(steps: int = 1) -> dict[str, Any]:
+    """Undo the most recent write tool calls.
+
+    Each call of a write tool (add, update, remove, rename, ...) is one
+    step, however many objects it changed.
+
+    Args:
+        steps: Number of calls to undo.
+    """
+    state = get_state()
+    state.require_model()
+    journal = state.indexes.get(Journal)
+    available = len(journal.undo_labels())
+    if not 1 <= steps <= max(available, 1):
+        return {"error": f"Cannot undo {steps} step(s); {available} available."}
+    undone = [journal.undo(state.indexes) for _ in range(steps)]
+    return {"status": "undone", "undone": undone, **_history(journal)}
+
+
+@_safe_tool
+def redo(steps: int = 1) -> dict[str, Any]:
+    """Redo write tool calls reverted by undo or restore.
+
+    Redo is only possible until the next edit.
+
+    Args:
+        steps: Number of calls to redo.
+    """
+    state = get_state()
+    state.require_model()
+    journal = state.indexes.get(Journal)
+    available = len(journal.redo_labels())
+    if not 1 <= steps <= max(available, 1):
+        return {"error": f"Cannot redo {steps} step(s); {available} available."}
+    redone = [journal.redo(state.indexes) for _ in range(steps)]
+    return {"status": "redone", "redone": redone, **_history(journal)}
+
+
+@_safe_tool
+def checkpoint(name: str) -> dict[str, Any]:
+    """Mark the current model state so it can be restored later.
+
+    Args:
+        name: Checkpoint name; an existing checkpoint with this name is replaced.
+    """
+    state = get_state()
+    state.require_model()
+    journal = state.indexes.get(Journal)
+    journal.checkpoint(name)
+    return {"status": "checkpoint", "name": name, **_history(journal)}
+
+
+@_safe_tool
+def restore(name: str) -> dict[str, Any]:
+    """Return the model to a checkpoint by undoing or redoing edits since then.
+
+    Args:
+        name: Checkpoint name given to checkpoint.
+    """
+    state = get_state()
+    state.require_model()
+    journal = state.indexes.get(Journal)
+    undone, redone = journal.restore(name, state.indexes)
+    return {"status": "restored", "name": name, "undone": undone, "redone": redone, **_history(journal)}
+
+
+def _apply_fields(state: Any, obj: Any, fields: dict[str, Any]) -> None:
+    """Set field values on ``obj`` and report the change to the model indexes.
+
+    A ``name`` key renames the object, updating references to it.
+    """
+    from idfkit.objects import to_python_name
+
+    doc = state.require_model()
+    old_values: dict[str, Any] = {}
+    for field_name, value in fields.items():
+        if field_name.lower() == "name":
+            old_name = obj.name
+            referencing = doc.get_referencing(old_name)
+            obj.name = value
+            state.indexes.renamed(obj, old_name, referencing)
+            continue
+        key = to_python_name(field_name)
+        old_values.setdefault(key, obj.data.get(key))
+        setattr(obj, field_name, value)
+    state.indexes.updated(obj, old_values)
+
+
+def _apply_all(state: Any, targets: list[tuple[Any, dict[str, Any]]]) -> None:
+    """Apply each ``(obj, fields)`` pair, restoring the objects already changed if one fails."""
+    from idfkit.objects import to_python_name
+
+    from idfkit_mcp.edits import set_fields
+
+    applied: list[tuple[Any, dict[str, Any]]] = []
+    try:
+        for obj, values in targets:
+            applied.append((obj, {to_python_name(key): obj.data.get(to_python_name(key)) for key in values}))
+            _apply_fields(state, obj, values)
+    except Exception:
+        for obj, before in reversed(applied):
+            state.indexes.updated(obj, set_fields(obj, before))
+        raise
+
+
+def _history(journal: Journal) -> dict[str, Any]:
+    return {
+        "undo_available": len(journal.undo_labels()),
+        "redo_available": len(journal.redo_labels()),
+        "journal_bytes": journal.size,
+    }
+
+
+def _lookup(doc: Any, obj_type: str, name: str) -> Any:
+    """Return the object of ``obj_type`` named ``name``, or None."""
+    collection = doc.collections.get(obj_type)
+    return collection.get(name) if collection is not None else None
+
+
+def _external_references(doc: Any, targets: list[Any]) -> dict[int, list[dict[str, str]]]:
+    """Map each referenced target to the objects outside ``targets`` that reference it."""
+    inside = {id(obj) for obj in targets}
+    get_referencing = doc.references.get_referencing_with_fields
+    found: dict[int, list[dict[str, str]]] = {}
+    for obj in targets:
+        if not obj.name:
+            continue
+        refs = {(ref.obj_type, ref.name): None for ref, _ in get_referencing(obj.name) if id(ref) not in inside}
+        if refs:
+            found[id(obj)] = [{"object_type": t, "name": n} for t, n in sorted(refs)]
+    return found
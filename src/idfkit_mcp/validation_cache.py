@@ -0,0 +1,193 @@
+"""Incremental validation for ``validate_model(incremental=True)``.
+
+The first run validates every object the way ``validate_document`` does
+and keeps the issues found per object. From then on the write tools'
+change notifications mark objects dirty, and a run only revalidates those:
+
+- an added or updated object is checked again against the schema and for
+  dangling references;
+- adding, removing, or renaming an object re-checks the references of
+  the objects that refer to its old or new name, since they may have
+  started or stopped dangling.
+
+Singleton (one instance per type) checks are cheap and redone every run.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from idfkit.validation import Severity, ValidationError, ValidationResult, validate_object
+
+from idfkit_mcp.indexes import ModelIndex, NameIndex
+
+if TYPE_CHECKING:
+    from idfkit.document import IDFDocument
+    from idfkit.objects import IDFObject
+    from idfkit.schema import EpJSONSchema
+
+    from idfkit_mcp.indexes import ModelIndexes
+
+
+class ValidationCache(ModelIndex):
+    """Validation issues per object, refreshed for the objects changed since the last run."""
+
+    # Dropping the cache after a bulk change would force a full revalidation;
+    # marking the changed objects dirty is cheap.
+    rebuildable = False
+
+    def __init__(self, doc: IDFDocument) -> None:
+        super().__init__(doc)
+        self._schema_issues: dict[int, list[ValidationError]] = {}
+        self._ref_issues: dict[int, list[ValidationError]] = {}
+        self._dirty: dict[int, IDFObject] = {}
+        self._ref_dirty: dict[int, IDFObject] = {}
+        self._primed = False
+        self.revalidated = 0
+
+    def validate(
+        self, indexes: ModelIndexes, object_types: list[str] | None = None, check_references: bool = True
+    ) -> ValidationResult:
+        """Return the same issues as ``validate_document``, revalidating only dirty objects.
+
+        Issues are ordered by object type and name rather than model order.
+        """
+        doc = self.doc
+        schema = doc.schema
+        if schema is None:
+            msg = "The model has no schema to validate against."
+            raise ValueError(msg)
+        names = indexes.get(NameIndex)
+        if not self._primed:
+            self._prime(schema, names)
+        else:
+            self.revalidated = len(self._dirty) + len(self._ref_dirty.keys() - self._dirty.keys())
+            for key, obj in self._dirty.items():
+                _store(self._schema_issues, key, validate_object(obj, schema))
+                _store(self._ref_issues, key, _dangling(doc, obj, names))
+            for key, obj in self._ref_dirty.items():
+                if key not in self._dirty:
+                    _store(self._ref_issues, key, _dangling(doc, obj, names))
+            self._dirty.clear()
+            self._ref_dirty.clear()
+
+        wanted = {t.upper() for t in object_types} if object_types else None
+        issues = singleton_issues(doc, schema, object_types or list(doc.collections))
+        issues += sorted(
+            (
+                i
+                for errs in self._schema_issues.values()
+                for i in errs
+                if wanted is None or i.obj_type.upper() in wanted
+            ),
+            key=_order,
+        )
+        if check_references:
+            issues += sorted((i for errs in self._ref_issues.values() for i in errs), key=_order)
+        result = ValidationResult([], [], [])
+        for issue in issues:
+            bucket(result, issue.severity).append(issue)
+        return result
+
+    def _prime(self, schema: EpJSONSchema, names: NameIndex) -> None:
+        doc = self.doc
+        self.revalidated = 0
+        for obj in doc.all_objects:
+            _store(self._schema_issues, id(obj), validate_object(obj, schema))
+            self.revalidated += 1
+        # One pass over the reference graph is cheaper than a lookup per object.
+        missing: dict[int, tuple[IDFObject, list[tuple[str, str]]]] = {}
+        for obj, field_name, target in doc.references.get_dangling_references(names.upper_names()):
+            missing.setdefault(id(obj), (obj, []))[1].append((field_name, target))
+        self._ref_issues = {key: reference_errors(obj, refs) for key, (obj, refs) in missing.items()}
+        self._primed = True
+
+    def object_added(self, obj: IDFObject) -> None:
+        self._mark(obj)
+        self._mark_referencing(obj.name)
+
+    def object_removed(self, obj: IDFObject) -> None:
+        key = id(obj)
+        for store in (self._schema_issues, self._ref_issues, self._dirty, self._ref_dirty):
+            store.pop(key, None)
+        self._mark_referencing(obj.name)
+
+    def object_renamed(self, obj: IDFObject, old_name: str, referencing: Iterable[IDFObject]) -> None:
+        self._mark(obj)
+        self._mark_referencing(old_name)
+        self._mark_referencing(obj.name)
+        for other in referencing:
+            self._mark(other)
+
+    def object_updated(self, obj: IDFObject, old_values: dict[str, Any]) -> None:
+        self._mark(obj)
+
+    def _mark(self, obj: IDFObject) -> None:
+        if self._primed:
+            self._dirty[id(obj)] = obj
+
+    def _mark_referencing(self, name: str) -> None:
+        if self._primed and name:
+            for obj in self.doc.get_referencing(name):
+                self._ref_dirty[id(obj)] = obj
+
+
+def _dangling(doc: IDFDocument, obj: IDFObject, names: NameIndex) -> list[ValidationError]:
+    refs = doc.references.get_references_with_fields(obj)
+    return reference_errors(obj, [(field_name, target) for target, field_name in refs if target not in names])
+
+
+def reference_errors(obj: IDFObject, missing: list[tuple[str, str]]) -> list[ValidationError]:
+    return [
+        ValidationError(
+            severity=Severity.ERROR,
+            obj_type=obj.obj_type,
+            obj_name=obj.name,
+            field=field_name,
+            message=f"Reference to non-existent object '{target}'",
+            code="E009",
+        )
+        for field_name, target in sorted(missing)
+    ]
+
+
+def singleton_issues(doc: IDFDocument, schema: Any, object_types: list[str]) -> list[ValidationError]:
+    issues: list[ValidationError] = []
+    for obj_type in object_types:
+        if obj_type not in doc.collections:
+            continue
+        obj_schema = schema.get_object_schema(obj_type)
+        count = len(doc[obj_type])
+        if obj_schema and obj_schema.get("maxProperties") == 1 and count > 1:
+            first = doc[obj_type].first()
+            issues.append(
+                ValidationError(
+                    severity=Severity.ERROR,
+                    obj_type=obj_type,
+                    obj_name=first.name if first and first.name else obj_type,
+                    field=None,
+                    message=f"Singleton type '{obj_type}' has {count} instances (maximum 1 allowed)",
+                    code="E010",
+                )
+            )
+    return issues
+
+
+def _store(store: dict[int, list[ValidationError]], key: int, issues: list[ValidationError]) -> None:
+    if issues:
+        store[key] = issues
+    else:
+        store.pop(key, None)
+
+
+def _order(issue: ValidationError) -> tuple[str, str, str]:
+    return issue.obj_type.upper(), issue.obj_name.upper(), issue.field or ""
+
+
+def bucket(result: ValidationResult, severity: Severity) -> list[ValidationError]:
+    if severity == Severity.ERROR:
+        return result.errors
+    if severity == Severity.WARNING:
+        return result.warnings
+    return result.info
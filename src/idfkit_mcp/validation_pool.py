@@ -0,0 +1,190 @@
+"""Whole-model validation split across worker processes.
+
+``validate_model(workers=N)`` groups the model's objects by type into
+chunks and validates the chunks in a process pool. Only each object's type,
+name, and field values are sent to a worker; the schema is never pickled.
+Every worker loads the schema for the model's version once, through
+idfkit's schema cache, and keeps it for the life of the pool.
+
+Singleton and reference checks need the whole model and run in the parent
+after the chunks are merged. Chunks are merged in submission order and each
+object's issues are ordered by field, so the result does not depend on the
+number of workers or on the order in which chunks finish.
+
+``iter_issues`` yields the same issues in the same order from the server
+process, one object at a time, for callers that stop after the first few.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any
+
+from idfkit import get_schema
+from idfkit.objects import IDFObject
+from idfkit.validation import ValidationError, ValidationResult, validate_object
+
+from idfkit_mcp.validation_cache import bucket, reference_errors, singleton_issues
+
+if TYPE_CHECKING:
+    from idfkit.document import IDFDocument
+
+    from idfkit_mcp.indexes import NameIndex
+
+# Objects per task: large enough that pickling and scheduling stay small
+# next to the validation work, small enough to balance the largest types.
+_CHUNK_OBJECTS = 2000
+
+# Below this many objects, starting work in other processes costs more than it saves.
+_MIN_PARALLEL_OBJECTS = 4 * _CHUNK_OBJECTS
+
+Chunk = list[tuple[str, list[tuple[str, dict[str, Any]]]]]
+
+_lock = threading.Lock()
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+
+
+def validate_parallel(
+    doc: IDFDocument,
+    names: NameIndex,
+    workers: int,
+    object_types: list[str] | None = None,
+    check_references: bool = True,
+) -> ValidationResult:
+    """Validate ``doc`` like ``validate_document``, with schema checks spread over ``workers`` processes.
+
+    Args:
+        doc: The document to validate.
+        names: The document's name index, used for the reference checks.
+        workers: Number of worker processes; 0 uses one per CPU, 1 validates in this process.
+        object_types: Only validate these types (default: all).
+        check_references: Whether to check reference integrity.
+    """
+    schema = doc.schema
+    if schema is None:
+        msg = "The model has no schema to validate against."
+        raise ValueError(msg)
+    if workers < 0:
+        msg = f"workers must be 0 or more, got {workers}."
+        raise ValueError(msg)
+    types = [t for t in (object_types or list(doc.collections)) if t in doc.collections]
+    chunks = _chunks(doc, types)
+
+    issues = singleton_issues(doc, schema, types)
+    total = sum(len(items) for chunk in chunks for _, items in chunk)
+    # Workers load the schema by version, so a document carrying any other schema is validated here.
+    if workers == 1 or total < _MIN_PARALLEL_OBJECTS or schema is not get_schema(doc.version):
+        results = [_validate_chunk(schema, chunk) for chunk in chunks]
+    else:
+        results = _map(workers or os.cpu_count() or 1, doc.version, chunks)
+    for chunk_issues in results:
+        issues += chunk_issues
+
+    if check_references:
+        for obj, field_name, target in doc.references.get_dangling_references(names.upper_names()):
+            issues += reference_errors(obj, [(field_name, target)])
+
+    result = ValidationResult([], [], [])
+    for issue in issues:
+        bucket(result, issue.severity).append(issue)
+    return result
+
+
+def iter_issues(
+    doc: IDFDocument, names: NameIndex, object_types: list[str] | None = None, check_references: bool = True
+) -> Iterator[ValidationError]:
+    """Yield the issues of ``validate_parallel`` lazily, in the same order.
+
+    Objects are validated as the issues are consumed, so a caller that stops
+    early does not pay for the rest of the model.
+    """
+    schema = doc.schema
+    if schema is None:
+        msg = "The model has no schema to validate against."
+        raise ValueError(msg)
+    types = [t for t in (object_types or list(doc.collections)) if t in doc.collections]
+    yield from singleton_issues(doc, schema, types)
+    for obj_type in types:
+        for obj in doc[obj_type]:
+            yield from _sorted_issues(validate_object(obj, schema))
+    if check_references:
+        for obj, field_name, target in doc.references.get_dangling_references(names.upper_names()):
+            yield from reference_errors(obj, [(field_name, target)])
+
+
+def shutdown_pool() -> None:
+    """Stop the worker processes, if any were started."""
+    global _pool, _pool_workers
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+        _pool_workers = 0
+
+
+def _chunks(doc: IDFDocument, types: list[str]) -> list[Chunk]:
+    """Split the objects of ``types`` into chunks of about ``_CHUNK_OBJECTS``, in model order.
+
+    Small types share a chunk; large ones are split across several.
+    """
+    chunks: list[Chunk] = []
+    current: Chunk = []
+    size = 0
+    for obj_type in types:
+        items = [(obj.name, obj.data) for obj in doc[obj_type]]
+        for start in range(0, len(items), _CHUNK_OBJECTS):
+            part = items[start : start + _CHUNK_OBJECTS]
+            if size + len(part) > _CHUNK_OBJECTS and current:
+                chunks.append(current)
+                current, size = [], 0
+            current.append((obj_type, part))
+            size += len(part)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _validate_chunk(schema: Any, chunk: Chunk) -> list[ValidationError]:
+    issues: list[ValidationError] = []
+    for obj_type, items in chunk:
+        for name, data in items:
+            issues += _sorted_issues(validate_object(IDFObject(obj_type, name, data), schema))
+    return issues
+
+
+def _sorted_issues(issues: list[ValidationError]) -> list[ValidationError]:
+    # validate_object walks required fields as a set, whose order varies between processes.
+    return sorted(issues, key=lambda issue: issue.field or "")
+
+
+def _worker_validate(version: tuple[int, int, int], chunk: Chunk) -> list[ValidationError]:
+    """Worker entry point: validate ``chunk`` against the worker's own copy of the schema."""
+    return _validate_chunk(get_schema(version), chunk)
+
+
+def _map(workers: int, version: tuple[int, int, int], chunks: list[Chunk]) -> list[list[ValidationError]]:
+    pool = _get_pool(workers)
+    try:
+        return list(pool.map(_worker_validate, [version] * len(chunks), chunks))
+    except BrokenProcessPool:
+        # A worker died (out of memory, killed); start a fresh pool next time.
+        shutdown_pool()
+        raise
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    with _lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            # "spawn" rather than "fork": the server runs threads, which fork does not copy safely.
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _pool_workers = workers
+        return _pool
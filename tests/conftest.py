@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 from idfkit import new_document
 
+from idfkit_mcp.model_cache import get_model_cache
 from idfkit_mcp.state import ServerState, get_state
 
 
@@ -17,6 +18,7 @@ def _reset_state() -> None:
     state.file_path = None
     state.simulation_result = None
     state.weather_file = None
+    get_model_cache().clear()
 
 
 @pytest.fixture()
@@ -0,0 +1,36 @@
+"""Tests for the wrapped idfkit writer internals used by incremental saving."""
+
+from __future__ import annotations
+
+import json
+from importlib.metadata import version
+
+from idfkit import new_document, write_epjson, write_idf
+
+from idfkit_mcp.idfkit_writers import SUPPORTED_IDFKIT, epjson_formatter, idf_formatter, version_identifier
+
+
+def _doc():
+    doc = new_document()
+    doc.add("Zone", "Office", x_origin=1.5)
+    doc.add("Output:Variable", "", variable_name="Zone Mean Air Temperature")
+    return doc
+
+
+def test_installed_idfkit_is_supported() -> None:
+    installed = tuple(int(part) for part in version("idfkit").split(".")[:2])
+    assert installed == SUPPORTED_IDFKIT
+
+
+def test_idf_formatter_matches_write_idf() -> None:
+    doc = _doc()
+    text = write_idf(doc)
+    assert f"  {version_identifier(doc)};" in text
+    assert idf_formatter(doc)(doc["Zone"]["Office"]) in text
+
+
+def test_epjson_formatter_matches_write_epjson() -> None:
+    doc = _doc()
+    written = json.loads(write_epjson(doc))
+    assert written["Version"]["Version 1"]["version_identifier"] == version_identifier(doc)
+    assert epjson_formatter(doc)(doc["Zone"]["Office"]) == written["Zone"]["Office"]
@@ -0,0 +1,262 @@
+"""Tests for the incrementally maintained model indexes."""
+
+from __future__ import annotations
+
+from idfkit import new_document
+
+from idfkit_mcp.indexes import ModelIndexes, NameIndex, ReferenceListIndex, SummaryIndex, TokenIndex
+from idfkit_mcp.schema_cache import group_map
+from idfkit_mcp.state import ServerState
+
+
+def _tool(name: str):
+    from idfkit_mcp.server import mcp
+
+    return mcp._tool_manager._tools[name]
+
+
+class TestNameIndex:
+    def test_build_from_document(self) -> None:
+        doc = new_document()
+        zone = doc.add("Zone", "Office")
+        index = NameIndex(doc)
+        assert index.first("office") is zone
+        assert "OFFICE" in index
+        assert index.first("Missing") is None
+
+    def test_same_name_across_types(self) -> None:
+        doc = new_document()
+        zone = doc.add("Zone", "Shared")
+        schedule = doc.add("ScheduleTypeLimits", "Shared")
+        index = NameIndex(doc)
+        assert index.find("shared") == [zone, schedule]
+
+    def test_several_lists_partial_page(self) -> None:
+        doc = new_document()
+        for name in ("Atrium", "Office", "Store"):
+            doc.add("Zone", name)
+            doc.add("Space", name, zone_name=name)
+        doc.add("ZoneList", "Offices", zone_1_name="Office", validate=False)
+        index = ReferenceListIndex(doc)
+        lists = ["SpaceAndSpaceListNames", "ZoneAndZoneListNames"]
+        total, names, by_list = index.available(lists, offset=1, limit=1)
+        assert (total, names) == (4, ["Office"])
+        assert by_list == {"SpaceAndSpaceListNames": ["Office"], "ZoneAndZoneListNames": ["Office"]}
+        assert index.available(lists, prefix="o", limit=1)[:2] == (2, ["Office"])
+
+    def test_incremental_updates(self) -> None:
+        doc = new_document()
+        indexes = ModelIndexes(doc)
+        index = indexes.get(NameIndex)
+
+        zone = doc.add("Zone", "Office")
+        indexes.added(zone)
+        assert index.first("Office") is zone
+
+        doc.rename("Zone", "Office", "Lab")
+        indexes.renamed(zone, "Office", ())
+        assert index.first("Office") is None
+        assert index.first("Lab") is zone
+
+        doc.removeidfobject(zone)
+        indexes.removed(zone)
+        assert "Lab" not in index
+        assert indexes.version == 3
+
+    def test_large_bulk_add_drops_rebuildable_indexes(self) -> None:
+        doc = new_document()
+        indexes = ModelIndexes(doc)
+        stale = indexes.get(NameIndex)
+        added = [doc.add("Zone", f"Zone{i}", validate=False) for i in range(600)]
+        indexes.added_many(added)
+        fresh = indexes.get(NameIndex)
+        assert fresh is not stale
+        assert fresh.first("Zone599") is added[-1]
+
+    def test_small_bulk_add_updates_in_place(self) -> None:
+        doc = new_document()
+        indexes = ModelIndexes(doc)
+        index = indexes.get(NameIndex)
+        indexes.added_many([doc.add("Zone", "Office")])
+        assert indexes.get(NameIndex) is index
+        assert "Office" in index
+
+    def test_get_is_cached(self) -> None:
+        indexes = ModelIndexes(new_document())
+        assert indexes.get(NameIndex) is indexes.get(NameIndex)
+
+
+class TestReferenceListIndex:
+    def test_prefix_and_pages(self) -> None:
+        doc = new_document()
+        for name in ("b-wing", "A-wing", "Annex", "Core"):
+            doc.add("Zone", name)
+        index = ReferenceListIndex(doc)
+        assert index.available(["ZoneNames"]) == (
+            4,
+            ["A-wing", "Annex", "b-wing", "Core"],
+            {"ZoneNames": ["A-wing", "Annex", "b-wing", "Core"]},
+        )
+        assert index.available(["ZoneNames"], prefix="a")[:2] == (2, ["A-wing", "Annex"])
+        assert index.available(["ZoneNames"], offset=1, limit=2)[:2] == (4, ["Annex", "b-wing"])
+        assert index.available(["ZoneNames"], prefix="x") == (0, [], {})
+
+    def test_several_lists_share_names(self) -> None:
+        doc = new_document()
+        doc.add("Zone", "Office")
+        doc.add("ZoneList", "Offices", zone_1_name="Office", validate=False)
+        doc.add("Space", "Office", zone_name="Office")
+        index = ReferenceListIndex(doc)
+        total, names, by_list = index.available(["SpaceAndSpaceListNames", "ZoneAndZoneListNames"])
+        assert (total, names) == (2, ["Office", "Offices"])
+        assert by_list == {"SpaceAndSpaceListNames": ["Office"], "ZoneAndZoneListNames": ["Office", "Offices"]}
+        assert index.available(["SpaceAndSpaceListNames", "ZoneAndZoneListNames"], offset=1)[1:] == (
+            ["Offices"],
+            {"ZoneAndZoneListNames": ["Offices"]},
+        )
+
+    def test_incremental_updates(self) -> None:
+        doc = new_document()
+        indexes = ModelIndexes(doc)
+        office = doc.add("Zone", "Office")
+        index = indexes.get(ReferenceListIndex)
+        assert index.available(["ZoneNames"])[1] == ["Office"]
+
+        lab = doc.add("Zone", "Lab")
+        indexes.added(lab)
+        doc.add("Material", "Brick", validate=False)
+        assert index.available(["ZoneNames"])[1] == ["Lab", "Office"]
+
+        office.name = "Atrium"
+        indexes.renamed(office, "Office")
+        assert index.available(["ZoneNames"])[1] == ["Atrium", "Lab"]
+
+        doc.removeidfobject(lab)
+        indexes.removed(lab)
+        assert index.available(["ZoneNames"])[1] == ["Atrium"]
+
+
+class TestTokenIndex:
+    def _doc(self):
+        doc = new_document()
+        doc.add("Zone", "Office")
+        doc.add("Zone", "Corridor")
+        doc.add(
+            "BuildingSurface:Detailed",
+            "Wall1",
+            surface_type="Wall",
+            construction_name="",
+            zone_name="Office",
+            outside_boundary_condition="Outdoors",
+            validate=False,
+        )
+        return doc
+
+    def test_name_matches_rank_first(self) -> None:
+        index = TokenIndex(self._doc())
+        results = [(obj.name, field) for obj, field in index.search("offi")]
+        assert results == [("Office", "name"), ("Wall1", "zone_name")]
+
+    def test_type_filter_and_limit(self) -> None:
+        index = TokenIndex(self._doc())
+        assert [obj.name for obj, _ in index.search("o", object_type="Zone")] == ["Office", "Corridor"]
+        assert len(index.search("o", limit=1)) == 1
+        assert index.search("o", limit=0) == []
+
+    def test_short_and_missing_queries(self) -> None:
+        index = TokenIndex(self._doc())
+        assert [obj.name for obj, _ in index.search("RR")] == ["Corridor"]
+        assert index.search("xyz") == []
+
+    def test_incremental_updates(self) -> None:
+        doc = self._doc()
+        indexes = ModelIndexes(doc)
+        index = indexes.get(TokenIndex)
+
+        lab = doc.add("Zone", "Lab")
+        indexes.added(lab)
+        assert [obj for obj, _ in index.search("lab")] == [lab]
+
+        wall = doc["BuildingSurface:Detailed"]["Wall1"]
+        old = {"outside_boundary_condition": wall.outside_boundary_condition}
+        wall.outside_boundary_condition = "Ground"
+        indexes.updated(wall, old)
+        assert index.search("outdoors") == []
+        assert index.search("ground") == [(wall, "outside_boundary_condition")]
+
+        office = doc["Zone"]["Office"]
+        referencing = doc.get_referencing("Office")
+        doc.rename("Zone", "Office", "Studio")
+        indexes.renamed(office, "Office", referencing)
+        assert index.search("office") == []
+        assert [obj.name for obj, _ in index.search("studio")] == ["Studio", "Wall1"]
+
+        doc.removeidfobject(lab)
+        indexes.removed(lab)
+        assert index.search("lab") == []
+
+    def test_compaction_keeps_results(self) -> None:
+        doc = new_document()
+        indexes = ModelIndexes(doc)
+        index = indexes.get(TokenIndex)
+        for i in range(1100):
+            zone = doc.add("Zone", f"Temp{i}")
+            indexes.added(zone)
+            doc.removeidfobject(zone)
+            indexes.removed(zone)
+        keep = doc.add("Zone", "Temp_keep")
+        indexes.added(keep)
+        assert index.search("temp") == [(keep, "name")]
+
+
+class TestSummaryIndex:
+    def test_counts_follow_mutations(self) -> None:
+        doc = new_document()
+        indexes = ModelIndexes(doc)
+        summary = indexes.get(SummaryIndex)
+        base = summary.total
+
+        zone = doc.add("Zone", "Office")
+        indexes.added(zone)
+        assert summary.type_count("Zone") == 1
+        assert summary.groups()["Thermal Zones and Surfaces"]["Zone"] == 1
+        assert summary.total == base + 1
+
+        doc.removeidfobject(zone)
+        indexes.removed(zone)
+        assert summary.type_count("Zone") == 0
+        assert "Zone" not in summary.groups()["Thermal Zones and Surfaces"]
+        assert summary.total == base
+
+    def test_group_map_is_shared_per_version(self) -> None:
+        schema = new_document().schema
+        assert group_map(schema) is group_map(new_document().schema)
+        assert group_map(schema)["Zone"] == "Thermal Zones and Surfaces"
+
+
+class TestStateIndexes:
+    def test_reset_when_document_replaced(self, state_with_model: ServerState) -> None:
+        first = state_with_model.indexes
+        assert state_with_model.indexes is first
+        state_with_model.document = new_document()
+        assert state_with_model.indexes is not first
+
+    def test_write_tools_keep_index_current(self, state_with_model: ServerState) -> None:
+        index = state_with_model.indexes.get(NameIndex)
+        _tool("add_object").fn(object_type="Zone", name="Office")
+        _tool("duplicate_object").fn(object_type="Zone", name="Office", new_name="Office2")
+        _tool("rename_object").fn(object_type="Zone", old_name="Office", new_name="Lab")
+        _tool("update_object").fn(object_type="Zone", name="Office2", fields={"name": "Lab2"})
+        _tool("remove_object").fn(object_type="Zone", name="Lab2")
+
+        assert index.first("Lab") is not None
+        assert index.first("Office") is None
+        assert index.first("Office2") is None
+        assert index.first("Lab2") is None
+        assert index.upper_names() == NameIndex(state_with_model.document).upper_names()
+
+    def test_get_references_after_rename(self, state_with_zones: ServerState) -> None:
+        state_with_zones.indexes.get(NameIndex)
+        _tool("rename_object").fn(object_type="BuildingSurface:Detailed", old_name="Office_Wall", new_name="Wall1")
+        result = _tool("get_references").fn(name="wall1")
+        assert result["references"] == ["OFFICE"]
@@ -0,0 +1,117 @@
+"""Tests for the undo/redo journal and its tools."""
+
+from __future__ import annotations
+
+from idfkit_mcp.indexes import NameIndex
+from idfkit_mcp.journal import Journal
+from idfkit_mcp.state import ServerState
+
+
+def _tool(name: str):
+    from idfkit_mcp.server import mcp
+
+    return mcp._tool_manager._tools[name]
+
+
+def _snapshot(state: ServerState) -> dict:
+    doc = state.document
+    return {
+        obj_type: [(obj.name, dict(obj.data)) for obj in collection]
+        for obj_type, collection in doc.collections.items()
+        if len(collection)
+    }
+
+
+class TestUndoRedo:
+    def test_each_tool_call_is_one_step(self, state_with_zones: ServerState) -> None:
+        before = _snapshot(state_with_zones)
+        _tool("batch_add_objects").fn(
+            objects=[{"object_type": "Zone", "name": "Lab"}, {"object_type": "Zone", "name": "Store"}]
+        )
+        _tool("update_object").fn(object_type="Zone", name="Office", fields={"x_origin": 5.0})
+        after = _snapshot(state_with_zones)
+
+        result = _tool("undo").fn(steps=2)
+        assert result["undone"] == ["update_object", "batch_add_objects"]
+        assert result["redo_available"] == 2
+        assert _snapshot(state_with_zones) == before
+
+        _tool("redo").fn(steps=2)
+        assert _snapshot(state_with_zones) == after
+
+    def test_undo_forced_remove_restores_references(self, state_with_zones: ServerState) -> None:
+        doc = state_with_zones.document
+        wall = doc["BuildingSurface:Detailed"]["Office_Wall"]
+        _tool("remove_object").fn(object_type="Zone", name="Office", force=True)
+        _tool("undo").fn()
+        office = doc["Zone"]["Office"]
+        assert doc.get_referencing("Office") == {wall}
+        assert _tool("get_references").fn(name="Office")["referenced_by"] == [
+            {"object_type": "BuildingSurface:Detailed", "name": "Office_Wall"}
+        ]
+        assert state_with_zones.indexes.get(NameIndex).first("office") is office
+
+    def test_undo_rename_rewrites_references(self, state_with_zones: ServerState) -> None:
+        doc = state_with_zones.document
+        _tool("rename_object").fn(object_type="Zone", old_name="Office", new_name="Lab")
+        _tool("batch_rename_objects").fn(
+            renames=[
+                {"object_type": "Zone", "old_name": "Lab", "new_name": "Corridor"},
+                {"object_type": "Zone", "old_name": "Corridor", "new_name": "Lab"},
+            ]
+        )
+        assert doc["BuildingSurface:Detailed"]["Office_Wall"].zone_name == "Corridor"
+        _tool("undo").fn(steps=2)
+        assert doc["BuildingSurface:Detailed"]["Office_Wall"].zone_name == "Office"
+        assert [zone.name for zone in doc["Zone"]] == ["Office", "Corridor"]
+        assert [obj.name for obj in doc.get_referencing("Office")] == ["Office_Wall"]
+        assert doc.get_referencing("Corridor") == set()
+
+    def test_new_edit_clears_redo(self, state_with_zones: ServerState) -> None:
+        _tool("add_object").fn(object_type="Zone", name="Lab")
+        _tool("undo").fn()
+        _tool("add_object").fn(object_type="Zone", name="Store")
+        assert "error" in _tool("redo").fn()
+
+    def test_nothing_to_undo(self, state_with_zones: ServerState) -> None:
+        assert "Nothing to undo" in _tool("undo").fn()["error"]
+        assert "error" in _tool("undo").fn(steps=3)
+
+    def test_new_model_starts_empty_journal(self, state_with_zones: ServerState) -> None:
+        _tool("add_object").fn(object_type="Zone", name="Lab")
+        _tool("new_model").fn()
+        assert "error" in _tool("undo").fn()
+
+
+class TestCheckpoints:
+    def test_restore_and_return(self, state_with_zones: ServerState) -> None:
+        _tool("checkpoint").fn(name="start")
+        before = _snapshot(state_with_zones)
+        _tool("batch_remove_objects").fn(object_type="BuildingSurface:Detailed")
+        _tool("add_object").fn(object_type="Zone", name="Lab")
+        _tool("checkpoint").fn(name="edited")
+        edited = _snapshot(state_with_zones)
+
+        result = _tool("restore").fn(name="start")
+        assert (result["undone"], result["redone"]) == (2, 0)
+        assert _snapshot(state_with_zones) == before
+
+        result = _tool("restore").fn(name="edited")
+        assert (result["undone"], result["redone"]) == (0, 2)
+        assert _snapshot(state_with_zones) == edited
+
+    def test_checkpoint_on_abandoned_branch_is_dropped(self, state_with_zones: ServerState) -> None:
+        _tool("add_object").fn(object_type="Zone", name="Lab")
+        _tool("checkpoint").fn(name="lab")
+        _tool("undo").fn()
+        _tool("add_object").fn(object_type="Zone", name="Store")
+        assert "Unknown checkpoint" in _tool("restore").fn(name="lab")["error"]
+
+    def test_checkpoint_beyond_budget(self, state_with_zones: ServerState) -> None:
+        _tool("checkpoint").fn(name="start")
+        state_with_zones.indexes.get(Journal).max_bytes = 1000
+        for i in range(10):
+            _tool("remove_object").fn(object_type="Zone", name="Corridor")
+            _tool("add_object").fn(object_type="Zone", name="Corridor", fields={"x_origin": float(i)})
+        assert "older than" in _tool("restore").fn(name="start")["error"]
+        assert _tool("undo").fn()["status"] == "undone"
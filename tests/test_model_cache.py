@@ -0,0 +1,114 @@
+"""Tests for the parsed-model cache behind load_model."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from idfkit import load_idf, new_document, write_idf
+
+from idfkit_mcp.model_cache import ModelCache, copy_document
+
+
+def _write_model(path: Path, zones: int = 2) -> Path:
+    doc = new_document()
+    for i in range(zones):
+        doc.add("Zone", f"Zone{i}")
+    write_idf(doc, path)
+    return path
+
+
+def _counting_loader(path: Path, calls: list[int]):
+    def loader():
+        calls.append(1)
+        return load_idf(str(path))
+
+    return loader
+
+
+class TestCopyDocument:
+    def test_independent(self) -> None:
+        doc = new_document()
+        doc.add("Zone", "Office", x_origin=1.0)
+        clone = copy_document(doc)
+        clone["Zone"]["Office"].x_origin = 5.0
+        assert doc["Zone"]["Office"].x_origin == 1.0
+        assert len(clone) == len(doc)
+
+    def test_nested_values_copied(self) -> None:
+        doc = new_document()
+        zone = doc.add("Zone", "Office", validate=False)
+        zone.data["extra"] = [{"a": 1}]
+        clone = copy_document(doc)
+        clone["Zone"]["Office"].data["extra"][0]["a"] = 2
+        assert zone.data["extra"][0]["a"] == 1
+
+
+class TestModelCache:
+    def test_second_load_hits(self, tmp_path: Path) -> None:
+        path = _write_model(tmp_path / "m.idf")
+        cache = ModelCache()
+        calls: list[int] = []
+        first, source1 = cache.load(path, None, _counting_loader(path, calls))
+        second, source2 = cache.load(path, None, _counting_loader(path, calls))
+        assert (source1, source2) == ("parsed", "memory")
+        assert len(calls) == 1
+        assert second is not first
+        assert len(second) == len(first)
+
+    def test_edits_do_not_leak(self, tmp_path: Path) -> None:
+        path = _write_model(tmp_path / "m.idf")
+        cache = ModelCache()
+        first, _ = cache.load(path, None, lambda: load_idf(str(path)))
+        first.add("Zone", "Extra")
+        second, _ = cache.load(path, None, lambda: load_idf(str(path)))
+        second["Zone"]["Zone0"].x_origin = 9.0
+        third, _ = cache.load(path, None, lambda: load_idf(str(path)))
+        assert "Extra" not in third["Zone"]
+        assert third["Zone"]["Zone0"].x_origin != 9.0
+
+    def test_touched_file_hits_by_hash(self, tmp_path: Path) -> None:
+        path = _write_model(tmp_path / "m.idf")
+        cache = ModelCache()
+        calls: list[int] = []
+        cache.load(path, None, _counting_loader(path, calls))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+        _, source = cache.load(path, None, _counting_loader(path, calls))
+        assert source == "memory"
+        assert len(calls) == 1
+
+    def test_changed_file_misses(self, tmp_path: Path) -> None:
+        path = _write_model(tmp_path / "m.idf", zones=2)
+        cache = ModelCache()
+        cache.load(path, None, lambda: load_idf(str(path)))
+        _write_model(path, zones=3)
+        doc, source = cache.load(path, None, lambda: load_idf(str(path)))
+        assert source == "parsed"
+        assert len(doc["Zone"]) == 3
+
+    def test_version_is_part_of_key(self, tmp_path: Path) -> None:
+        path = _write_model(tmp_path / "m.idf")
+        cache = ModelCache()
+        cache.load(path, None, lambda: load_idf(str(path)))
+        _, source = cache.load(path, (24, 1, 0), lambda: load_idf(str(path), version=(24, 1, 0)))
+        assert source == "parsed"
+
+    def test_lru_eviction_within_budget(self, tmp_path: Path) -> None:
+        a = _write_model(tmp_path / "a.idf")
+        b = _write_model(tmp_path / "b.idf")
+        cache = ModelCache()
+        cache.load(a, None, lambda: load_idf(str(a)))
+        cache.max_bytes = cache.total_bytes + 1
+        cache.load(b, None, lambda: load_idf(str(b)))
+        assert len(cache) == 1
+        _, source = cache.load(b, None, lambda: load_idf(str(b)))
+        assert source == "memory"
+
+    def test_disabled(self, tmp_path: Path) -> None:
+        path = _write_model(tmp_path / "m.idf")
+        cache = ModelCache(max_bytes=0)
+        cache.load(path, None, lambda: load_idf(str(path)))
+        _, source = cache.load(path, None, lambda: load_idf(str(path)))
+        assert source == "parsed"
+        assert len(cache) == 0
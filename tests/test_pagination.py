@@ -0,0 +1,27 @@
+"""Tests for pagination cursors."""
+
+from __future__ import annotations
+
+import pytest
+
+from idfkit_mcp.pagination import StaleCursorError, decode_cursor, encode_cursor
+
+
+class TestCursors:
+    def test_round_trip(self) -> None:
+        cursor = encode_cursor("list_objects", 40, "1.3", t="Zone")
+        assert decode_cursor(cursor, "list_objects", "1.3", t="Zone") == 40
+
+    def test_stale(self) -> None:
+        cursor = encode_cursor("list_objects", 40, "1.3", t="Zone")
+        with pytest.raises(StaleCursorError):
+            decode_cursor(cursor, "list_objects", "1.4", t="Zone")
+
+    def test_wrong_listing(self) -> None:
+        cursor = encode_cursor("list_objects", 40, "1.3", t="Zone")
+        with pytest.raises(ValueError, match="does not belong"):
+            decode_cursor(cursor, "list_objects", "1.3", t="Material")
+
+    def test_garbage(self) -> None:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not a cursor!", "list_objects", "1.3")
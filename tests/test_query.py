@@ -0,0 +1,135 @@
+"""Tests for the query_objects predicates and planner."""
+
+from __future__ import annotations
+
+import pytest
+
+from idfkit_mcp.indexes import FieldValueIndex
+from idfkit_mcp.query import Predicate
+from idfkit_mcp.state import ServerState
+
+
+def _tool(name: str):
+    from idfkit_mcp.server import mcp
+
+    return mcp._tool_manager._tools[name]
+
+
+@pytest.fixture()
+def state_with_surfaces(state_with_model: ServerState) -> ServerState:
+    doc = state_with_model.document
+    assert doc is not None
+    for zone in ("Office", "Corridor"):
+        doc.add("Zone", zone, x_origin=10.0 if zone == "Office" else 0.0)
+    surfaces = [
+        ("Office_Wall", "Wall", "Office", "Outdoors"),
+        ("Office_Roof", "Roof", "Office", "Outdoors"),
+        ("Office_Floor", "Floor", "Office", "Ground"),
+        ("Corridor_Wall", "Wall", "Corridor", "Outdoors"),
+    ]
+    for name, surface_type, zone, boundary in surfaces:
+        doc.add(
+            "BuildingSurface:Detailed",
+            name,
+            surface_type=surface_type,
+            construction_name="",
+            zone_name=zone,
+            outside_boundary_condition=boundary,
+            validate=False,
+        )
+    return state_with_model
+
+
+def _names(result: dict) -> list[str]:
+    return [obj["name"] for obj in result["objects"]]
+
+
+class TestPredicateParse:
+    def test_unknown_operator(self) -> None:
+        with pytest.raises(ValueError, match="Unknown operator"):
+            Predicate.parse({"field": "x", "op": "like", "value": "a"})
+
+    def test_missing_value(self) -> None:
+        with pytest.raises(ValueError, match="needs a 'value'"):
+            Predicate.parse({"field": "x", "op": "eq"})
+
+    def test_between_needs_pair(self) -> None:
+        with pytest.raises(ValueError, match="between"):
+            Predicate.parse({"field": "x", "op": "between", "value": [1]})
+
+    def test_normalizes_field_name(self) -> None:
+        assert Predicate.parse({"field": "Zone Name", "value": "A"}).field == "zone_name"
+
+
+class TestQueryObjects:
+    def test_equality_uses_field_index(self, state_with_surfaces: ServerState) -> None:
+        result = _tool("query_objects").fn(
+            object_types=["BuildingSurface:Detailed"],
+            where=[{"field": "surface_type", "op": "eq", "value": "wall"}],
+        )
+        assert _names(result) == ["Corridor_Wall", "Office_Wall"]
+        assert result["plan"]["strategy"] == "field_index"
+
+    def test_field_index_tracks_updates(self, state_with_surfaces: ServerState) -> None:
+        query = {
+            "object_types": ["BuildingSurface:Detailed"],
+            "where": [{"field": "surface_type", "op": "eq", "value": "Wall"}],
+        }
+        _tool("query_objects").fn(**query)
+        _tool("update_object").fn(
+            object_type="BuildingSurface:Detailed", name="Office_Roof", fields={"surface_type": "Wall"}
+        )
+        _tool("remove_object").fn(object_type="BuildingSurface:Detailed", name="Corridor_Wall")
+        assert state_with_surfaces.indexes.get(FieldValueIndex).has_column("BuildingSurface:Detailed", "surface_type")
+        assert _names(_tool("query_objects").fn(**query)) == ["Office_Roof", "Office_Wall"]
+
+    def test_references_uses_graph(self, state_with_surfaces: ServerState) -> None:
+        result = _tool("query_objects").fn(
+            where=[
+                {"field": "zone_name", "op": "references", "value": "office"},
+                {"field": "outside_boundary_condition", "op": "ne", "value": "Ground"},
+            ],
+        )
+        assert _names(result) == ["Office_Roof", "Office_Wall"]
+        assert result["plan"]["strategy"] == "reference_graph"
+
+    def test_name_lookup(self, state_with_surfaces: ServerState) -> None:
+        result = _tool("query_objects").fn(where=[{"field": "name", "op": "in", "value": ["office", "Office_Wall"]}])
+        assert [(o["object_type"], o["name"]) for o in result["objects"]] == [
+            ("BuildingSurface:Detailed", "Office_Wall"),
+            ("Zone", "Office"),
+        ]
+        assert result["plan"]["strategy"] == "name_index"
+
+    def test_numeric_range_scan(self, state_with_surfaces: ServerState) -> None:
+        result = _tool("query_objects").fn(
+            object_types=["Zone"], where=[{"field": "x_origin", "op": "between", "value": [5, 20]}]
+        )
+        assert _names(result) == ["Office"]
+        assert result["plan"]["strategy"] == "scan"
+
+    def test_is_empty(self, state_with_surfaces: ServerState) -> None:
+        result = _tool("query_objects").fn(
+            object_types=["BuildingSurface:Detailed"], where=[{"field": "construction_name", "op": "is_empty"}]
+        )
+        assert result["total"] == 4
+
+    def test_projection_sort_and_limit(self, state_with_surfaces: ServerState) -> None:
+        result = _tool("query_objects").fn(
+            object_types=["BuildingSurface:Detailed"],
+            fields=["Surface Type"],
+            sort_by="-name",
+            limit=2,
+        )
+        assert result["total"] == 4
+        assert result["objects"] == [
+            {"object_type": "BuildingSurface:Detailed", "name": "Office_Wall", "surface_type": "Wall"},
+            {"object_type": "BuildingSurface:Detailed", "name": "Office_Roof", "surface_type": "Roof"},
+        ]
+
+    def test_unknown_field(self, state_with_surfaces: ServerState) -> None:
+        result = _tool("query_objects").fn(object_types=["Zone"], where=[{"field": "colour", "value": "red"}])
+        assert "Unknown field" in result["error"]
+
+    def test_without_model(self) -> None:
+        assert "error" in _tool("query_objects").fn()
@@ -32,6 +32,20 @@ class TestLoadModel:
         assert state.document is not None
         assert state.file_path == Path(path)
 
+    def test_reload_uses_cache(self) -> None:
+        doc = new_document()
+        doc.add("Zone", "TestZone")
+        with tempfile.NamedTemporaryFile(suffix=".idf", delete=False) as f:
+            write_idf(doc, f.name)
+            path = f.name
+
+        first = _tool("load_model").fn(file_path=path)
+        _tool("add_object").fn(object_type="Zone", name="Unsaved")
+        second = _tool("load_model").fn(file_path=path)
+        assert first["load_source"] == "parsed"
+        assert second["load_source"] == "memory"
+        assert second["zone_count"] == 1
+
     def test_load_nonexistent(self) -> None:
         result = _tool("load_model").fn(file_path="/nonexistent/file.idf")
         assert "error" in result
@@ -47,6 +61,17 @@ class TestGetModelSummary:
         assert result["zone_count"] == 2
         assert result["total_objects"] >= 3  # 2 zones + 1 surface + defaults
 
+    def test_tracks_writes(self, state_with_zones: ServerState) -> None:
+        before = _tool("get_model_summary").fn()
+        _tool("add_object").fn(object_type="Zone", name="Lab")
+        _tool("remove_object").fn(object_type="BuildingSurface:Detailed", name="Office_Wall")
+        after = _tool("get_model_summary").fn()
+        assert after["zone_count"] == 3
+        assert after["total_objects"] == before["total_objects"]
+        types = after["groups"]["Thermal Zones and Surfaces"]["types"]
+        assert types["Zone"] == 3
+        assert "BuildingSurface:Detailed" not in types
+
 
 class TestListObjects:
     def test_without_model(self) -> None:
@@ -64,6 +89,35 @@ class TestListObjects:
         result = _tool("list_objects").fn(object_type="Material")
         assert "error" in result
 
+    def test_pages_with_cursor(self, state_with_zones: ServerState) -> None:
+        first = _tool("list_objects").fn(object_type="Zone", limit=1)
+        assert [o["name"] for o in first["objects"]] == ["Office"]
+        second = _tool("list_objects").fn(object_type="Zone", limit=1, cursor=first["next_cursor"])
+        assert [o["name"] for o in second["objects"]] == ["Corridor"]
+        assert second["next_cursor"] is None
+        assert second["model_version"] == first["model_version"]
+
+    def test_stale_cursor(self, state_with_zones: ServerState) -> None:
+        first = _tool("list_objects").fn(object_type="Zone", limit=1)
+        _tool("add_object").fn(object_type="Zone", name="Lab")
+        result = _tool("list_objects").fn(object_type="Zone", limit=1, cursor=first["next_cursor"])
+        assert result["stale_cursor"] is True
+        assert result["model_version"] != first["model_version"]
+
+    def test_cursor_for_other_type(self, state_with_zones: ServerState) -> None:
+        first = _tool("list_objects").fn(object_type="Zone", limit=1)
+        result = _tool("list_objects").fn(object_type="BuildingSurface:Detailed", cursor=first["next_cursor"])
+        assert "error" in result
+
+    def test_fields_and_count_only(self, state_with_zones: ServerState) -> None:
+        result = _tool("list_objects").fn(object_type="BuildingSurface:Detailed", fields=["zone_name"])
+        assert result["objects"] == [
+            {"object_type": "BuildingSurface:Detailed", "name": "Office_Wall", "zone_name": "Office"}
+        ]
+        counted = _tool("list_objects").fn(object_type="Zone", count_only=True)
+        assert counted["total"] == 2
+        assert "objects" not in counted
+
 
 class TestGetObject:
     def test_get_zone(self, state_with_zones: ServerState) -> None:
@@ -76,6 +130,32 @@ class TestGetObject:
         assert "error" in result
 
 
+class TestGetObjects:
+    def test_pairs_with_partial_errors(self, state_with_zones: ServerState) -> None:
+        result = _tool("get_objects").fn(
+            objects=[
+                {"object_type": "Zone", "name": "office"},
+                {"object_type": "Zone", "name": "Missing"},
+                {"object_type": "Nope", "name": "X"},
+            ]
+        )
+        assert result["found"] == 1
+        assert result["errors"] == 2
+        assert result["results"][0]["name"] == "Office"
+        assert result["results"][1]["index"] == 1
+        assert "error" in result["results"][2]
+
+    def test_whole_type_with_projection(self, state_with_zones: ServerState) -> None:
+        result = _tool("get_objects").fn(object_type="BuildingSurface:Detailed", fields=["Zone Name"])
+        assert result["results"] == [
+            {"object_type": "BuildingSurface:Detailed", "name": "Office_Wall", "zone_name": "Office"}
+        ]
+
+    def test_requires_one_selector(self, state_with_zones: ServerState) -> None:
+        assert "error" in _tool("get_objects").fn()
+        assert "error" in _tool("get_objects").fn(objects=[], object_type="Zone")
+
+
 class TestSearchObjects:
     def test_search_by_name(self, state_with_zones: ServerState) -> None:
         result = _tool("search_objects").fn(query="Office")
@@ -91,6 +171,12 @@ class TestSearchObjects:
         result = _tool("search_objects").fn(query="xyznonexistent")
         assert result["count"] == 0
 
+    def test_sees_objects_added_after_first_search(self, state_with_zones: ServerState) -> None:
+        _tool("search_objects").fn(query="Office")
+        _tool("add_object").fn(object_type="Zone", name="Office Annex")
+        result = _tool("search_objects").fn(query="annex")
+        assert result["matches"] == [{"object_type": "Zone", "name": "Office Annex", "match": "name"}]
+
 
 class TestGetReferences:
     def test_referenced_zone(self, state_with_zones: ServerState) -> None:
@@ -102,3 +188,106 @@ class TestGetReferences:
     def test_unreferenced(self, state_with_zones: ServerState) -> None:
         result = _tool("get_references").fn(name="Corridor")
         assert result["referenced_by_count"] == 0
+
+
+def _vertex_fields(points: list[tuple[float, float, float]]) -> dict[str, float]:
+    fields: dict[str, float] = {}
+    for i, (x, y, z) in enumerate(points, 1):
+        fields.update({f"vertex_{i}_x_coordinate": x, f"vertex_{i}_y_coordinate": y, f"vertex_{i}_z_coordinate": z})
+    return fields
+
+
+def _add_box(doc, zone: str, x0: float, length: float, width: float, height: float) -> None:  # type: ignore[no-untyped-def]
+    """Add a box zone whose surfaces are counter-clockwise seen from outside, plus a 2 m2 south window."""
+    x1, h = x0 + length, height
+    faces = {
+        "Floor": ("Floor", "Ground", [(x0, 0, 0), (x0, width, 0), (x1, width, 0), (x1, 0, 0)]),
+        "Roof": ("Roof", "Outdoors", [(x0, 0, h), (x1, 0, h), (x1, width, h), (x0, width, h)]),
+        "South": ("Wall", "Outdoors", [(x0, 0, h), (x0, 0, 0), (x1, 0, 0), (x1, 0, h)]),
+        "East": ("Wall", "Outdoors", [(x1, 0, h), (x1, 0, 0), (x1, width, 0), (x1, width, h)]),
+        "North": ("Wall", "Outdoors", [(x1, width, h), (x1, width, 0), (x0, width, 0), (x0, width, h)]),
+        "West": ("Wall", "Adiabatic", [(x0, width, h), (x0, width, 0), (x0, 0, 0), (x0, 0, h)]),
+    }
+    for face, (surface_type, boundary, points) in faces.items():
+        doc.add(
+            "BuildingSurface:Detailed",
+            f"{zone}_{face}",
+            surface_type=surface_type,
+            construction_name="",
+            zone_name=zone,
+            outside_boundary_condition=boundary,
+            validate=False,
+            **_vertex_fields(points),
+        )
+    doc.add(
+        "FenestrationSurface:Detailed",
+        f"{zone}_Window",
+        surface_type="Window",
+        construction_name="",
+        building_surface_name=f"{zone}_South",
+        validate=False,
+        **_vertex_fields([(x0 + 2, 0, 2), (x0 + 2, 0, 1), (x0 + 4, 0, 1), (x0 + 4, 0, 2)]),
+    )
+
+
+class TestGetZoneGeometry:
+    def _state(self) -> ServerState:
+        state = get_state()
+        doc = new_document()
+        state.document = doc
+        state.schema = doc.schema
+        for zone in ("Office", "Lab"):
+            doc.add("Zone", zone)
+        _add_box(doc, "Office", 0, 10, 5, 3)
+        _add_box(doc, "Lab", 10, 4, 5, 3)
+        return state
+
+    def test_metrics_from_vertices(self) -> None:
+        self._state()
+        result = _tool("get_zone_geometry").fn(zones=["office"])
+        assert result["zones"] == [
+            {
+                "name": "Office",
+                "surfaces": 6,
+                "floor_area": 50.0,
+                "volume": 150.0,
+                "roof_ceiling_area": 50.0,
+                "exterior_wall_area": 75.0,
+                "window_area": 2.0,
+                "window_to_wall_ratio": 0.0267,
+            }
+        ]
+
+    def test_totals(self) -> None:
+        self._state()
+        total = _tool("get_zone_geometry").fn()["total"]
+        assert (total["floor_area"], total["volume"], total["window_area"]) == (70.0, 210.0, 4.0)
+
+    def test_only_changed_zone_is_recomputed(self) -> None:
+        self._state()
+        assert _tool("get_zone_geometry").fn()["computed"] == 2
+        assert _tool("get_zone_geometry").fn()["computed"] == 0
+
+        _tool("remove_object").fn(object_type="FenestrationSurface:Detailed", name="Lab_Window")
+        result = _tool("get_zone_geometry").fn()
+        assert result["computed"] == 1
+        assert [zone["window_area"] for zone in result["zones"]] == [2.0, 0.0]
+
+        _tool("update_object").fn(
+            object_type="BuildingSurface:Detailed", name="Office_West", fields={"zone_name": "Lab"}
+        )
+        result = _tool("get_zone_geometry").fn()
+        assert result["computed"] == 2
+        assert [zone["surfaces"] for zone in result["zones"]] == [5, 7]
+
+    def test_transform_keeps_areas(self) -> None:
+        self._state()
+        before = _tool("get_zone_geometry").fn()["zones"]
+        _tool("transform_geometry").fn(rotate=30, translate=[5, 5, 0], zones=["Office"])
+        result = _tool("get_zone_geometry").fn()
+        assert result["computed"] == 1
+        assert result["zones"] == before
+
+    def test_unknown_zone(self) -> None:
+        self._state()
+        assert "Zone(s) not found: Attic" in _tool("get_zone_geometry").fn(zones=["Attic"])["error"]
@@ -74,6 +74,38 @@ class TestDescribeObjectType:
         assert "error" in result
 
 
+class TestDescribeObjectTypes:
+    def test_batch_matches_single(self) -> None:
+        from idfkit_mcp.server import mcp
+
+        single = mcp._tool_manager._tools["describe_object_type"]
+        batch = mcp._tool_manager._tools["describe_object_types"]
+        result = batch.fn(object_types=["Zone", "NonExistent", "People"])
+        assert result["total"] == 3
+        assert result["found"] == 2
+        assert result["errors"] == 1
+        assert result["results"][0] == single.fn(object_type="Zone")
+        assert result["results"][1]["index"] == 1
+        assert result["results"][2]["object_type"] == "People"
+
+    def test_descriptions_are_cached(self) -> None:
+        from idfkit import LATEST_VERSION, get_schema
+
+        from idfkit_mcp.schema_cache import configure_description_cache, object_description, precompute_descriptions
+
+        schema = get_schema(LATEST_VERSION)
+        first = object_description(schema, "Zone")
+        assert object_description(schema, "Zone") is first
+        try:
+            configure_description_cache(1)
+            object_description(schema, "People")
+            assert object_description(schema, "Zone") is not first
+        finally:
+            configure_description_cache(2048)
+        precompute_descriptions(LATEST_VERSION).join()
+        assert object_description(schema, "Lights") is object_description(schema, "Lights")
+
+
 class TestSearchSchema:
     def test_search_zone(self) -> None:
         from idfkit_mcp.server import mcp
@@ -91,6 +123,43 @@ class TestSearchSchema:
         result = tool.fn(query="xyznonexistent123")
         assert result["count"] == 0
 
+    def test_ranked(self) -> None:
+        from idfkit_mcp.server import mcp
+
+        tool = mcp._tool_manager._tools["search_schema"]
+        result = tool.fn(query="ideal loads", limit=5)
+        assert result["returned"] == 5
+        assert result["count"] > 5
+        assert result["matches"][0]["object_type"] == "ZoneHVAC:IdealLoadsAirSystem"
+        scores = [m["score"] for m in result["matches"]]
+        assert scores == sorted(scores, reverse=True)
+
+        assert tool.fn(query="run period")["matches"][0]["object_type"] == "RunPeriod"
+
+    def test_defaults_return_every_match(self) -> None:
+        from idfkit_mcp.server import mcp
+
+        tool = mcp._tool_manager._tools["search_schema"]
+        result = tool.fn(query="zone")
+        assert result["returned"] == result["count"] > 20
+        everything = tool.fn(query="")
+        assert everything["count"] == everything["returned"] > 500
+
+    def test_typos_and_prefixes(self) -> None:
+        from idfkit_mcp.server import mcp
+
+        tool = mcp._tool_manager._tools["search_schema"]
+        for query in ("infiltraton", "infiltr"):
+            types = [m["object_type"] for m in tool.fn(query=query, limit=3)["matches"]]
+            assert any(t.startswith("ZoneInfiltration:") for t in types)
+
+    def test_field_names_are_indexed(self) -> None:
+        from idfkit_mcp.server import mcp
+
+        tool = mcp._tool_manager._tools["search_schema"]
+        types = [m["object_type"] for m in tool.fn(query="outside_boundary_condition_object")["matches"]]
+        assert "BuildingSurface:Detailed" in types
+
 
 class TestGetAvailableReferences:
     def test_without_model(self) -> None:
@@ -109,6 +178,24 @@ class TestGetAvailableReferences:
         assert "Office" in result["available_names"]
         assert "Corridor" in result["available_names"]
 
+    def test_prefix_and_pages(self, state_with_zones: object) -> None:
+        from idfkit_mcp.server import mcp
+
+        tool = mcp._tool_manager._tools["get_available_references"]
+        add = mcp._tool_manager._tools["add_object"]
+        for name in ("Office 2", "office annex"):
+            add.fn(object_type="Zone", name=name)
+        result = tool.fn(object_type="BuildingSurface:Detailed", field_name="zone_name", prefix="off", limit=2)
+        assert result["total"] == 3
+        assert result["available_names"] == ["Office", "Office 2"]
+        result = tool.fn(object_type="BuildingSurface:Detailed", field_name="zone_name", prefix="off", offset=2)
+        assert result["available_names"] == ["office annex"]
+        assert result["by_reference_list"] == {"ZoneNames": ["office annex"]}
+
+        mcp._tool_manager._tools["rename_object"].fn(object_type="Zone", old_name="Office 2", new_name="Lab")
+        result = tool.fn(object_type="BuildingSurface:Detailed", field_name="zone_name")
+        assert result["available_names"] == ["Corridor", "Lab", "Office", "office annex"]
+
     def test_non_reference_field(self, state_with_model: object) -> None:
         from idfkit_mcp.server import mcp
 
@@ -18,22 +18,35 @@ class TestCreateServer:
         expected = {
             "list_object_types",
             "describe_object_type",
+            "describe_object_types",
             "search_schema",
             "load_model",
             "get_model_summary",
             "list_objects",
             "get_object",
+            "get_objects",
             "search_objects",
+            "query_objects",
             "get_references",
+            "get_zone_geometry",
             "get_available_references",
             "new_model",
             "add_object",
             "batch_add_objects",
             "update_object",
+            "batch_update_objects",
             "remove_object",
+            "batch_remove_objects",
             "rename_object",
+            "batch_rename_objects",
             "duplicate_object",
+            "transform_geometry",
+            "replicate_zone",
             "save_model",
+            "undo",
+            "redo",
+            "checkpoint",
+            "restore",
             "validate_model",
             "check_references",
             "run_simulation",
@@ -43,6 +56,7 @@ class TestCreateServer:
             "export_timeseries",
             "search_weather_stations",
             "download_weather_file",
+            "get_session_info",
         }
         assert expected.issubset(tool_names)
 
@@ -58,11 +72,17 @@ class TestParseArgs:
         monkeypatch.delenv("IDFKIT_MCP_HOST", raising=False)
         monkeypatch.delenv("IDFKIT_MCP_PORT", raising=False)
         monkeypatch.delenv("IDFKIT_MCP_MOUNT_PATH", raising=False)
+        monkeypatch.delenv("IDFKIT_MCP_MAX_SESSIONS", raising=False)
+        monkeypatch.delenv("IDFKIT_MCP_SESSION_IDLE_TIMEOUT", raising=False)
+        monkeypatch.delenv("IDFKIT_MCP_JOURNAL_MB", raising=False)
         args = _parse_args([])
         assert args.transport == "stdio"
         assert args.host == "127.0.0.1"
         assert args.port == 8000
         assert args.mount_path is None
+        assert args.max_sessions == 64
+        assert args.session_idle_timeout == 3600.0
+        assert args.journal_mb == 64
 
     def test_cli_overrides(self) -> None:
         args = _parse_args([
@@ -91,6 +111,21 @@ class TestParseArgs:
         assert args.port == 3000
         assert args.mount_path == "/api"
 
+    def test_session_limits(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("IDFKIT_MCP_MAX_SESSIONS", "8")
+        args = _parse_args(["--session-idle-timeout", "120"])
+        assert args.max_sessions == 8
+        assert args.session_idle_timeout == 120.0
+
+    def test_description_cache_options(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("IDFKIT_MCP_DESCRIPTION_CACHE_SIZE", raising=False)
+        monkeypatch.setenv("IDFKIT_MCP_PRECOMPUTE_DESCRIPTIONS", "1")
+        args = _parse_args([])
+        assert args.description_cache_size == 2048
+        assert args.precompute_descriptions is True
+        args = _parse_args(["--description-cache-size", "10"])
+        assert args.description_cache_size == 10
+
     def test_cli_overrides_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("IDFKIT_MCP_TRANSPORT", "sse")
         args = _parse_args(["--transport", "streamable-http"])
@@ -0,0 +1,117 @@
+"""Tests for binary model snapshots."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+from idfkit import load_idf, new_document, write_idf
+
+from idfkit_mcp.model_cache import ModelCache, file_digest
+from idfkit_mcp.snapshot import SnapshotError, SnapshotStore, read_snapshot, write_snapshot
+
+_DIGEST = "ab" * 32
+
+
+def _model():
+    doc = new_document()
+    doc.add("Zone", "Office", x_origin=1.5)
+    doc.add("Zone", "Corridor")
+    doc.add(
+        "BuildingSurface:Detailed",
+        "Office_Wall",
+        surface_type="Wall",
+        construction_name="",
+        zone_name="Office",
+        outside_boundary_condition="Outdoors",
+        sun_exposure="SunExposed",
+        wind_exposure="WindExposed",
+        validate=False,
+    )
+    return doc
+
+
+def _roundtrip(doc, digest: str = _DIGEST):
+    buf = io.BytesIO()
+    write_snapshot(doc, buf, digest)
+    buf.seek(0)
+    return read_snapshot(buf, source_digest=digest)
+
+
+class TestRoundTrip:
+    def test_objects_match(self) -> None:
+        doc = _model()
+        restored = _roundtrip(doc)
+        assert restored.version == doc.version
+        original = list(doc.all_objects)
+        copied = list(restored.all_objects)
+        assert [(o.obj_type, o.name, o.data, o.field_order) for o in copied] == [
+            (o.obj_type, o.name, o.data, o.field_order) for o in original
+        ]
+
+    def test_references_restored(self) -> None:
+        restored = _roundtrip(_model())
+        referencing = restored.get_referencing("Office")
+        assert [o.name for o in referencing] == ["Office_Wall"]
+        restored.rename("Zone", "Office", "MainOffice")
+        assert restored["BuildingSurface:Detailed"]["Office_Wall"].zone_name == "MainOffice"
+
+    def test_value_types(self) -> None:
+        doc = new_document()
+        zone = doc.add("Zone", "Office", validate=False)
+        zone.data.update({"count": 3, "flag": True, "missing": None, "nested": [{"x": 1.0}], "big": 2**70})
+        restored = _roundtrip(doc)
+        assert restored["Zone"]["Office"].data == zone.data
+
+    def test_digest_mismatch(self) -> None:
+        buf = io.BytesIO()
+        write_snapshot(_model(), buf, _DIGEST)
+        buf.seek(0)
+        with pytest.raises(SnapshotError, match="different source"):
+            read_snapshot(buf, source_digest="cd" * 32)
+
+    def test_not_a_snapshot(self) -> None:
+        with pytest.raises(SnapshotError):
+            read_snapshot(io.BytesIO(b"Zone, Office;"))
+
+
+class TestSnapshotStore:
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        store = SnapshotStore(tmp_path)
+        path = store.save(_model(), _DIGEST, None)
+        assert path is not None and path.exists()
+        restored = store.load(_DIGEST, None, Path("model.idf"))
+        assert restored is not None
+        assert restored.filepath == Path("model.idf")
+        assert store.load(_DIGEST, (24, 1, 0), Path("model.idf")) is None
+
+    def test_corrupt_snapshot_discarded(self, tmp_path: Path) -> None:
+        store = SnapshotStore(tmp_path)
+        path = store.path_for(_DIGEST, None)
+        path.write_bytes(b"IDFKSNAP garbage")
+        assert store.load(_DIGEST, None, Path("model.idf")) is None
+        assert not path.exists()
+
+    def test_prune(self, tmp_path: Path) -> None:
+        store = SnapshotStore(tmp_path, max_bytes=0)
+        store.save(_model(), _DIGEST, None)
+        assert list(tmp_path.glob("*.snap")) == []
+
+
+class TestModelCacheSnapshots:
+    def test_restart_restores_snapshot(self, tmp_path: Path) -> None:
+        model_path = tmp_path / "m.idf"
+        write_idf(_model(), model_path)
+        snapshot_dir = tmp_path / "snapshots"
+
+        first = ModelCache(max_bytes=0, snapshots=SnapshotStore(snapshot_dir))
+        _, source = first.load(model_path, None, lambda: load_idf(str(model_path)))
+        assert source == "parsed"
+        assert SnapshotStore(snapshot_dir).path_for(file_digest(model_path), None).exists()
+
+        restarted = ModelCache(max_bytes=0, snapshots=SnapshotStore(snapshot_dir))
+        doc, source = restarted.load(model_path, None, lambda: pytest.fail("should not reparse"))
+        assert source == "snapshot"
+        assert doc["Zone"]["Office"].x_origin == 1.5
+        assert doc.filepath == model_path
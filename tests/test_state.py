@@ -0,0 +1,197 @@
+"""Tests for per-session server state."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from idfkit import new_document
+
+from idfkit_mcp.state import (
+    ServerState,
+    SessionRegistry,
+    configure_sessions,
+    disable_sessions,
+    estimate_document_size,
+    get_state,
+)
+
+
+class _Session:
+    """Stand-in for an MCP ServerSession."""
+
+
+@pytest.fixture()
+def _per_session() -> Iterator[SessionRegistry]:
+    registry = configure_sessions(max_sessions=2, idle_timeout=60.0)
+    yield registry
+    disable_sessions()
+
+
+def _in_request(session: object) -> Any:
+    from mcp.server.lowlevel.server import request_ctx
+    from mcp.shared.context import RequestContext
+
+    return request_ctx.set(RequestContext(request_id=1, meta=None, session=session, lifespan_context=None))  # type: ignore[arg-type]
+
+
+class TestSessionRegistry:
+    def test_same_session_same_state(self) -> None:
+        registry = SessionRegistry()
+        session = _Session()
+        assert registry.get(session) is registry.get(session)
+
+    def test_sessions_are_isolated(self) -> None:
+        registry = SessionRegistry()
+        a, b = _Session(), _Session()
+        registry.get(a).document = new_document()
+        assert registry.get(b).document is None
+
+    def test_lru_cap(self) -> None:
+        registry = SessionRegistry(max_sessions=2)
+        a, b, c = _Session(), _Session(), _Session()
+        state_a = registry.get(a)
+        registry.get(b)
+        registry.get(a)  # a becomes most recently used
+        registry.get(c)  # evicts b
+        assert len(registry) == 2
+        assert registry.get(a) is state_a
+
+    def test_idle_eviction(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import idfkit_mcp.state as state_mod
+
+        clock = [1000.0]
+        monkeypatch.setattr(state_mod.time, "monotonic", lambda: clock[0])
+        registry = SessionRegistry(idle_timeout=10.0)
+        a, b = _Session(), _Session()
+        state_a = registry.get(a)
+        clock[0] += 11.0
+        registry.get(b)
+        assert len(registry) == 1
+        assert registry.get(a) is not state_a
+
+    def test_released_when_session_collected(self) -> None:
+        registry = SessionRegistry()
+        session = _Session()
+        registry.get(session)
+        del session
+        assert len(registry) == 0
+
+    def test_stats_report_footprint(self) -> None:
+        registry = SessionRegistry()
+        session = _Session()
+        doc = new_document()
+        doc.add("Zone", "Office")
+        registry.get(session).document = doc
+        (entry,) = registry.stats()
+        assert entry["model_loaded"] is True
+        assert entry["estimated_bytes"] > 0
+
+    def test_summary_hides_sessions(self) -> None:
+        registry = SessionRegistry()
+        a, b = _Session(), _Session()
+        registry.get(a).document = new_document()
+        registry.get(b)
+        summary = registry.summary()
+        assert summary["active_sessions"] == 2
+        assert summary["models_loaded"] == 1
+        assert summary["total_estimated_bytes"] > 0
+        assert f"{id(a):x}" not in str(summary)
+
+    def test_eviction_sized_outside_lock(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        registry = SessionRegistry(max_sessions=1)
+        lock_free: list[bool] = []
+
+        def footprint(state: ServerState) -> int:
+            # The lock is reentrant, so probe it from another thread.
+            def probe() -> None:
+                if registry._lock.acquire(blocking=False):
+                    registry._lock.release()
+                    lock_free.append(True)
+                else:
+                    lock_free.append(False)
+
+            thread = threading.Thread(target=probe)
+            thread.start()
+            thread.join()
+            return 0
+
+        monkeypatch.setattr(ServerState, "memory_footprint", footprint)
+        a, b = _Session(), _Session()
+        with caplog.at_level(logging.INFO, logger="idfkit_mcp.state"):
+            registry.get(a)
+            registry.get(b)
+        assert lock_free == [True]
+        assert "capacity" in caplog.text
+
+    def test_invalid_cap(self) -> None:
+        with pytest.raises(ValueError, match="max_sessions"):
+            SessionRegistry(max_sessions=0)
+
+
+class TestGetState:
+    def test_without_registry_returns_shared_state(self) -> None:
+        session = _Session()
+        token = _in_request(session)
+        try:
+            assert get_state() is get_state()
+        finally:
+            from mcp.server.lowlevel.server import request_ctx
+
+            request_ctx.reset(token)
+
+    @pytest.mark.usefixtures("_per_session")
+    def test_per_session_state(self) -> None:
+        from mcp.server.lowlevel.server import request_ctx
+
+        a, b = _Session(), _Session()
+        token = _in_request(a)
+        try:
+            state_a = get_state()
+            state_a.document = new_document()
+        finally:
+            request_ctx.reset(token)
+        token = _in_request(b)
+        try:
+            assert get_state() is not state_a
+            assert get_state().document is None
+        finally:
+            request_ctx.reset(token)
+
+    @pytest.mark.usefixtures("_per_session")
+    def test_outside_request_uses_shared_state(self) -> None:
+        assert isinstance(get_state(), ServerState)
+        assert get_state() is get_state()
+
+
+class TestEstimateDocumentSize:
+    def test_grows_with_objects(self) -> None:
+        doc = new_document()
+        before = estimate_document_size(doc)
+        for i in range(10):
+            doc.add("Zone", f"Zone{i}")
+        assert estimate_document_size(doc) > before
+
+
+class TestGetSessionInfo:
+    def test_single_state(self) -> None:
+        from idfkit_mcp.server import mcp
+
+        result = mcp._tool_manager._tools["get_session_info"].fn()
+        assert result["per_session_state"] is False
+        assert result["model_loaded"] is False
+
+    @pytest.mark.usefixtures("_per_session")
+    def test_pool(self) -> None:
+        from idfkit_mcp.server import mcp
+
+        result = mcp._tool_manager._tools["get_session_info"].fn()
+        assert result["per_session_state"] is True
+        assert result["pool"]["max_sessions"] == 2
+        assert "sessions" not in result["pool"]
+        assert result["pool"]["active_sessions"] == 0
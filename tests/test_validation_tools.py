@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from idfkit_mcp.state import ServerState
 
 
@@ -30,6 +32,142 @@ class TestValidateModel:
         assert "error" in result
 
 
+def _issues(result: dict) -> list[tuple]:
+    return sorted(
+        (e["object_type"], e["object_name"], e["field"] or "", e["code"]) for e in result["errors"] + result["warnings"]
+    )
+
+
+class TestIncrementalValidation:
+    def test_matches_full_validation(self, state_with_zones: ServerState) -> None:
+        _tool("add_object").fn(
+            object_type="People", name="Crowd", fields={"zone_or_zonelist_or_space_or_spacelist_name": "Lab"}
+        )
+        full = _tool("validate_model").fn()
+        incremental = _tool("validate_model").fn(incremental=True)
+        assert _issues(incremental) == _issues(full)
+        assert incremental["revalidated"] == len(list(state_with_zones.document.all_objects))
+
+        filtered = _tool("validate_model").fn(object_types=["Zone"], incremental=True)
+        assert _issues(filtered) == _issues(_tool("validate_model").fn(object_types=["Zone"]))
+        assert filtered["revalidated"] == 0
+
+    def test_only_changed_objects_are_revalidated(self, state_with_zones: ServerState) -> None:
+        _tool("validate_model").fn(incremental=True)
+        _tool("update_object").fn(object_type="Zone", name="Office", fields={"x_origin": "not a number"})
+        result = _tool("validate_model").fn(incremental=True)
+        assert result["revalidated"] == 1
+        assert _issues(result) == _issues(_tool("validate_model").fn())
+        assert ("Zone", "Office", "x_origin", "E003") in _issues(result)
+
+    def test_references_follow_targets(self, state_with_zones: ServerState) -> None:
+        _tool("validate_model").fn(incremental=True)
+        dangling = ("BuildingSurface:Detailed", "Office_Wall", "zone_name", "E009")
+
+        _tool("remove_object").fn(object_type="Zone", name="Office", force=True)
+        result = _tool("validate_model").fn(incremental=True)
+        assert dangling in _issues(result)
+        assert result["revalidated"] == 1
+
+        _tool("rename_object").fn(object_type="Zone", old_name="Corridor", new_name="Office")
+        assert dangling not in _issues(_tool("validate_model").fn(incremental=True))
+
+        _tool("undo").fn(steps=2)
+        result = _tool("validate_model").fn(incremental=True)
+        assert _issues(result) == _issues(_tool("validate_model").fn())
+        assert dangling not in _issues(result)
+
+
+class TestParallelValidation:
+    def test_matches_full_validation(self, state_with_zones: ServerState, monkeypatch: pytest.MonkeyPatch) -> None:
+        from idfkit_mcp import validation_pool
+
+        # Force the pool even for this small model, with every chunk holding a few objects.
+        monkeypatch.setattr(validation_pool, "_CHUNK_OBJECTS", 3)
+        monkeypatch.setattr(validation_pool, "_MIN_PARALLEL_OBJECTS", 0)
+        _tool("add_object").fn(
+            object_type="People", name="Crowd", fields={"zone_or_zonelist_or_space_or_spacelist_name": "Lab"}
+        )
+        _tool("update_object").fn(object_type="Zone", name="Office", fields={"x_origin": "not a number"})
+        try:
+            full = _tool("validate_model").fn()
+            two = _tool("validate_model").fn(workers=2)
+            three = _tool("validate_model").fn(workers=3)
+        finally:
+            validation_pool.shutdown_pool()
+        # Same issues in the same order, whatever the number of workers.
+        assert full == two == three
+
+    def test_negative_workers(self, state_with_zones: ServerState) -> None:
+        result = _tool("validate_model").fn(workers=-1)
+        assert "error" in result
+
+
+class TestPagedValidation:
+    @pytest.fixture
+    def broken(self, state_with_zones: ServerState) -> ServerState:
+        doc = state_with_zones.document
+        assert doc is not None
+        for i in range(4):
+            doc.add("People", f"Crowd {i}", zone_or_zonelist_or_space_or_spacelist_name=f"Nowhere {i}", validate=False)
+            doc.add("Zone", f"Bad {i}", x_origin="not a number", validate=False)
+        return state_with_zones
+
+    def test_pages_cover_full_result(self, broken: ServerState) -> None:
+        full = _tool("validate_model").fn()
+        seen: list[dict] = []
+        cursor = None
+        while True:
+            page = _tool("validate_model").fn(max_errors=3, cursor=cursor)
+            assert page["returned"] <= 3
+            assert page["error_count"] == full["error_count"]
+            seen += page["errors"] + page["warnings"]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == full["errors"] + full["warnings"]
+
+    def test_severity_and_groups(self, broken: ServerState) -> None:
+        errors_only = _tool("validate_model").fn(severity="error", group_by="code")
+        assert errors_only["warnings"] == []
+        assert sum(g["count"] for g in errors_only["groups"]) == errors_only["error_count"]
+        assert {g["code"] for g in errors_only["groups"]} >= {"E003", "E009"}
+
+        by_type = _tool("validate_model").fn(severity="info", group_by="object_type")
+        assert "info" in by_type
+        assert by_type["groups"][0]["object_type"] == "People"
+        total = by_type["error_count"] + by_type["warning_count"] + by_type["info_count"]
+        assert sum(g["count"] for g in by_type["groups"]) == total
+
+    def test_stop_early(self, broken: ServerState) -> None:
+        first = _tool("validate_model").fn(severity="error", max_errors=2, stop_early=True)
+        assert first["returned"] == 2
+        assert first["complete"] is False
+        assert first["is_valid"] is False
+        second = _tool("validate_model").fn(
+            severity="error", max_errors=2, stop_early=True, cursor=first["next_cursor"]
+        )
+        assert second["errors"][0] != first["errors"][0]
+
+        everything = _tool("validate_model").fn(severity="error", max_errors=1000, stop_early=True)
+        assert "complete" not in everything
+        assert everything["next_cursor"] is None
+        assert _issues(everything) == _issues(_tool("validate_model").fn(severity="error"))
+
+    def test_cursor_checks(self, broken: ServerState) -> None:
+        page = _tool("validate_model").fn(max_errors=2)
+        assert "error" in _tool("validate_model").fn(max_errors=2, cursor=page["next_cursor"], severity="error")
+        _tool("add_object").fn(object_type="Zone", name="Extra")
+        stale = _tool("validate_model").fn(max_errors=2, cursor=page["next_cursor"])
+        assert stale["stale_cursor"] is True
+
+    def test_invalid_options(self, broken: ServerState) -> None:
+        assert "error" in _tool("validate_model").fn(severity="fatal")
+        assert "error" in _tool("validate_model").fn(group_by="field")
+        assert "error" in _tool("validate_model").fn(max_errors=0)
+        assert "error" in _tool("validate_model").fn(stop_early=True)
+
+
 class TestCheckReferences:
     def test_no_dangling(self, state_with_zones: ServerState) -> None:
         result = _tool("check_references").fn()
@@ -40,3 +178,31 @@ class TestCheckReferences:
     def test_without_model(self) -> None:
         result = _tool("check_references").fn()
         assert "error" in result
+
+    def test_follows_edits(self, state_with_zones: ServerState) -> None:
+        doc = state_with_zones.document
+        assert doc is not None
+
+        def dangling() -> list[tuple[str, str, str]]:
+            result = _tool("check_references").fn()
+            assert result["dangling_count"] == len(result["dangling_references"])
+            found = [(r["source_name"], r["field"], r["missing_target"]) for r in result["dangling_references"]]
+            expected = [(obj.name, f, target) for obj, f, target in doc.references.get_dangling_references(set())]
+            names = {obj.name.upper() for obj in doc.all_objects if obj.name}
+            assert sorted(found) == sorted(ref for ref in expected if ref[2] not in names)
+            return found
+
+        wall = ("Office_Wall", "zone_name", "OFFICE")
+        assert wall not in dangling()
+        _tool("remove_object").fn(object_type="Zone", name="Office", force=True)
+        assert wall in dangling()
+        _tool("rename_object").fn(object_type="Zone", old_name="Corridor", new_name="Office")
+        assert wall not in dangling()
+        _tool("update_object").fn(
+            object_type="BuildingSurface:Detailed", name="Office_Wall", fields={"zone_name": "Lab"}
+        )
+        assert ("Office_Wall", "zone_name", "LAB") in dangling()
+        _tool("add_object").fn(object_type="Zone", name="Lab")
+        assert not [ref for ref in dangling() if ref[0] == "Office_Wall" and ref[1] == "zone_name"]
+        _tool("undo").fn(steps=4)
+        assert wall not in dangling()
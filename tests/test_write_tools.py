@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import tempfile
+from pathlib import Path
+from typing import Any
+
+import pytest
 
 from idfkit_mcp.state import ServerState, get_state
 
@@ -76,6 +80,51 @@ class TestBatchAddObjects:
         assert result["errors"] == 1
 
 
+class TestBatchAddAtomic:
+    def _surface(self, name: str, zone: str) -> dict:
+        return {
+            "object_type": "BuildingSurface:Detailed",
+            "name": name,
+            "fields": {
+                "surface_type": "Wall",
+                "construction_name": "Ext_Wall",
+                "zone_name": zone,
+                "outside_boundary_condition": "Outdoors",
+            },
+        }
+
+    def test_forward_references_resolve(self, state_with_model: ServerState) -> None:
+        objects = [self._surface("Wall1", "Office"), {"object_type": "Zone", "name": "Office"}]
+        result = _tool("batch_add_objects").fn(objects=objects, atomic=True)
+        assert result["status"] == "committed"
+        assert result["success"] == 2
+        assert result["unresolved_references"] == ["EXT_WALL"]
+        doc = state_with_model.document
+        assert doc is not None
+        assert [o.name for o in doc.get_referencing("Office")] == ["Wall1"]
+
+    def test_failure_leaves_model_untouched(self, state_with_model: ServerState) -> None:
+        doc = state_with_model.document
+        assert doc is not None
+        _tool("add_object").fn(object_type="Zone", name="Existing")
+        before = sum(len(c) for c in doc.collections.values())
+        objects = [
+            {"object_type": "Zone", "name": "New1"},
+            {"object_type": "Zone", "name": "existing"},
+            {"object_type": "Zone", "name": "New2", "fields": {"bogus_field": 1}},
+            {"object_type": "Zone", "name": "New1"},
+        ]
+        result = _tool("batch_add_objects").fn(objects=objects, atomic=True)
+        assert result["status"] == "rolled_back"
+        assert [r["index"] for r in result["results"]] == [1, 2, 3]
+        assert sum(len(c) for c in doc.collections.values()) == before
+        assert doc["Zone"].get("New1") is None
+
+    def test_singleton_clash(self, state_with_model: ServerState) -> None:
+        result = _tool("batch_add_objects").fn(objects=[{"object_type": "Building", "name": "B2"}], atomic=True)
+        assert result["status"] == "rolled_back"
+
+
 class TestUpdateObject:
     def test_update_fields(self, state_with_model: ServerState) -> None:
         _tool("add_object").fn(object_type="Zone", name="TestZone")
@@ -87,6 +136,124 @@ class TestUpdateObject:
         assert "error" in result
 
 
+class TestBatchUpdateObjects:
+    def test_shared_and_per_entry_fields(self, state_with_zones: ServerState) -> None:
+        result = _tool("batch_update_objects").fn(
+            updates=[
+                {"object_type": "Zone", "name": "Office"},
+                {"object_type": "Zone", "name": "Corridor", "fields": {"x_origin": 3.0}},
+            ],
+            fields={"x_origin": 1.0, "multiplier": 2},
+        )
+        assert result["status"] == "committed"
+        assert result["updated"] == 2
+        zones = state_with_zones.document["Zone"]
+        assert zones["Office"].x_origin == 1.0
+        assert zones["Corridor"].x_origin == 3.0
+        assert zones["Corridor"].multiplier == 2
+
+    def test_invalid_entry_rejects_batch(self, state_with_zones: ServerState) -> None:
+        result = _tool("batch_update_objects").fn(
+            updates=[
+                {"object_type": "Zone", "name": "Office", "fields": {"x_origin": 9.0}},
+                {"object_type": "Zone", "name": "Missing", "fields": {"x_origin": 9.0}},
+                {"object_type": "Zone", "name": "Corridor", "fields": {"colour": "red"}},
+                {"object_type": "Zone", "name": "Corridor", "fields": {"name": "Hall"}},
+            ]
+        )
+        assert result["status"] == "rolled_back"
+        assert [r["index"] for r in result["results"]] == [1, 2, 3]
+        assert state_with_zones.document["Zone"]["Office"].x_origin != 9.0
+
+    def test_failed_update_restores_earlier_objects(
+        self, state_with_zones: ServerState, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import idfkit_mcp.tools.write as write_mod
+
+        zones = state_with_zones.document["Zone"]
+        before = zones["Office"].x_origin
+        apply_fields = write_mod._apply_fields
+
+        def failing(state: Any, obj: Any, fields: dict[str, Any]) -> None:
+            apply_fields(state, obj, fields)
+            if obj.name == "Corridor":
+                msg = "boom"
+                raise RuntimeError(msg)
+
+        monkeypatch.setattr(write_mod, "_apply_fields", failing)
+        result = _tool("batch_update_objects").fn(
+            updates=[{"object_type": "Zone", "name": "Office"}, {"object_type": "Zone", "name": "Corridor"}],
+            fields={"x_origin": 7.0},
+        )
+        assert "error" in result
+        assert zones["Office"].x_origin == before
+        assert zones["Corridor"].x_origin != 7.0
+
+
+class TestBatchRemoveObjects:
+    def test_errors_keep_input_indices(self, state_with_zones: ServerState) -> None:
+        result = _tool("batch_remove_objects").fn(
+            objects=[
+                {"object_type": "Zone", "name": "Missing"},
+                {"object_type": "Zone", "name": "Corridor"},
+                {"object_type": "Zone", "name": "Office"},
+            ]
+        )
+        assert result["status"] == "rolled_back"
+        assert result["total"] == 3
+        assert [(r["index"], "referenced_by" in r) for r in result["results"]] == [(0, False), (2, True)]
+
+    def test_referenced_target_rejects_batch(self, state_with_zones: ServerState) -> None:
+        result = _tool("batch_remove_objects").fn(
+            objects=[{"object_type": "Zone", "name": "Office"}, {"object_type": "Zone", "name": "Corridor"}]
+        )
+        assert result["status"] == "rolled_back"
+        assert result["results"][0]["referenced_by"] == [
+            {"object_type": "BuildingSurface:Detailed", "name": "Office_Wall"}
+        ]
+        assert len(state_with_zones.document["Zone"]) == 2
+
+    def test_references_inside_the_set_do_not_block(self, state_with_zones: ServerState) -> None:
+        result = _tool("batch_remove_objects").fn(
+            objects=[
+                {"object_type": "Zone", "name": "Office"},
+                {"object_type": "BuildingSurface:Detailed", "name": "Office_Wall"},
+            ]
+        )
+        assert result["removed"] == 2
+        assert state_with_zones.document["Zone"].get("Office") is None
+
+    def test_skip_referenced_by_type(self, state_with_zones: ServerState) -> None:
+        result = _tool("batch_remove_objects").fn(object_type="Zone", skip_referenced=True)
+        assert result["removed"] == 1
+        assert result["skipped"] == 1
+        assert [o.name for o in state_with_zones.document["Zone"]] == ["Office"]
+
+    def test_bulk_removal_keeps_survivors_and_references(self, state_with_model: ServerState) -> None:
+        doc = state_with_model.document
+        for i in range(200):
+            doc.add("Zone", f"Zone{i}")
+        doc.add(
+            "BuildingSurface:Detailed",
+            "Wall",
+            surface_type="Wall",
+            construction_name="",
+            zone_name="Zone8",
+            outside_boundary_condition="Outdoors",
+            validate=False,
+        )
+        odd = [{"object_type": "Zone", "name": f"Zone{i}"} for i in range(1, 200, 2)]
+        result = _tool("batch_remove_objects").fn(objects=odd)
+        assert result["status"] == "committed"
+        assert [o.name for o in doc["Zone"]] == [f"Zone{i}" for i in range(0, 200, 2)]
+        assert doc["Zone"].get("Zone7") is None
+        assert doc["Zone"]["Zone8"].name == "Zone8"
+        assert [obj.name for obj in doc.get_referencing("Zone8")] == ["Wall"]
+
+    def test_requires_one_selector(self, state_with_zones: ServerState) -> None:
+        assert "error" in _tool("batch_remove_objects").fn()
+
+
 class TestRemoveObject:
     def test_remove_unreferenced(self, state_with_zones: ServerState) -> None:
         result = _tool("remove_object").fn(object_type="Zone", name="Corridor")
@@ -109,6 +276,74 @@ class TestRenameObject:
         assert result["references_updated"] >= 1
 
 
+class TestBatchRenameObjects:
+    def test_explicit_renames_rewrite_references(self, state_with_zones: ServerState) -> None:
+        result = _tool("batch_rename_objects").fn(
+            renames=[
+                {"object_type": "Zone", "old_name": "Office", "new_name": "ZN_Office"},
+                {"object_type": "Zone", "old_name": "Corridor", "new_name": "ZN_Corridor"},
+            ]
+        )
+        assert result["status"] == "renamed"
+        assert [r["references_updated"] for r in result["results"]] == [1, 0]
+        doc = state_with_zones.document
+        assert doc["BuildingSurface:Detailed"]["Office_Wall"].zone_name == "ZN_Office"
+        assert doc.get_referencing("ZN_Office") == {doc["BuildingSurface:Detailed"]["Office_Wall"]}
+        assert doc.get_referencing("Office") == set()
+
+    def test_swap(self, state_with_zones: ServerState) -> None:
+        result = _tool("batch_rename_objects").fn(
+            renames=[
+                {"object_type": "Zone", "old_name": "Office", "new_name": "Corridor"},
+                {"object_type": "Zone", "old_name": "Corridor", "new_name": "Office"},
+            ]
+        )
+        assert result["status"] == "renamed"
+        doc = state_with_zones.document
+        wall = doc["BuildingSurface:Detailed"]["Office_Wall"]
+        assert wall.zone_name == "Corridor"
+        assert doc.get_referencing("Corridor") == {wall}
+        assert doc.get_referencing("Office") == set()
+        assert [zone.name for zone in doc["Zone"]] == ["Corridor", "Office"]
+        assert doc["Zone"]["Corridor"] is doc["Zone"][0]
+
+    def test_collision_rejects_batch(self, state_with_zones: ServerState) -> None:
+        result = _tool("batch_rename_objects").fn(
+            renames=[
+                {"object_type": "Zone", "old_name": "Office", "new_name": "Lab"},
+                {"object_type": "Zone", "old_name": "Corridor", "new_name": "lab"},
+                {"object_type": "Zone", "old_name": "Missing", "new_name": "Other"},
+            ]
+        )
+        assert result["status"] == "rolled_back"
+        assert [r["old_name"] for r in result["results"]] == ["Missing", "Corridor"]
+        assert state_with_zones.document["Zone"].get("Office") is not None
+
+    def test_existing_name_rejects_batch(self, state_with_zones: ServerState) -> None:
+        result = _tool("batch_rename_objects").fn(
+            renames=[{"object_type": "Zone", "old_name": "Office", "new_name": "CORRIDOR"}]
+        )
+        assert result["status"] == "rolled_back"
+        assert "already has" in result["results"][0]["error"]
+
+    def test_pattern_dry_run_and_apply(self, state_with_zones: ServerState) -> None:
+        rule = {"pattern": "^(.*)$", "replacement": r"ZN_\1", "object_type": "Zone"}
+        preview = _tool("batch_rename_objects").fn(**rule, dry_run=True)
+        assert preview["status"] == "dry_run"
+        assert [r["new_name"] for r in preview["results"]] == ["ZN_Office", "ZN_Corridor"]
+        assert state_with_zones.document["Zone"].get("Office") is not None
+
+        _tool("batch_rename_objects").fn(**rule)
+        assert _tool("get_references").fn(name="ZN_Office")["referenced_by"] == [
+            {"object_type": "BuildingSurface:Detailed", "name": "Office_Wall"}
+        ]
+        found = _tool("search_objects").fn(query="zn_office")["matches"]
+        assert {(m["name"], m["match"]) for m in found} == {("ZN_Office", "name"), ("Office_Wall", "zone_name")}
+
+    def test_invalid_pattern(self, state_with_zones: ServerState) -> None:
+        assert "error" in _tool("batch_rename_objects").fn(pattern="(")
+
+
 class TestDuplicateObject:
     def test_duplicate(self, state_with_zones: ServerState) -> None:
         result = _tool("duplicate_object").fn(object_type="Zone", name="Office", new_name="OfficeClone")
@@ -131,3 +366,252 @@ class TestSaveModel:
     def test_save_no_path(self, state_with_model: ServerState) -> None:
         result = _tool("save_model").fn()
         assert "error" in result
+
+
+class TestIncrementalSave:
+    def _edit(self) -> None:
+        _tool("update_object").fn(object_type="Zone", name="Office", fields={"x_origin": 2.5})
+        _tool("rename_object").fn(object_type="Zone", old_name="Corridor", new_name="Hall")
+        _tool("add_object").fn(object_type="Output:Variable", fields={"variable_name": "Zone Mean Air Temperature"})
+        _tool("rename_object").fn(object_type="Zone", old_name="Office", new_name="Studio")
+
+    def test_matches_idfkit_writers(self, state_with_zones: ServerState, tmp_path: Path) -> None:
+        from idfkit import write_epjson, write_idf
+
+        doc = state_with_zones.document
+        idf_path, epjson_path = tmp_path / "model.idf", tmp_path / "model.epJSON"
+        _tool("save_model").fn(file_path=str(idf_path))
+        _tool("save_model").fn(file_path=str(epjson_path), output_format="epjson")
+        self._edit()
+        _tool("save_model").fn(file_path=str(idf_path))
+        _tool("save_model").fn(file_path=str(epjson_path), output_format="epjson")
+
+        assert idf_path.read_text(encoding="latin-1") == write_idf(doc)
+        assert epjson_path.read_text(encoding="utf-8") == write_epjson(doc)
+        assert "Studio" in idf_path.read_text(encoding="latin-1")
+
+    def test_only_changed_objects_are_serialized(self, state_with_zones: ServerState, tmp_path: Path) -> None:
+        path = tmp_path / "model.idf"
+        first = _tool("save_model").fn(file_path=str(path))
+        assert first["objects_serialized"] > 3
+
+        _tool("rename_object").fn(object_type="Zone", old_name="Office", new_name="Studio")
+        second = _tool("save_model").fn(file_path=str(path))
+        assert second["objects_serialized"] == 2  # the zone and the wall referencing it
+
+        third = _tool("save_model").fn()
+        assert third["unchanged"] is True
+
+    def test_external_change_forces_write(self, state_with_zones: ServerState, tmp_path: Path) -> None:
+        path = tmp_path / "model.idf"
+        _tool("save_model").fn(file_path=str(path))
+        path.write_text("corrupted", encoding="latin-1")
+        assert _tool("save_model").fn(file_path=str(path))["unchanged"] is False
+        assert path.read_text(encoding="latin-1").startswith("!-Generator")
+
+    def test_atomic_write_keeps_mode(self, state_with_zones: ServerState, tmp_path: Path) -> None:
+        path = tmp_path / "model.idf"
+        path.write_text("", encoding="latin-1")
+        path.chmod(0o640)
+        _tool("save_model").fn(file_path=str(path))
+        assert path.stat().st_mode & 0o777 == 0o640
+        assert [p.name for p in tmp_path.iterdir()] == ["model.idf"]
+
+
+class TestCompressedSave:
+    def test_gzip_matches_idfkit_writers(self, state_with_zones: ServerState, tmp_path: Path) -> None:
+        import gzip
+
+        from idfkit import write_epjson, write_idf
+
+        doc = state_with_zones.document
+        idf = _tool("save_model").fn(file_path=str(tmp_path / "model.idf.gz"))
+        epjson = _tool("save_model").fn(file_path=str(tmp_path / "model.epJSON.gz"))
+        assert (idf["format"], idf["compression"]) == ("idf", "gzip")
+        assert (epjson["format"], epjson["compression"]) == ("epjson", "gzip")
+        assert gzip.decompress((tmp_path / "model.idf.gz").read_bytes()).decode("latin-1") == write_idf(doc)
+        assert gzip.decompress((tmp_path / "model.epJSON.gz").read_bytes()).decode("utf-8") == write_epjson(doc)
+
+    def test_round_trip_through_load_model(self, state_with_zones: ServerState, tmp_path: Path) -> None:
+        path = tmp_path / "model.idf.gz"
+        _tool("save_model").fn(file_path=str(path))
+        result = _tool("load_model").fn(file_path=str(path))
+        assert result["zone_count"] == 2
+        assert [p.name for p in tmp_path.iterdir()] == ["model.idf.gz"]
+
+    def test_zstd_without_backend_is_an_error(self, state_with_zones: ServerState, tmp_path: Path) -> None:
+        import importlib.util
+
+        if importlib.util.find_spec("zstandard") or importlib.util.find_spec("compression"):
+            pytest.skip("a Zstandard backend is installed")
+        result = _tool("save_model").fn(file_path=str(tmp_path / "model.idf.zst"))
+        assert "zstandard" in result["error"]
+        assert list(tmp_path.iterdir()) == []
+
+
+def _add_surface(doc, name: str, zone: str, points: list[tuple[float, float, float]]):  # type: ignore[no-untyped-def]
+    vertices = {}
+    for i, (x, y, z) in enumerate(points, 1):
+        vertices.update({f"vertex_{i}_x_coordinate": x, f"vertex_{i}_y_coordinate": y, f"vertex_{i}_z_coordinate": z})
+    return doc.add(
+        "BuildingSurface:Detailed",
+        name,
+        surface_type="Floor",
+        construction_name="",
+        zone_name=zone,
+        outside_boundary_condition="Ground",
+        number_of_vertices=len(points),
+        validate=False,
+        **vertices,
+    )
+
+
+def _points(obj) -> list[tuple[float, float, float]]:  # type: ignore[no-untyped-def]
+    from idfkit.geometry import get_surface_coords
+
+    return get_surface_coords(obj).as_tuple_list()
+
+
+_SQUARE = [(0.0, 0.0, 0.0), (0.0, 2.0, 0.0), (2.0, 2.0, 0.0), (2.0, 0.0, 0.0)]
+
+
+class TestTransformGeometry:
+    def test_rotate_about_anchor(self, state_with_zones: ServerState) -> None:
+        floor = _add_surface(state_with_zones.document, "Office_Floor", "Office", _SQUARE)
+        result = _tool("transform_geometry").fn(rotate=90, anchor=[1, 1, 0])
+        assert (result["surfaces"], result["vertices"]) == (1, 4)
+        assert result["skipped"] == [{"object_type": "BuildingSurface:Detailed", "name": "Office_Wall"}]
+        assert _points(floor) == [(2.0, 0.0, 0.0), (0.0, 0.0, 0.0), (0.0, 2.0, 0.0), (2.0, 2.0, 0.0)]
+
+    def test_translate_and_scale_limited_to_zones(self, state_with_zones: ServerState) -> None:
+        doc = state_with_zones.document
+        office = _add_surface(doc, "Office_Floor", "Office", _SQUARE)
+        corridor = _add_surface(doc, "Corridor_Floor", "Corridor", _SQUARE)
+        _tool("transform_geometry").fn(translate=[10, 0, 1], scale=0.5, zones=["office"])
+        assert _points(office) == [(10.0, 0.0, 1.0), (10.0, 1.0, 1.0), (11.0, 1.0, 1.0), (11.0, 0.0, 1.0)]
+        assert _points(corridor) == _SQUARE
+
+    def test_mirror_reverses_vertex_order(self, state_with_zones: ServerState) -> None:
+        floor = _add_surface(state_with_zones.document, "Office_Floor", "Office", _SQUARE)
+        result = _tool("transform_geometry").fn(mirror="x")
+        assert result["reversed_vertex_order"] is True
+        assert _points(floor) == [(0.0, 0.0, 0.0), (-2.0, 0.0, 0.0), (-2.0, 2.0, 0.0), (0.0, 2.0, 0.0)]
+
+    def test_vertices_list_layout(self, state_with_zones: ServerState) -> None:
+        doc = state_with_zones.document
+        wall = doc["BuildingSurface:Detailed"]["Office_Wall"]
+        wall.vertices = [
+            {"vertex_x_coordinate": x, "vertex_y_coordinate": y, "vertex_z_coordinate": z} for x, y, z in _SQUARE
+        ]
+        _tool("transform_geometry").fn(translate=[0, 0, 3])
+        assert [v["vertex_z_coordinate"] for v in wall.vertices] == [3.0] * 4
+
+    def test_vertex_count_ignores_other_fields(self) -> None:
+        from idfkit_mcp.geometry import vertex_count
+
+        numbered = {f"vertex_{n}_{axis}_coordinate": 0.0 for n in (1, 2, 3) for axis in "xyz"}
+        assert vertex_count({**numbered, "number_of_vertices": 3, "zone_name": "Office"}) == 3
+        parsed = {f"vertex_{axis}_coordinate{suffix}": 0.0 for suffix in ("", "_2") for axis in "xyz"}
+        assert vertex_count({**parsed, "view_factor_to_ground": 0.5}) == 2
+        assert vertex_count({"vertices": [{}, {}, {}, {}]}) == 4
+
+    def test_undo_restores_vertices(self, state_with_zones: ServerState) -> None:
+        floor = _add_surface(state_with_zones.document, "Office_Floor", "Office", _SQUARE)
+        _tool("transform_geometry").fn(rotate=45, scale=[2, 1, 1])
+        _tool("undo").fn()
+        assert _points(floor) == _SQUARE
+
+    def test_invalid_arguments(self, state_with_zones: ServerState) -> None:
+        assert "Zone(s) not found: Lab" in _tool("transform_geometry").fn(rotate=10, zones=["Lab"])["error"]
+        assert "error" in _tool("transform_geometry").fn(scale=0)
+        assert "error" in _tool("transform_geometry").fn(translate=[1, 2])
+        assert "error" in _tool("transform_geometry").fn(mirror="w")
+
+
+class TestReplicateZone:
+    def _zone(self, state: ServerState) -> None:
+        doc = state.document
+        doc.add("Schedule:Constant", "Always On", schedule_type_limits_name="", hourly_value=1, validate=False)
+        _add_surface(doc, "Office Floor", "Office", _SQUARE)
+        doc["BuildingSurface:Detailed"]["Office_Wall"].outside_boundary_condition = "Surface"
+        doc.add(
+            "BuildingSurface:Detailed",
+            "Corridor Wall",
+            surface_type="Wall",
+            construction_name="",
+            zone_name="Corridor",
+            outside_boundary_condition="Surface",
+            outside_boundary_condition_object="Office_Wall",
+            validate=False,
+        )
+        doc.add(
+            "People",
+            "Office People",
+            zone_or_zonelist_or_space_or_spacelist_name="Office",
+            number_of_people_schedule_name="Always On",
+            number_of_people_calculation_method="People",
+            number_of_people=3,
+            validate=False,
+        )
+        doc.add(
+            "ZoneHVAC:EquipmentConnections",
+            "",
+            zone_name="Office",
+            zone_conditioning_equipment_list_name="Office Equipment",
+            zone_air_node_name="Office Air Node",
+            validate=False,
+        )
+        doc.add(
+            "ZoneHVAC:EquipmentList",
+            "Office Equipment",
+            zone_equipment_1_object_type="ZoneHVAC:IdealLoadsAirSystem",
+            zone_equipment_1_name="Office Ideal Loads",
+            validate=False,
+        )
+        doc.add("ZoneHVAC:IdealLoadsAirSystem", "Office Ideal Loads", validate=False)
+
+    def test_copies_zone_objects(self, state_with_zones: ServerState) -> None:
+        self._zone(state_with_zones)
+        doc = state_with_zones.document
+        result = _tool("replicate_zone").fn(zone="Office", count=2, offset=[0, 10, 0])
+        assert result["status"] == "replicated"
+        assert result["zones"] == ["Office 1", "Office 2"]
+        assert result["objects_per_zone"] == 7
+        assert result["objects_added"] == 14
+        assert [obj.name for obj in doc["BuildingSurface:Detailed"] if obj.zone_name == "Corridor"] == ["Corridor Wall"]
+
+        people = doc["People"]["Office 2 People"]
+        assert people.zone_or_zonelist_or_space_or_spacelist_name == "Office 2"
+        assert people.number_of_people_schedule_name == "Always On"
+        connections = [obj for obj in doc["ZoneHVAC:EquipmentConnections"] if obj.zone_name == "Office 2"]
+        assert connections[0].zone_air_node_name == "Office 2 Air Node"
+        assert doc["ZoneHVAC:EquipmentList"]["Office 2 Equipment"].zone_equipment_1_name == "Office 2 Ideal Loads"
+        assert doc["BuildingSurface:Detailed"]["Office 2_Wall"].zone_name == "Office 2"
+        assert _points(doc["BuildingSurface:Detailed"]["Office 2 Floor"])[2] == (2.0, 22.0, 0.0)
+        assert _tool("check_references").fn()["dangling_count"] == 0
+
+    def test_conflicts_add_nothing(self, state_with_zones: ServerState) -> None:
+        self._zone(state_with_zones)
+        _tool("add_object").fn(object_type="Zone", name="Office 2")
+        result = _tool("replicate_zone").fn(zone="Office", count=2)
+        assert result["conflicts"][0] == {"object_type": "Zone", "name": "Office 2"}
+        assert "Office 1" not in [zone.name for zone in state_with_zones.document["Zone"]]
+
+    def test_dry_run_and_undo(self, state_with_zones: ServerState) -> None:
+        self._zone(state_with_zones)
+        doc = state_with_zones.document
+        total = len(list(doc.all_objects))
+        result = _tool("replicate_zone").fn(
+            zone="Office", count=3, name_pattern="Floor {n} {zone}", start=2, dry_run=True
+        )
+        assert result["zones"] == ["Floor 2 Office", "Floor 3 Office", "Floor 4 Office"]
+        assert len(list(doc.all_objects)) == total
+
+        _tool("replicate_zone").fn(zone="Office", count=3)
+        _tool("undo").fn()
+        assert len(list(doc.all_objects)) == total
+
+    def test_invalid_arguments(self, state_with_zones: ServerState) -> None:
+        assert "not found" in _tool("replicate_zone").fn(zone="Lab", count=1)["error"]
+        assert "at least 1" in _tool("replicate_zone").fn(zone="Office", count=0)["error"]
+        assert "name_pattern" in _tool("replicate_zone").fn(zone="Office", count=1, name_pattern="{floor}")["error"]